@@ -0,0 +1,179 @@
+import csv
+import json
+import mmap
+import os
+import struct
+from abc import abstractmethod
+
+from main import Printer, Product
+
+
+# --- O: Open/Closed Principle ---
+# New output formats are added as new Printer subclasses; Product and the
+# existing printers stay untouched.
+# Streaming printers write to a file or buffer one record at a time, so a
+# whole catalog can be exported without building the output in memory.
+class StreamingProductPrinter(Printer):
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def print_product(self, product: Product):
+        self.write_product(product)
+        self.count += 1
+
+    def print_products(self, products):
+        for product in products:
+            self.write_product(product)
+            self.count += 1
+        return self.count
+
+    @abstractmethod
+    def write_product(self, product: Product):
+        pass
+
+    def flush(self):
+        self.stream.flush()
+
+
+# NDJSON printer — one compact JSON object per line.
+class NDJSONProductPrinter(StreamingProductPrinter):
+    def write_product(self, product: Product):
+        self.stream.write(json.dumps({"name": product.get_name(), "price": product.get_price()},
+                                     separators=(",", ":")))
+        self.stream.write("\n")
+
+
+# CSV printer — a header row followed by one row per product.
+# Open the stream with newline="" as the csv module expects.
+class CSVProductPrinter(StreamingProductPrinter):
+    def __init__(self, stream, header=True):
+        super().__init__(stream)
+        self.writer = csv.writer(stream)
+        if header:
+            self.writer.writerow(["name", "price"])
+
+    def write_product(self, product: Product):
+        self.writer.writerow([product.get_name(), product.get_price()])
+
+
+# Binary record format:
+#   file header: MAGIC
+#   record:      uint32 length | int64 price in cents | name (UTF-8)
+# where length counts the price field and the name bytes. The price field is
+# fixed-width, so a reader can skip or index records without decoding names.
+MAGIC = b"PRD1"
+_LENGTH = struct.Struct("<I")
+_PRICE = struct.Struct("<q")
+
+
+class BinaryProductPrinter(StreamingProductPrinter):
+    def __init__(self, stream):
+        super().__init__(stream)
+        stream.write(MAGIC)
+
+    def write_product(self, product: Product):
+        name = product.get_name().encode("utf-8")
+        cents = round(product.get_price() * 100)
+        self.stream.write(_LENGTH.pack(_PRICE.size + len(name)) + _PRICE.pack(cents) + name)
+
+
+# Reads the binary format back lazily, one Product at a time.
+# Works over any binary stream, or over an mmap of a file via from_file(..., use_mmap=True).
+# An empty file holds no products; short or truncated records raise ValueError.
+class BinaryProductReader:
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    @classmethod
+    def from_file(cls, path, use_mmap=False):
+        f = open(path, "rb")
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            # An empty file cannot be mapped; read it as an (empty) stream.
+            return cls(f)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        f.close()
+        return cls(mapped)
+
+    def __iter__(self):
+        if isinstance(self.buffer, mmap.mmap):
+            yield from self._iter_mapped(self.buffer)
+        else:
+            yield from self._iter_stream(self.buffer)
+
+    @staticmethod
+    def _iter_stream(stream):
+        magic = stream.read(len(MAGIC))
+        if not magic:
+            return
+        if magic != MAGIC:
+            raise ValueError("Not a binary product file.")
+        while True:
+            header = stream.read(_LENGTH.size)
+            if not header:
+                return
+            if len(header) < _LENGTH.size:
+                raise ValueError("Truncated record header.")
+            (length,) = _LENGTH.unpack(header)
+            if length < _PRICE.size:
+                raise ValueError("Record too short.")
+            record = stream.read(length)
+            if len(record) < length:
+                raise ValueError("Truncated record.")
+            (cents,) = _PRICE.unpack_from(record)
+            yield Product(record[_PRICE.size:].decode("utf-8"), cents / 100)
+
+    @staticmethod
+    def _iter_mapped(mapped):
+        view = memoryview(mapped)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a binary product file.")
+        offset = len(MAGIC)
+        end = len(view)
+        try:
+            while offset < end:
+                if end - offset < _LENGTH.size:
+                    raise ValueError("Truncated record header.")
+                (length,) = _LENGTH.unpack_from(view, offset)
+                offset += _LENGTH.size
+                if length < _PRICE.size:
+                    raise ValueError("Record too short.")
+                if end - offset < length:
+                    raise ValueError("Truncated record.")
+                (cents,) = _PRICE.unpack_from(view, offset)
+                name = str(view[offset + _PRICE.size:offset + length], "utf-8")
+                offset += length
+                yield Product(name, cents / 100)
+        finally:
+            view.release()
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Main Program ---
+if __name__ == "__main__":
+    import io
+    import sys
+
+    products = [Product("Smartphone", 5000), Product("Laptop", 15000)]
+
+    print("--- NDJSON ---")
+    NDJSONProductPrinter(sys.stdout).print_products(products)
+
+    print("\n--- CSV ---")
+    CSVProductPrinter(sys.stdout).print_products(products)
+
+    print("\n--- Binary (round trip) ---")
+    buffer = io.BytesIO()
+    BinaryProductPrinter(buffer).print_products(products)
+    print(f"{len(buffer.getvalue())} bytes")
+    buffer.seek(0)
+    for product in BinaryProductReader(buffer):
+        print(f"Product: {product.get_name()}, Price: {product.get_price()} MDL")
@@ -1,36 +1,42 @@
 from domain.models.product import ProductBuilder
 from domain.models.shopping_cart import ShoppingCart
 from domain.factory.order_factory import OrderFactory
+from client.events import ConsoleEventSink, Event
+
+def _render_cart(items, total):
+    lines = ["Shopping Cart Items:"]
+    lines.extend(str(item) for item in items)
+    lines.append(f"Total Price: ${total:.2f}")
+    return "\n".join(lines)
 
 class ShoppingCartClient:
-    def __init__(self):
+    def __init__(self, events=None):
         self.cart = ShoppingCart()
+        self.events = events if events is not None else ConsoleEventSink()
 
     def add_product(self, name, price, date=None, description=None):
         product = ProductBuilder().set_name(name).set_price(price).set_description(description).set_date(date).build()
         self.cart.add_item(product)
-        print(f"Added {product} to the cart.")
+        self.events.emit(Event('product_added', "Added {} to the cart.", product))
 
     def remove_product(self, product):
-        if product in self.cart.view_cart():
+        if self.cart.contains(product):
             self.cart.remove_item(product)
-            print(f"Removed {product} from the cart.")
+            self.events.emit(Event('product_removed', "Removed {} from the cart.", product))
         else:
-            print(f"{product} not found in the cart.")
+            self.events.emit(Event('product_not_found', "{} not found in the cart.", product))
 
     def view_cart(self):
-        print("Shopping Cart Items:")
-        for item in self.cart.view_cart():
-            print(item)
-        print(f"Total Price: ${self.cart.total_price():.2f}")
+        if self.events.enabled:
+            self.events.emit(Event('cart_viewed', _render_cart, self.cart.view_cart(), self.cart.total_price()))
 
     def create_order(self):
-        if not self.cart.view_cart():
-            print("Cart is empty! Cannot create an order.")
+        if not len(self.cart):
+            self.events.emit(Event('order_rejected', "Cart is empty! Cannot create an order."))
             return
         order = OrderFactory.create_order(self.cart.view_cart())
-        print(order)
+        self.events.emit(Event('order_created', "{}", order))
 
     def clear_cart(self):
         self.cart.clear_cart()
-        print("Shopping cart cleared.")
\ No newline at end of file
+        self.events.emit(Event('cart_cleared', "Shopping cart cleared."))
\ No newline at end of file
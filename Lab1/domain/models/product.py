@@ -1,4 +1,21 @@
 import datetime
+from functools import lru_cache
+from numbers import Real
+
+DATE_FORMAT = "%d/%m/%Y"
+
+# Memoized so a date repeated across many rows is parsed only once.
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    return datetime.datetime.strptime(value, DATE_FORMAT).strftime(DATE_FORMAT)
+
+class ProductBuildError(ValueError):
+    def __init__(self, errors, products):
+        self.errors = errors      # [(row index, field, message), ...]
+        self.products = products  # products built from the valid rows
+        shown = "; ".join(f"row {i} {field}: {message}" for i, field, message in errors[:5])
+        more = f" (+{len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} invalid product rows: {shown}{more}")
 
 class Product:
     def __init__(self, name, price, date: str, description=None):
@@ -33,6 +50,46 @@ class ProductBuilder:
         self.date = str(date)
         return self
 
+    # Builds every row of a dict of columns ("name", "price", optional
+    # "description" and "date") and reports all bad rows at once.
+    @staticmethod
+    def build_many(columns):
+        names = columns['name']
+        prices = columns['price']
+        count = len(names)
+        # Columns may be numpy arrays, whose truth value is ambiguous.
+        descriptions = columns.get('description')
+        if descriptions is None:
+            descriptions = [None] * count
+        dates = columns.get('date')
+        if dates is None:
+            dates = [None] * count
+        if not len(prices) == len(descriptions) == len(dates) == count:
+            raise ValueError("All columns must have the same number of rows.")
+
+        errors = []
+        products = []
+        for i in range(count):
+            row_errors = []
+            if not names[i]:
+                row_errors.append((i, 'name', "name is required"))
+            price = prices[i]
+            if price is None or isinstance(price, bool) or not isinstance(price, Real):
+                row_errors.append((i, 'price', "price is required and must be a number"))
+            date = dates[i]
+            if date is not None:
+                try:
+                    date = parse_date(str(date))
+                except ValueError:
+                    row_errors.append((i, 'date', f"invalid date {date!r}, expected dd/mm/yyyy"))
+            if row_errors:
+                errors.extend(row_errors)
+            else:
+                products.append(Product(names[i], price, date, descriptions[i]))
+        if errors:
+            raise ProductBuildError(errors, products)
+        return products
+
     def build(self):
         if not self.name or self.price is None:
             raise ValueError("Product must have a name and price.")
@@ -1,23 +1,65 @@
+import math
+
+
 class ShoppingCart:
     _instance = None
     #
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.items = []
+            cls._instance._next_line_id = 0
+            cls._instance._reset()
         return cls._instance
 
+    def _reset(self):
+        # Lines are keyed by a stable id so removal and lookups are O(1).
+        # The total is summed from the live prices, so it follows price
+        # changes made after a product was added.
+        self._lines = {}          # line id -> product, in insertion order
+        self._product_lines = {}  # product -> {line id: None}, oldest first
+
+    @property
+    def items(self):
+        return list(self._lines.values())
+
     def add_item(self, product):
-        self.items.append(product)
+        line_id = self._next_line_id
+        self._next_line_id += 1
+        self._lines[line_id] = product
+        self._product_lines.setdefault(product, {})[line_id] = None
+        return line_id
 
     def remove_item(self, product):
-        self.items.remove(product)
+        line_ids = self._product_lines.get(product)
+        if not line_ids:
+            raise ValueError("ShoppingCart.remove_item(x): x not in cart")
+        self.remove_line(next(iter(line_ids)))
+
+    def remove_line(self, line_id):
+        product = self._lines.pop(line_id)
+        line_ids = self._product_lines[product]
+        del line_ids[line_id]
+        if not line_ids:
+            del self._product_lines[product]
+        return product
+
+    def contains(self, product):
+        return product in self._product_lines
+
+    def __contains__(self, product):
+        return product in self._product_lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    def quantity(self, product):
+        return len(self._product_lines.get(product, ()))
 
     def view_cart(self):
         return self.items
 
     def clear_cart(self):
-        self.items = []
+        self._reset()
 
     def total_price(self):
-        return sum(item.price for item in self.items)
\ No newline at end of file
+        return math.fsum(product.price for product in self._lines.values())
@@ -0,0 +1,79 @@
+"""
+Benchmark for the indexed ShoppingCart.
+
+Compares add / remove / total against the old list-based cart at 10k and
+100k lines. Run from the Lab2 directory:
+
+    python -m benchmarks.cart_benchmark
+"""
+import time
+
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+
+
+class ListShoppingCart:
+    """The previous list-based cart, kept here as the baseline."""
+
+    def __init__(self):
+        self.items = []
+
+    def add_item(self, product):
+        self.items.append(product)
+
+    def remove_item(self, product):
+        self.items.remove(product)
+
+    def total_price(self):
+        return sum(item.price for item in self.items)
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(cart, products, total_calls=100):
+    """Return (add, total, remove) timings in seconds for one cart."""
+    def add_all():
+        for product in products:
+            cart.add_item(product)
+
+    def total_many():
+        for _ in range(total_calls):
+            cart.total_price()
+
+    # Remove from the middle outwards, the worst case for a list.
+    removals = products[len(products) // 2:] + products[:len(products) // 2]
+
+    def remove_all():
+        for product in removals:
+            cart.remove_item(product)
+
+    return _time(add_all), _time(total_many), _time(remove_all)
+
+
+def main(sizes=(10_000, 100_000)):
+    print(f"{'cart':<10}{'lines':>10}{'add':>13}{'100x total':>13}{'remove':>13}")
+    for size in sizes:
+        products = [Product(f"Item {i}", i % 100 + 0.99) for i in range(size)]
+
+        indexed = ShoppingCart()
+        indexed.clear_cart()
+        timings = run(indexed, products)
+        print(f"{'indexed':<10}{size:>10}" + "".join(f"{t:>12.4f}s" for t in timings))
+
+        # The list cart is quadratic on removal, so only time it on a
+        # sample at large sizes and extrapolate.
+        sample = products if size <= 10_000 else products[:10_000]
+        add_t, total_t, remove_t = run(ListShoppingCart(), sample)
+        scale = size / len(sample)
+        timings = (add_t * scale, total_t * scale, remove_t * scale * scale)
+        label = "list" if sample is products else "list*"
+        print(f"{label:<10}{size:>10}" + "".join(f"{t:>12.4f}s" for t in timings))
+    print("\n* extrapolated from a 10k-line sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Cost of reading `price` through stacked discount decorators.
+
+Compares a raw Product, an N-deep DiscountedProductDecorator chain and the
+same chain flattened with compile(). Run from the Lab2 directory:
+
+    python -m benchmarks.decorator_benchmark
+"""
+import timeit
+
+from domain.models.product import Product
+from patterns.decorator.product_decorator import DiscountedProductDecorator
+
+READS = 1_000_000
+
+
+def main(depths=(1, 5, 20)):
+    product = Product("Headphones", 199.99)
+    raw = timeit.timeit(lambda: product.price, number=READS)
+    print(f"{'layers':>8}{'raw':>12}{'chain':>12}{'compiled':>12}   (ns per read)")
+    for depth in depths:
+        chain = product
+        for _ in range(depth):
+            chain = DiscountedProductDecorator(chain, 0.05)
+        compiled = chain.compile()
+        assert compiled.price == chain.price
+        chained = timeit.timeit(lambda: chain.price, number=READS)
+        flat = timeit.timeit(lambda: compiled.price, number=READS)
+        print(f"{depth:>8}" + "".join(f"{t / READS * 1e9:>12.1f}" for t in (raw, chained, flat)))
+
+
+if __name__ == "__main__":
+    main()
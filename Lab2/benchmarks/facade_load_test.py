@@ -0,0 +1,88 @@
+"""
+Load test for AsyncShoppingFacade.
+
+Drives many concurrent simulated sessions against a local stand-in backend
+(catalog lookups and order saves that sleep to mimic I/O) and reports
+p50/p99 latency per operation. Run from the Lab2 directory:
+
+    python -m benchmarks.facade_load_test [sessions]
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from domain.models.product import Product
+from patterns.facade.async_shopping_facade import AsyncShoppingFacade
+
+
+class LocalBackend:
+    """In-process stand-in for the catalog and order store."""
+
+    def __init__(self, catalog_size=10_000, latency=0.001):
+        self.latency = latency
+        self._catalog = {i: Product(f"Product {i}", 10 + i % 90, "Catalog item") for i in range(catalog_size)}
+        self._lock = threading.Lock()
+        self.orders = 0
+
+    def load_product(self, product_id):
+        time.sleep(self.latency)
+        return self._catalog[product_id]
+
+    def save_order(self, order):
+        time.sleep(self.latency)
+        with self._lock:
+            self.orders += 1
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_session(backend, executor, rng, latencies):
+    facade = AsyncShoppingFacade(backend=backend, executor=executor)
+
+    async def timed(op, coro):
+        start = time.perf_counter()
+        result = await coro
+        latencies.setdefault(op, []).append(time.perf_counter() - start)
+        return result
+
+    for _ in range(rng.randint(1, 4)):
+        await timed("add_catalog_product", facade.add_catalog_product(rng.randrange(len(backend._catalog))))
+    await timed("add_product", facade.add_product("Gaming Mouse", 79.99, "RGB gaming mouse"))
+    await timed("add_external_product", facade.add_external_product(
+        {"title": "Monitor", "cost": 399.99, "info": "27-inch 4K monitor", "date": "15/11/2024"}))
+    await timed("add_discounted_product", facade.add_discounted_product("Keyboard", 149.99, 15))
+    await timed("view_cart", facade.view_cart())
+    await timed("create_order", facade.create_order("express"))
+
+
+async def main_async(sessions, workers, latency, seed):
+    backend = LocalBackend(latency=latency)
+    rng = random.Random(seed)
+    latencies = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        await asyncio.gather(*(run_session(backend, executor, rng, latencies) for _ in range(sessions)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{sessions:,} sessions, {backend.orders:,} orders in {elapsed:.2f}s "
+          f"({backend.orders / elapsed:,.0f} orders/sec, backend latency {latency * 1000:.1f} ms)")
+    print(f"{'operation':<24}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for op, values in latencies.items():
+        values.sort()
+        print(f"{op:<24}{len(values):>8}{percentile(values, 50) * 1000:>10.2f}{percentile(values, 99) * 1000:>10.2f}")
+
+
+def main(sessions=10_000, workers=64, latency=0.001, seed=42):
+    asyncio.run(main_async(sessions, workers, latency, seed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
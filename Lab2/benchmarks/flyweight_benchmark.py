@@ -0,0 +1,61 @@
+"""
+Memory saved by interning product data across many carts.
+
+Simulates carts filled from parsed input, where every product gets fresh
+copies of the same names, descriptions and dates, and compares plain
+Products with SharedProducts from a ProductInterner. Run from the Lab2
+directory:
+
+    python -m benchmarks.flyweight_benchmark [carts] [lines_per_cart]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from domain.models.product import Product
+from domain.models.product_flyweight import ProductInterner
+
+DESCRIPTION = "Noise-canceling over-ear headphones with 30h battery life and USB-C fast charging."
+
+
+def _records(carts, lines):
+    # JSON round-trips give each record its own string objects, like a feed would.
+    catalog = [{"name": f"Product {i}", "price": 10.0 + i, "description": f"{DESCRIPTION} #{i}",
+                "date": "05/11/2024"} for i in range(200)]
+    for cart in range(carts):
+        for line in range(lines):
+            yield json.loads(json.dumps(catalog[(cart * 7 + line) % len(catalog)]))
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main(carts=50_000, lines=5):
+    def plain():
+        return [Product(r["name"], r["price"], r["description"], r["date"]) for r in _records(carts, lines)]
+
+    interner = ProductInterner()
+
+    def shared():
+        return [interner.make_product(r["name"], r["price"], r["description"], r["date"])
+                for r in _records(carts, lines)]
+
+    products, plain_bytes = _measure(plain)
+    del products
+    products, shared_bytes = _measure(shared)
+    count = carts * lines
+    print(f"{carts:,} carts x {lines} lines = {count:,} products")
+    print(f"{'plain Product':<18}{plain_bytes / 2**20:>10.1f} MiB{plain_bytes / count:>10.0f} B/product")
+    print(f"{'SharedProduct':<18}{shared_bytes / 2**20:>10.1f} MiB{shared_bytes / count:>10.0f} B/product")
+    print(f"interner: {interner.stats()}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
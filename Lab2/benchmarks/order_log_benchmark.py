@@ -0,0 +1,58 @@
+"""
+Orders/sec of the durable OrderLog at each durability level.
+
+Many threads check out concurrently so group commit can share fsyncs; the
+"groups" column shows how many write/fsync rounds were needed. Run from the
+Lab2 directory:
+
+    python -m benchmarks.order_log_benchmark [orders] [threads]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from domain.models.order import Order
+from domain.models.product import Product
+from domain.persistence.order_log import DURABILITY_LEVELS, OrderLog
+
+
+def run(durability, orders, threads, directory):
+    path = os.path.join(directory, f"orders-{durability}.log")
+    products = [Product("Laptop", 999.99, "A powerful laptop", "27/10/2024"),
+                Product("Mouse", 25.99, "A wireless mouse")]
+    order = Order(products, "express")
+    per_thread = orders // threads
+
+    log = OrderLog(path, durability=durability)
+
+    def worker():
+        for _ in range(per_thread):
+            log.append(order)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    log.close()
+    elapsed = time.perf_counter() - start
+
+    replayed = sum(1 for _ in OrderLog(path, durability="none").replay())
+    return per_thread * threads / elapsed, log.groups, replayed
+
+
+def main(orders=20_000, threads=32):
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{orders:,} orders from {threads} threads")
+        print(f"{'durability':<12}{'orders/sec':>14}{'groups':>10}{'replayed':>10}")
+        for durability in DURABILITY_LEVELS:
+            rate, groups, replayed = run(durability, orders, threads, directory)
+            print(f"{durability:<12}{rate:>14,.0f}{groups:>10}{replayed:>10}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,80 @@
+"""
+Memory and pricing benchmark for the columnar ProductStore.
+
+Builds the same catalog as a list of Product objects and as a ProductStore,
+then compares memory per product (via tracemalloc), total, filtered
+subtotal and a bulk price update. Run from the Lab2 directory:
+
+    python -m benchmarks.product_store_benchmark [rows]
+"""
+import sys
+import time
+import tracemalloc
+
+from domain.models.product import Product
+from domain.models.product_store import ProductStore
+
+DESCRIPTIONS = ["Standard catalog item.", "Refurbished, 12 month warranty.", None]
+DATES = ["01/11/2024", "15/11/2024", "27/10/2024"]
+
+
+def _measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(rows=1_000_000):
+    # Names are built up front so both layouts share the same string objects
+    # and the comparison is about per-row overhead. Prices are created inside
+    # each build, as they would be when parsed from a feed.
+    names = [f"SKU-{i % 50_000}" for i in range(rows)]
+    descriptions = [DESCRIPTIONS[i % 3] for i in range(rows)]
+    dates = [DATES[i % 3] for i in range(rows)]
+
+    def build_objects():
+        return [Product(names[i], (i % 1000) + 0.99, descriptions[i], dates[i]) for i in range(rows)]
+
+    def build_store():
+        store = ProductStore(capacity=rows)
+        store.extend(names, [(i % 1000) + 0.99 for i in range(rows)], descriptions, dates)
+        return store
+
+    objects, objects_bytes, objects_build = _measure(build_objects)
+    store, store_bytes, store_build = _measure(build_store)
+
+    print(f"rows: {rows:,}")
+    print(f"{'':<22}{'Product list':>16}{'ProductStore':>16}")
+    print(f"{'build':<22}{objects_build:>15.3f}s{store_build:>15.3f}s")
+    print(f"{'bytes per product':<22}{objects_bytes / rows:>16.1f}{store_bytes / rows:>16.1f}")
+
+    total_a, t_a = _time(lambda: sum(p.price for p in objects))
+    total_b, t_b = _time(store.total)
+    print(f"{'total':<22}{t_a:>15.4f}s{t_b:>15.4f}s")
+    assert abs(total_a - total_b) < 1e-6 * abs(total_a)
+
+    _, t_a = _time(lambda: sum(p.price for p in objects if 100 <= p.price <= 500))
+    _, t_b = _time(lambda: store.subtotal(100, 500))
+    print(f"{'subtotal 100..500':<22}{t_a:>15.4f}s{t_b:>15.4f}s")
+
+    def discount_objects():
+        for p in objects:
+            p.price *= 0.9
+
+    _, t_a = _time(discount_objects)
+    _, t_b = _time(lambda: store.scale_prices(0.9))
+    print(f"{'10% price cut':<22}{t_a:>15.4f}s{t_b:>15.4f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
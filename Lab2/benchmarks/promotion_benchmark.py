@@ -0,0 +1,67 @@
+"""
+Incremental vs full re-pricing of a large cart under promotion rules.
+
+Run from the Lab2 directory:
+
+    python -m benchmarks.promotion_benchmark [lines]
+"""
+import sys
+import time
+
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from domain.promotions.promotion_engine import BuyNGetM, CartThreshold, PercentOffCategory, PromotionEngine
+
+CATEGORIES = ("audio", "peripherals", "displays", "storage")
+
+
+def make_product(i):
+    return Product(f"Item {i % 500}", 10.0 + i % 90)
+
+
+def category_of(product):
+    # Products carry no category; derive a stable one from the item number.
+    return CATEGORIES[int(product.name.split()[1]) % len(CATEGORIES)]
+
+
+def rules():
+    return [
+        PercentOffCategory("audio", 10, priority=2),
+        PercentOffCategory("displays", 5, priority=2),
+        BuyNGetM("Item 7", 2, 1, priority=3),
+        CartThreshold(1000, percent=5, priority=1),
+    ]
+
+
+def main(lines=10_000, changes=1_000):
+    cart = ShoppingCart.new_instance()
+    for i in range(lines):
+        cart.add_item(make_product(i))
+    engine = PromotionEngine.attach(cart, rules(), category_of)
+    extra = [make_product(lines + i) for i in range(changes)]
+
+    start = time.perf_counter()
+    for product in extra:
+        line_id = cart.add_item(product)
+        engine.pricing()
+        cart.remove_line(line_id)
+        engine.pricing()
+    incremental = (time.perf_counter() - start) / (2 * changes)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        full = PromotionEngine(rules(), category_of)
+        for line_id, product in cart.lines():
+            full.item_added(line_id, product)
+        full.pricing()
+    recompute = (time.perf_counter() - start) / 10
+
+    assert abs(full.total() - engine.total()) < 1e-6
+    print(f"{lines:,}-line cart, {len(rules())} rules")
+    print(f"  incremental re-price after one change: {incremental * 1e6:10.1f} us")
+    print(f"  full recompute:                        {recompute * 1e6:10.1f} us")
+    print(f"  pricing: {engine.pricing()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,159 @@
+"""
+Benchmark suite for the Lab2 structural pattern layers.
+
+Measures the per-access cost of reading a price through Product,
+DiscountedProductDecorator, ProductProxy and ExternalProductAdapter, the
+per-line cost of totalling an Order made of each, and the full
+ShoppingFacade flow (add, view, checkout) for cart sizes from 10 to 1M
+lines. Results are written as a JSON baseline; --compare flags any
+benchmark that got slower than the baseline by more than --threshold.
+
+Run from the Lab2 directory:
+
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+from client.events import NullEventSink
+from domain.models.order import Order
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from patterns.adapter.external_product_adapter import ExternalProductAdapter
+from patterns.decorator.product_decorator import DiscountedProductDecorator
+from patterns.facade.shopping_facade import ShoppingFacade
+from patterns.proxy.product_proxy import ProductProxy
+
+EXTERNAL = {"title": "Monitor", "cost": 399.99, "info": "27-inch 4K monitor", "date": "15/11/2024"}
+CART_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _layers():
+    return {
+        "product": lambda: Product("Headphones", 199.99, "Noise-canceling headphones", "05/11/2024"),
+        "decorator": lambda: DiscountedProductDecorator(Product("Headphones", 199.99), 0.20),
+        "proxy": lambda: ProductProxy(Product("Headphones", 199.99)),
+        "adapter": lambda: ExternalProductAdapter(EXTERNAL).to_product(),
+    }
+
+
+def _per_call(stmt, number, repeat):
+    """Best-of-`repeat` seconds per call."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def bench_access(repeat):
+    results = {}
+    for layer, make in _layers().items():
+        product = make()
+        results[f"access.{layer}.price"] = _per_call(lambda: product.price, 200_000, repeat)
+    results["access.adapter.to_product"] = _per_call(
+        lambda: ExternalProductAdapter(EXTERNAL).to_product(), 50_000, repeat)
+    return results
+
+
+def bench_totals(repeat, lines=10_000):
+    results = {}
+    for layer, make in _layers().items():
+        items = [make() for _ in range(lines)]
+        results[f"total.{layer}.per_line"] = _per_call(lambda: Order(items), 10, repeat) / lines
+    return results
+
+
+def _facade_flow(lines):
+    facade = ShoppingFacade(cart=ShoppingCart.new_instance(), events=NullEventSink())
+    for i in range(lines):
+        kind = i % 3
+        if kind == 0:
+            facade.add_product("Gaming Mouse", 79.99, "RGB gaming mouse", "10/11/2024")
+        elif kind == 1:
+            facade.add_discounted_product("Keyboard", 149.99, 15, "Mechanical keyboard", "12/11/2024")
+        else:
+            facade.add_external_product(EXTERNAL)
+    facade.view_cart()
+    facade.create_order("express")
+
+
+def bench_facade(repeat, max_lines):
+    results = {}
+    for lines in CART_SIZES:
+        if lines > max_lines:
+            break
+        runs = repeat if lines <= 100_000 else 1
+        best = min(_time(lambda: _facade_flow(lines)) for _ in range(runs))
+        results[f"facade.flow.{lines}.per_line"] = best / lines
+    return results
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(repeat=5, max_lines=1_000_000):
+    results = {}
+    results.update(bench_access(repeat))
+    results.update(bench_totals(repeat))
+    results.update(bench_facade(repeat, max_lines))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "unit": "seconds per op",
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return [(name, baseline, current, change)] for benchmarks slower than threshold."""
+    regressions = []
+    for name, value in current["results"].items():
+        old = baseline["results"].get(name)
+        if old:
+            change = value / old - 1
+            if change > threshold:
+                regressions.append((name, old, value, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", help="write results to this JSON baseline file")
+    parser.add_argument("--compare", help="compare results with this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown, e.g. 0.10 = 10%%")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-lines", type=int, default=1_000_000, help="largest facade cart size")
+    args = parser.parse_args(argv)
+
+    current = run(args.repeat, args.max_lines)
+    for name, value in current["results"].items():
+        print(f"{name:<36}{value * 1e9:>14.1f} ns")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for name, old, new, change in regressions:
+                print(f"  {name:<36}{old * 1e9:>12.1f} -> {new * 1e9:>10.1f} ns  (+{change:.0%})")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
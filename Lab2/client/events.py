@@ -0,0 +1,28 @@
+"""
+Event sinks for ShoppingCartClient.
+
+The implementation is shared by the labs and lives in common/events.py at
+the repository root; this module makes it importable as client.events.
+"""
+import os
+import sys
+
+# The labs run from their own directories, so the repository root is not on
+# sys.path by default. Appended, not prepended, so it never shadows the lab.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from common.events import (  # noqa: E402
+    BufferedFileEventSink,
+    ConsoleEventSink,
+    Event,
+    EventSink,
+    NullEventSink,
+    RingBufferEventSink,
+)
+
+__all__ = [
+    'Event', 'EventSink', 'NullEventSink', 'ConsoleEventSink',
+    'RingBufferEventSink', 'BufferedFileEventSink',
+]
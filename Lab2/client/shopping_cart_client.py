@@ -1,55 +1,80 @@
 from domain.models.shopping_cart import ShoppingCart
 from domain.models.product import Product
-from domain.models.order import Order
+from domain.factory.order_factory import OrderFactory
 from patterns.adapter.external_product_adapter import ExternalProductAdapter
 from patterns.decorator.product_decorator import DiscountedProductDecorator
+from client.events import ConsoleEventSink, Event
+
+
+def _render_cart(items, total):
+    if not items:
+        return "  (Cart is empty)"
+    lines = [f"  {i}. {item}" for i, item in enumerate(items, 1)]
+    lines.append(f"\n  Total Price: ${total:.2f}")
+    return "\n".join(lines)
 
 
 class ShoppingCartClient:
-    def __init__(self):
-        self.cart = ShoppingCart()
+    def __init__(self, cart=None, events=None, order_log=None, interner=None):
+        self.cart = cart if cart is not None else ShoppingCart()
+        self.events = events if events is not None else ConsoleEventSink()
+        self.order_log = order_log
+        self.interner = interner
+
+    def _make_product(self, name, price, description, date):
+        if self.interner is not None:
+            return self.interner.make_product(name, price, description, date)
+        return Product(name, price, description, date)
 
     def add_product(self, name, price, date=None, description=None):
-        product = Product(name, price, description, date)
+        product = self._make_product(name, price, description, date)
         self.cart.add_item(product)
-        print(f"Added {product} to the cart.")
+        self.events.emit(Event('product_added', "Added {} to the cart.", product))
 
     def remove_product(self, product):
-        if product in self.cart.view_cart():
+        if self.cart.contains(product):
             self.cart.remove_item(product)
-            print(f"Removed {product} from the cart.")
+            self.events.emit(Event('product_removed', "Removed {} from the cart.", product))
         else:
-            print(f"Product not found in the cart.")
+            self.events.emit(Event('product_not_found', "Product not found in the cart.", product))
 
     def view_cart(self):
-        items = self.cart.view_cart()
-        if not items:
-            print("  (Cart is empty)")
-            return
-        for i, item in enumerate(items, 1):
-            print(f"  {i}. {item}")
-        print(f"\n  Total Price: ${self.cart.total_price():.2f}")
+        if self.events.enabled:
+            self.events.emit(Event('cart_viewed', _render_cart, self.cart.view_cart(), self.cart.total_price()))
 
     def create_order(self, shipping_type="standard"):
-        if not self.cart.view_cart():
-            print("Cart is empty! Cannot create an order.")
+        if not len(self.cart):
+            self.events.emit(Event('order_rejected', "Cart is empty! Cannot create an order."))
             return None
-        order = Order(self.cart.view_cart(), shipping_type)
-        print(order)
+        order = OrderFactory.create_order(self.cart.snapshot(), shipping_type, self.order_log)
+        self.events.emit(Event('order_created', "{}", order))
         return order
 
     def clear_cart(self):
         self.cart.clear_cart()
-        print("Shopping cart cleared.")
+        self.events.emit(Event('cart_cleared', "Shopping cart cleared."))
 
     def add_external_product(self, external_data):
-        adapter = ExternalProductAdapter(external_data)
+        adapter = ExternalProductAdapter(external_data, self.interner)
         product = adapter.to_product()
         self.cart.add_item(product)
-        print(f"Added external product {product} to the cart.")
+        self.events.emit(Event('external_product_added', "Added external product {} to the cart.", product))
+
+    def add_external_products(self, records):
+        """Adapt and add a batch of external records, skipping malformed ones."""
+        rejected = []
+        products = ExternalProductAdapter.to_products(
+            records, on_invalid=lambda record, reason: rejected.append((record, reason)), interner=self.interner)
+        for product in products:
+            self.cart.add_item(product)
+        self.events.emit(Event('external_products_added',
+                               "Added {} external products to the cart ({} rejected).",
+                               len(products), len(rejected)))
+        return rejected
 
     def add_discounted_product(self, name, price, discount_percentage, date=None, description=None):
-        product = Product(name, price, description, date)
+        product = self._make_product(name, price, description, date)
         discounted_product = DiscountedProductDecorator(product, discount_percentage / 100.0)
         self.cart.add_item(discounted_product)
-        print(f"Added discounted product {discounted_product} to the cart.")
\ No newline at end of file
+        self.events.emit(Event('discounted_product_added',
+                               "Added discounted product {} to the cart.", discounted_product))
\ No newline at end of file
@@ -1,5 +1,54 @@
+from datetime import datetime
+from functools import lru_cache
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # numpy only speeds up validation of array columns
+    np = None
+
 from domain.models.product import Product
 
+DATE_FORMAT = "%d/%m/%Y"
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """
+    Validate a dd/mm/yyyy date string and return it normalised (zero-padded).
+
+    Memoized, so a date repeated across many rows is parsed only once.
+    Raises ValueError for anything that is not a real dd/mm/yyyy date.
+    """
+    return datetime.strptime(value, DATE_FORMAT).strftime(DATE_FORMAT)
+
+
+class ProductBuildError(ValueError):
+    """Raised by build_many with every bad row, not just the first one."""
+
+    def __init__(self, errors, products):
+        self.errors = errors      # [(row index, field, message), ...]
+        self.products = products  # products built from the valid rows
+        shown = "; ".join(f"row {i} {field}: {message}" for i, field, message in errors[:5])
+        more = f" (+{len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} invalid product rows: {shown}{more}")
+
+
+def _columns(data):
+    """Accept a dict of sequences or a NumPy structured array."""
+    names = getattr(getattr(data, 'dtype', None), 'names', None)
+    if names:
+        return {name: data[name] for name in names}
+    return data
+
+
+def _bad_prices(prices):
+    """Indices of prices that are missing or not finite numbers."""
+    if np is not None and getattr(prices, 'dtype', None) is not None and prices.dtype.kind in 'iuf':
+        return set(np.flatnonzero(~np.isfinite(prices)).tolist())
+    return {i for i, price in enumerate(prices)
+            if price is None or isinstance(price, bool) or not isinstance(price, Real) or price != price}
+
 
 class ProductBuilder:
     """Builder pattern for constructing Product objects step by step."""
@@ -9,6 +58,7 @@ class ProductBuilder:
         self._price = None
         self._description = None
         self._date = None
+        self._interner = None
 
     def set_name(self, name):
         """Set the product name."""
@@ -30,11 +80,69 @@ class ProductBuilder:
         self._date = date
         return self
 
+    def set_interner(self, interner):
+        """Share name/description/date with identical products via a ProductInterner."""
+        self._interner = interner
+        return self
+
+    @classmethod
+    def build_many(cls, data, interner=None):
+        """
+        Build many products from columnar input in one validation pass.
+
+        `data` is a dict with "name" and "price" sequences and optional
+        "description" and "date" sequences of the same length, or a NumPy
+        structured array with those fields. Dates must be dd/mm/yyyy and go
+        through the memoized parse_date. If any row is invalid, raises
+        ProductBuildError listing every bad row with its index.
+        """
+        columns = _columns(data)
+        names = columns['name']
+        prices = columns['price']
+        count = len(names)
+        descriptions = columns.get('description')
+        dates = columns.get('date')
+        for field, column in (('price', prices), ('description', descriptions), ('date', dates)):
+            if column is not None and len(column) != count:
+                raise ValueError(f"column '{field}' has {len(column)} rows, expected {count}")
+
+        errors = [(i, 'price', "price is required and must be a number") for i in sorted(_bad_prices(prices))]
+        errors.extend((i, 'name', "name is required")
+                      for i, name in enumerate(names) if name is None or name == '')
+        if dates is not None:
+            normalised = []
+            for i, date in enumerate(dates):
+                if date is None:
+                    normalised.append(None)
+                    continue
+                try:
+                    normalised.append(parse_date(str(date)))
+                except ValueError:
+                    normalised.append(None)
+                    errors.append((i, 'date', f"invalid date {date!r}, expected dd/mm/yyyy"))
+            dates = normalised
+        errors.sort(key=lambda error: error[0])
+        bad_rows = {i for i, _, _ in errors}
+
+        make = interner.make_product if interner is not None else Product
+        price_values = prices.tolist() if hasattr(prices, 'tolist') else prices
+        products = [
+            make(names[i], price_values[i],
+                 descriptions[i] if descriptions is not None else None,
+                 dates[i] if dates is not None else None)
+            for i in range(count) if i not in bad_rows
+        ]
+        if errors:
+            raise ProductBuildError(errors, products)
+        return products
+
     def build(self):
         """Build and return the final Product object."""
         if self._name is None or self._price is None:
             raise ValueError("Product name and price are required!")
-        
+
+        if self._interner is not None:
+            return self._interner.make_product(self._name, self._price, self._description, self._date)
         return Product(
             name=self._name,
             price=self._price,
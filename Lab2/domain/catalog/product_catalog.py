@@ -0,0 +1,67 @@
+import itertools
+import sqlite3
+import threading
+
+from domain.models.product import Product
+
+
+class SQLiteProductCatalog:
+    """
+    File-backed product catalog stored in a single SQLite table.
+
+    Products are addressed by an integer id, so carts and proxies can hold
+    just the id and load the full product on demand.
+    """
+    _tokens = itertools.count()
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        # Unique for the life of the process (unlike id()), so shared caches
+        # can key products by (cache_token, product id).
+        self.cache_token = next(self._tokens)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS products ("
+                "id INTEGER PRIMARY KEY, name TEXT NOT NULL, price REAL NOT NULL, "
+                "description TEXT, date TEXT)"
+            )
+
+    def add(self, product):
+        """Store a product and return its id."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO products (name, price, description, date) VALUES (?, ?, ?, ?)",
+                (product.name, product.price, product.description, product.date),
+            )
+        return cursor.lastrowid
+
+    def add_many(self, products):
+        """Store many products in one transaction and return their ids."""
+        rows = [(p.name, p.price, p.description, p.date) for p in products]
+        with self._lock, self._conn:
+            start = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM products").fetchone()[0] + 1
+            self._conn.executemany(
+                "INSERT INTO products (id, name, price, description, date) VALUES (?, ?, ?, ?, ?)",
+                [(start + i,) + row for i, row in enumerate(rows)],
+            )
+        return range(start, start + len(rows))
+
+    def load(self, product_id):
+        """Load a product by id; raises KeyError if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, price, description, date FROM products WHERE id = ?", (product_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(product_id)
+        return Product(*row)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
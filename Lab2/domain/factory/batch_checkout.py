@@ -0,0 +1,141 @@
+"""
+Parallel checkout of many saved carts.
+
+The parent keeps each cart's item list and ships only a packed float64
+price column per cart to a process pool, in chunks. Workers send back only
+each order's total, and the parent wraps its own item lists in Orders, so
+orders hold the original (decorated, proxied) items and no Product objects
+cross the process boundary in either direction. Each chunk reports its own
+timing, and results are returned in input order.
+
+Process start-up and packing cost more than summing a small batch, so
+batches under PARALLEL_MIN_LINES lines are checked out sequentially in the
+calling process.
+"""
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from domain.factory.order_factory import OrderFactory
+from domain.models.order import Order
+
+# Below this many lines in total a batch is checked out in-process. Measured
+# with 50-line carts: 250,000 lines took ~0.02s in-process against ~0.07s
+# through a two-worker pool, and at 1,000,000 lines the two were within
+# run-to-run noise. The parent reads every price to pack it, which is most
+# of the sequential work, so the pool only wins on very large batches.
+PARALLEL_MIN_LINES = 2_000_000
+
+
+def cart_items(cart):
+    """The item list of a cart (ShoppingCart or iterable of products)."""
+    return cart.view_cart() if hasattr(cart, 'view_cart') else list(cart)
+
+
+def pack_prices(items):
+    """Pack the effective prices of a cart's items into float64 bytes."""
+    return array('d', (item.price for item in items)).tobytes()
+
+
+def _checkout_chunk(first_index, packed_prices):
+    """Worker: total one chunk of packed carts (None for empty carts) and time it."""
+    start = time.perf_counter()
+    totals = []
+    lines = 0
+    for packed in packed_prices:
+        prices = array('d', packed)
+        lines += len(prices)
+        # Same left-to-right sum as Order.
+        totals.append(sum(prices) if prices else None)
+    return first_index, totals, {
+        "first_index": first_index,
+        "carts": len(packed_prices),
+        "lines": lines,
+        "seconds": time.perf_counter() - start,
+        "pid": os.getpid(),
+    }
+
+
+def _checkout_sequential(item_lists, shipping_type):
+    start = time.perf_counter()
+    orders = [OrderFactory.create_order(items, shipping_type) if items else None for items in item_lists]
+    return 0, orders, {
+        "first_index": 0,
+        "carts": len(item_lists),
+        "lines": sum(len(items) for items in item_lists),
+        "seconds": time.perf_counter() - start,
+        "pid": os.getpid(),
+    }
+
+
+class BatchCheckoutResult:
+    """Orders in input order (None for empty carts) plus per-batch timings."""
+
+    def __init__(self, orders, batches, elapsed):
+        self.orders = orders
+        self.batches = batches
+        self.elapsed = elapsed
+
+    @property
+    def carts_per_sec(self):
+        return len(self.orders) / self.elapsed if self.elapsed else 0.0
+
+    def __len__(self):
+        return len(self.orders)
+
+    def __iter__(self):
+        return iter(self.orders)
+
+
+def iter_checkout(carts, shipping_type="standard", workers=None, chunk_size=None, ordered=True,
+                  min_parallel_lines=PARALLEL_MIN_LINES):
+    """
+    Yield (first_index, orders, timing) per chunk.
+
+    With ordered=True chunks come out in input order; otherwise in completion
+    order, which lets callers stream results as soon as any chunk finishes.
+    Batches under `min_parallel_lines` lines, or with a single worker, come
+    out as one in-process chunk.
+    """
+    item_lists = [cart_items(cart) for cart in carts]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or sum(len(items) for items in item_lists) < min_parallel_lines:
+        yield _checkout_sequential(item_lists, shipping_type)
+        return
+    packed = [pack_prices(items) for items in item_lists]
+    if chunk_size is None:
+        chunk_size = max(1, len(packed) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_checkout_chunk, start, packed[start:start + chunk_size])
+                   for start in range(0, len(packed), chunk_size)]
+        for future in (futures if ordered else as_completed(futures)):
+            first_index, totals, timing = future.result()
+            orders = [None if total is None else
+                      Order.from_total(item_lists[first_index + i], shipping_type, total)
+                      for i, total in enumerate(totals)]
+            yield first_index, orders, timing
+
+
+def checkout_carts(carts, shipping_type="standard", workers=None, chunk_size=None, order_log=None,
+                   min_parallel_lines=PARALLEL_MIN_LINES):
+    """
+    Turn many carts into Orders and return a BatchCheckoutResult.
+
+    Large batches are checked out in a process pool (see iter_checkout).
+    Orders are always returned in the same order as `carts`. If `order_log`
+    is given, orders are appended to it in that order from the parent process,
+    as one batch so the log can group-commit them.
+    """
+    carts = list(carts)
+    start = time.perf_counter()
+    orders = [None] * len(carts)
+    batches = []
+    for first_index, chunk_orders, timing in iter_checkout(carts, shipping_type, workers, chunk_size,
+                                                           ordered=False, min_parallel_lines=min_parallel_lines):
+        orders[first_index:first_index + len(chunk_orders)] = chunk_orders
+        batches.append(timing)
+    batches.sort(key=lambda timing: timing["first_index"])
+    if order_log is not None:
+        order_log.append_many([order for order in orders if order is not None])
+    return BatchCheckoutResult(orders, batches, time.perf_counter() - start)
@@ -2,5 +2,8 @@ from domain.models.order import Order
 
 class OrderFactory:
     @staticmethod
-    def create_order(products):
-        return Order(products)
\ No newline at end of file
+    def create_order(products, shipping_type="standard", order_log=None):
+        order = Order(products, shipping_type)
+        if order_log is not None:
+            order_log.append(order)
+        return order
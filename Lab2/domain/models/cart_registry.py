@@ -0,0 +1,162 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from domain.models.shopping_cart import ShoppingCart
+
+
+class _Shard:
+    __slots__ = ('lock', 'carts', 'evictions')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.evictions = 0
+        self.carts = OrderedDict()  # session id -> [cart, last used], LRU first
+
+
+class CartRegistry:
+    """
+    Hands out one independent ShoppingCart per session id.
+
+    Sessions are spread over `shards` buckets, each with its own lock, so
+    threads working on different sessions rarely contend. Carts idle for
+    longer than `ttl` seconds are evicted when their shard is next touched
+    (or by evict_expired()), and each shard keeps at most its share of
+    `max_carts`, evicting the least recently used cart first.
+
+    Carts are only touched with their shard lock held: use the per-session
+    methods, or `with registry.cart(session_id) as cart:` for anything else.
+    Reads and removals never create a cart for an unknown session.
+    """
+
+    def __init__(self, shards=16, ttl=None, max_carts=None, clock=time.monotonic):
+        self._shards = tuple(_Shard() for _ in range(shards))
+        self.ttl = ttl
+        self.max_carts = max_carts
+        self._max_per_shard = -(-max_carts // shards) if max_carts else None
+        self._clock = clock
+
+    def _shard(self, session_id):
+        return self._shards[hash(session_id) % len(self._shards)]
+
+    def _evict_locked(self, shard, now):
+        carts = shard.carts
+        if self.ttl is not None:
+            while carts:
+                session_id, (_, last_used) = next(iter(carts.items()))
+                if now - last_used <= self.ttl:
+                    break
+                del carts[session_id]
+                shard.evictions += 1
+        if self._max_per_shard is not None:
+            while len(carts) > self._max_per_shard:
+                carts.popitem(last=False)
+                shard.evictions += 1
+
+    def _entry_locked(self, shard, session_id):
+        now = self._clock()
+        entry = shard.carts.get(session_id)
+        if entry is None:
+            entry = shard.carts[session_id] = [ShoppingCart.new_instance(), now]
+        else:
+            entry[1] = now
+            shard.carts.move_to_end(session_id)
+        self._evict_locked(shard, now)
+        return entry[0]
+
+    def _existing_locked(self, shard, session_id):
+        # Like _entry_locked, but returns None instead of creating a cart.
+        now = self._clock()
+        self._evict_locked(shard, now)
+        entry = shard.carts.get(session_id)
+        if entry is None:
+            return None
+        entry[1] = now
+        shard.carts.move_to_end(session_id)
+        return entry[0]
+
+    @contextmanager
+    def cart(self, session_id):
+        """
+        Hold the session's shard lock and yield its cart, creating it on first use.
+
+        Keep the block short: other sessions in the same shard wait for it.
+        """
+        shard = self._shard(session_id)
+        with shard.lock:
+            yield self._entry_locked(shard, session_id)
+
+    def add_item(self, session_id, product):
+        """Add a product to the session's cart and return its line id."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            return self._entry_locked(shard, session_id).add_item(product)
+
+    def remove_item(self, session_id, product):
+        shard = self._shard(session_id)
+        with shard.lock:
+            cart = self._existing_locked(shard, session_id)
+            if cart is None:
+                raise ValueError("ShoppingCart.remove_item(x): x not in cart")
+            cart.remove_item(product)
+
+    def remove_line(self, session_id, line_id):
+        shard = self._shard(session_id)
+        with shard.lock:
+            cart = self._existing_locked(shard, session_id)
+            if cart is None:
+                raise KeyError(line_id)
+            return cart.remove_line(line_id)
+
+    def total_price(self, session_id):
+        """The session's cart total; 0 for a session without a cart."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            cart = self._existing_locked(shard, session_id)
+            return cart.total_price() if cart is not None else 0
+
+    def release(self, session_id):
+        """Drop a session's cart, e.g. after checkout or logout."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            return shard.carts.pop(session_id, [None])[0]
+
+    def evict_expired(self):
+        """Run TTL/LRU eviction on every shard and return how many carts went."""
+        before = self.evictions
+        now = self._clock()
+        for shard in self._shards:
+            with shard.lock:
+                self._evict_locked(shard, now)
+        return self.evictions - before
+
+    @property
+    def evictions(self):
+        return sum(shard.evictions for shard in self._shards)
+
+    def __contains__(self, session_id):
+        shard = self._shard(session_id)
+        with shard.lock:
+            return session_id in shard.carts
+
+    def __len__(self):
+        return sum(len(shard.carts) for shard in self._shards)
+
+    def stats(self):
+        """Live cart count, total lines and approximate memory in bytes.
+
+        Memory covers the registry and cart bookkeeping, including each
+        cart's persistent line trie, but not the product objects themselves,
+        which are usually shared between carts.
+        """
+        carts = lines = memory = 0
+        for shard in self._shards:
+            with shard.lock:
+                memory += sys.getsizeof(shard.carts)
+                for cart, _ in shard.carts.values():
+                    carts += 1
+                    lines += len(cart)
+                    memory += cart.memory_usage()
+        return {"live_carts": carts, "lines": lines, "memory_bytes": memory, "evictions": self.evictions}
@@ -0,0 +1,208 @@
+"""
+Immutable cart snapshots with structural sharing.
+
+The cart keeps its lines in a persistent 32-way trie keyed by line id in
+addition to its mutable index. Adding or removing a line copies only the
+nodes on one root-to-leaf path (a handful of 32-slot tuples) and shares
+everything else with the previous version, so taking a snapshot is just
+keeping a reference to the current root: O(1), and later cart mutations
+never show up in it.
+
+Diffing two snapshots walks both tries together and skips every subtree
+they share by identity, so the cost grows with the number of changed
+lines rather than the cart size.
+"""
+import math
+import sys
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_EMPTY_NODE = (None,) * _WIDTH
+
+
+class PersistentLineMap:
+    """Persistent map from non-negative integer line ids to products."""
+    __slots__ = ('_root', '_shift', '_count')
+
+    def __init__(self, root=None, shift=0, count=0):
+        self._root = root
+        self._shift = shift
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def _capacity(self):
+        return 1 << (self._shift + _BITS)
+
+    def get(self, key, default=None):
+        if key < 0 or key >= self._capacity():
+            return default
+        node = self._root
+        shift = self._shift
+        while node is not None and shift > 0:
+            node = node[(key >> shift) & _MASK]
+            shift -= _BITS
+        if node is None:
+            return default
+        value = node[key & _MASK]
+        return default if value is None else value
+
+    def set(self, key, value):
+        """Return a new map with `key` set to `value`."""
+        root, shift = self._root, self._shift
+        while key >= 1 << (shift + _BITS):
+            if root is not None:
+                root = (root,) + _EMPTY_NODE[1:]
+            shift += _BITS
+        added = self.get(key) is None
+        root = self._assoc(root, shift, key, value)
+        return PersistentLineMap(root, shift, self._count + (1 if added else 0))
+
+    def delete(self, key):
+        """Return a new map without `key` (or self if it is absent)."""
+        if self.get(key) is None:
+            return self
+        return PersistentLineMap(self._dissoc(self._root, self._shift, key), self._shift, self._count - 1)
+
+    @classmethod
+    def _assoc(cls, node, shift, key, value):
+        node = node if node is not None else _EMPTY_NODE
+        index = (key >> shift) & _MASK
+        child = value if shift == 0 else cls._assoc(node[index], shift - _BITS, key, value)
+        return node[:index] + (child,) + node[index + 1:]
+
+    @classmethod
+    def _dissoc(cls, node, shift, key):
+        index = (key >> shift) & _MASK
+        child = None if shift == 0 else cls._dissoc(node[index], shift - _BITS, key)
+        node = node[:index] + (child,) + node[index + 1:]
+        # Identity checks only: == would call the products' __eq__.
+        return None if all(slot is None for slot in node) else node
+
+    def nbytes(self):
+        """Bytes held by the trie nodes (not the products), shared ones included."""
+        size = sys.getsizeof(self)
+        stack = [(self._root, self._shift)] if self._root is not None else []
+        while stack:
+            node, shift = stack.pop()
+            size += sys.getsizeof(node)
+            if shift > 0:
+                stack.extend((child, shift - _BITS) for child in node if child is not None)
+        return size
+
+    def items(self):
+        """Yield (line id, product) pairs in line id order."""
+        if self._root is not None:
+            yield from self._walk(self._root, self._shift, 0)
+
+    @classmethod
+    def _walk(cls, node, shift, base):
+        for index, child in enumerate(node):
+            if child is None:
+                continue
+            key = base | (index << shift)
+            if shift == 0:
+                yield key, child
+            else:
+                yield from cls._walk(child, shift - _BITS, key)
+
+    def diff(self, other):
+        """
+        Compare with a newer map.
+
+        Returns (added, removed, changed): lists of (line id, product) for
+        lines only in `other`, lines only in self, and lines whose product
+        differs (as (line id, old, new)).
+        """
+        a_root, b_root = self._root, other._root
+        shift = max(self._shift, other._shift)
+        for _ in range((shift - self._shift) // _BITS):
+            a_root = (a_root,) + _EMPTY_NODE[1:] if a_root is not None else None
+        for _ in range((shift - other._shift) // _BITS):
+            b_root = (b_root,) + _EMPTY_NODE[1:] if b_root is not None else None
+        added, removed, changed = [], [], []
+        self._diff(a_root, b_root, shift, 0, added, removed, changed)
+        return added, removed, changed
+
+    @classmethod
+    def _diff(cls, a, b, shift, base, added, removed, changed):
+        if a is b:
+            return
+        if a is None:
+            added.extend(cls._walk(b, shift, base))
+            return
+        if b is None:
+            removed.extend(cls._walk(a, shift, base))
+            return
+        for index in range(_WIDTH):
+            child_a, child_b = a[index], b[index]
+            if child_a is child_b:
+                continue
+            key = base | (index << shift)
+            if shift == 0:
+                if child_a is None:
+                    added.append((key, child_b))
+                elif child_b is None:
+                    removed.append((key, child_a))
+                else:
+                    changed.append((key, child_a, child_b))
+            else:
+                cls._diff(child_a, child_b, shift - _BITS, key, added, removed, changed)
+
+
+class CartSnapshot:
+    """
+    Read-only view of a cart at one point in time.
+
+    Iterates the products in line order and supports len(), `in`, lines()
+    and total(), so it can be handed to Order in place of a list. The total
+    is summed from the snapshot's own products when asked for.
+    """
+    __slots__ = ('_lines',)
+
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __iter__(self):
+        for _, product in self._lines.items():
+            yield product
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __bool__(self):
+        return len(self._lines) > 0
+
+    def __contains__(self, product):
+        return any(item is product or item == product for item in self)
+
+    def lines(self):
+        """(line id, product) pairs in line order."""
+        return list(self._lines.items())
+
+    def get_line(self, line_id):
+        product = self._lines.get(line_id)
+        if product is None:
+            raise KeyError(line_id)
+        return product
+
+    def total(self):
+        return math.fsum(product.price for product in self)
+
+    total_price = total
+
+    def diff(self, newer):
+        """
+        Lines changed between this snapshot and a newer one.
+
+        Returns {'added': [(line id, product)], 'removed': [(line id, product)],
+        'changed': [(line id, old, new)]}; line ids are stable, so a sync only
+        needs to send these.
+        """
+        added, removed, changed = self._lines.diff(newer._lines)
+        return {"added": added, "removed": removed, "changed": changed}
+
+    def __repr__(self):
+        return f"CartSnapshot(lines={len(self)})"
@@ -2,7 +2,18 @@ class Order:
     def __init__(self, products, shipping_type="standard"):
         self.items = products
         self.order_type = shipping_type
-        self.total_price = sum(item.price for item in products)
+        # Columnar containers (e.g. ProductStore) and cart snapshots know their own total.
+        total = getattr(products, 'total', None)
+        self.total_price = total() if callable(total) else sum(item.price for item in products)
+
+    @classmethod
+    def from_total(cls, products, shipping_type, total_price):
+        """Rebuild an order whose total was already computed (e.g. by a checkout worker)."""
+        order = cls.__new__(cls)
+        order.items = products
+        order.order_type = shipping_type
+        order.total_price = total_price
+        return order
 
     def __str__(self):
         lines = [f"Order Details ({self.order_type.upper()} shipping):"]
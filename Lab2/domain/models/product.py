@@ -1,3 +1,79 @@
+import weakref
+
+
+def _watchers_of(obj):
+    # object.__getattribute__ skips proxies' __getattr__ forwarding.
+    try:
+        return object.__getattribute__(obj, '_watchers')
+    except AttributeError:
+        return None
+
+
+def _prune(watchers):
+    for key, ref in list(watchers.items()):
+        if ref() is None:
+            del watchers[key]
+
+
+def watch(obj, watcher):
+    """
+    Register `watcher._invalidate()` to be called whenever the price of
+    `obj` changes. Watchers are held weakly and registered once. Raises
+    TypeError for objects that have nowhere to keep them (e.g. ProductStore
+    rows).
+    """
+    watchers = _watchers_of(obj)
+    if watchers is None:
+        watchers = {}  # id(watcher) -> weakref to it
+        try:
+            object.__setattr__(obj, '_watchers', watchers)
+        except AttributeError:
+            raise TypeError(f"cannot watch {type(obj).__name__} objects") from None
+        if type(obj) is Product:
+            obj.__class__ = _WatchedProduct
+    key = id(watcher)
+    ref = watchers.get(key)
+    if ref is not None and ref() is watcher:
+        return
+    watchers[key] = weakref.ref(watcher)
+    # Dead watchers are dropped on notify; products whose price never
+    # changes are swept whenever their watcher count doubles.
+    size = len(watchers)
+    if size >= 64 and not size & (size - 1):
+        _prune(watchers)
+
+
+def watch_chain(product, watcher):
+    """
+    Watch a product and every decorator layer beneath it.
+
+    Returns False if some layer cannot be watched; the caller has to read
+    prices from such chains itself.
+    """
+    complete = True
+    layer = product
+    while layer is not None:
+        try:
+            watch(layer, watcher)
+        except TypeError:
+            complete = False
+        layer = getattr(layer, '__dict__', {}).get('_product')
+    return complete
+
+
+def notify_watchers(obj):
+    """Invalidate every live watcher registered on `obj`."""
+    watchers = _watchers_of(obj)
+    if not watchers:
+        return
+    for key, ref in list(watchers.items()):
+        watcher = ref()
+        if watcher is None:
+            del watchers[key]
+        else:
+            watcher._invalidate()
+
+
 class Product:
     """Product model representing items in the shopping cart."""
     
@@ -29,4 +105,22 @@ class Product:
 
     def get_date(self):
         """Return the product date."""
-        return self.date
\ No newline at end of file
+        return self.date
+
+
+class _WatchedProduct(Product):
+    """
+    A Product that something watches. watch() switches a Product to this
+    class, so only watched products pay for tracking price assignments;
+    reads and construction of plain Products are untouched.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'price':
+            notify_watchers(self)
+
+    def __reduce__(self):
+        # Watchers are process-local, so copies come back as plain Products.
+        return Product, (self.name, self.price, self.description, self.date)
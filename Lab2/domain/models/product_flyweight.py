@@ -0,0 +1,136 @@
+import sys
+import threading
+import weakref
+
+from domain.models.product import Product, notify_watchers
+
+
+class ProductData:
+    """
+    Flyweight holding the immutable, shareable part of a product.
+
+    One instance exists per distinct (name, description, date) in an
+    interner; every SharedProduct with that data points at it.
+    """
+    __slots__ = ('name', 'description', 'date', 'nbytes', '__weakref__')
+
+    def __init__(self, name, description, date):
+        self.name = name
+        self.description = description
+        self.date = date
+        self.nbytes = sum(sys.getsizeof(value) for value in (name, description, date) if value is not None)
+
+
+class SharedProduct:
+    """
+    Product whose name, description and date live in a shared ProductData.
+
+    Only the price (and a pointer to the flyweight) is stored per instance;
+    there is no per-instance __dict__. Constructed like a Product, it gets
+    unshared data of its own; ProductInterner.make_product() builds one on
+    interned data. Reads like a Product; the shared fields are read-only,
+    and price changes notify watchers as Product does.
+    """
+    __slots__ = ('_data', '_price', '_watchers', '__weakref__')
+
+    def __init__(self, name, price, description=None, date=None):
+        self._data = ProductData(name, description, date)
+        self._price = price
+
+    @classmethod
+    def from_data(cls, data, price):
+        """Create a product on existing (interned) ProductData."""
+        product = cls.__new__(cls)
+        product._data = data
+        product._price = price
+        return product
+
+    @property
+    def name(self):
+        return self._data.name
+
+    @property
+    def description(self):
+        return self._data.description
+
+    @property
+    def date(self):
+        return self._data.date
+
+    @property
+    def price(self):
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        self._price = value
+        notify_watchers(self)
+
+    __str__ = Product.__str__
+    __repr__ = Product.__repr__
+    get_price = Product.get_price
+    get_name = Product.get_name
+    get_description = Product.get_description
+    get_date = Product.get_date
+
+    def __reduce__(self):
+        # Unpickled copies are plain Products; the flyweight is process-local.
+        return Product, (self.name, self._price, self.description, self.date)
+
+
+class ProductInterner:
+    """
+    Intern table that shares identical product data between instances and carts.
+
+    Entries are held in a WeakValueDictionary, so data no product uses any
+    more is collected; pass strong=True to also pin every entry (e.g. for a
+    hot catalog). intern() is thread-safe.
+    """
+
+    def __init__(self, strong=False):
+        self._table = weakref.WeakValueDictionary()
+        self._pinned = [] if strong else None
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.bytes_saved = 0
+
+    def intern(self, name, description=None, date=None):
+        """Return the shared ProductData for these values."""
+        key = (name, description, date)
+        with self._lock:
+            self.lookups += 1
+            data = self._table.get(key)
+            if data is None:
+                data = self._table[key] = ProductData(name, description, date)
+                if self._pinned is not None:
+                    self._pinned.append(data)
+            else:
+                self.hits += 1
+                self.bytes_saved += data.nbytes
+        return data
+
+    def make_product(self, name, price, description=None, date=None):
+        """Create a SharedProduct backed by interned data."""
+        return SharedProduct.from_data(self.intern(name, description, date), price)
+
+    def __len__(self):
+        return len(self._table)
+
+    def stats(self):
+        """
+        Memory accounting for the interner.
+
+        `bytes_shared` is what the live distinct strings occupy;
+        `bytes_saved` is what the copies avoided by every lookup that reused
+        an entry would have cost.
+        """
+        with self._lock:
+            entries = list(self._table.values())
+            return {
+                "entries": len(entries),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "bytes_shared": sum(data.nbytes for data in entries),
+                "bytes_saved": self.bytes_saved,
+            }
@@ -0,0 +1,263 @@
+import sys
+
+import numpy as np
+
+
+class _CategoricalColumn:
+    """
+    Dictionary-encoded column for low-cardinality values (descriptions, dates).
+
+    Each distinct value is stored once; rows hold an int32 code into it.
+    """
+
+    def __init__(self, capacity):
+        self.values = [None]
+        self._codes_by_value = {None: 0}
+        self.codes = np.zeros(capacity, dtype=np.int32)
+
+    def encode(self, value):
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes_by_value[value] = code
+        return code
+
+    def grow(self, capacity, size):
+        codes = np.zeros(capacity, dtype=np.int32)
+        codes[:size] = self.codes[:size]
+        self.codes = codes
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+
+class ProductRow:
+    """
+    Lightweight view of one row in a ProductStore.
+
+    Satisfies the same read interface as Product (name, price, description,
+    date and the get_* methods) without copying any data out of the store.
+    """
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def name(self):
+        return self._store._names[self._index]
+
+    @property
+    def price(self):
+        return float(self._store._prices[self._index])
+
+    @property
+    def description(self):
+        return self._store._descriptions[self._index]
+
+    @property
+    def date(self):
+        return self._store._dates[self._index]
+
+    def get_price(self):
+        """Return the product price."""
+        return self.price
+
+    def get_name(self):
+        """Return the product name."""
+        return self.name
+
+    def get_description(self):
+        """Return the product description."""
+        return self.description
+
+    def get_date(self):
+        """Return the product date."""
+        return self.date
+
+    def __eq__(self, other):
+        return (isinstance(other, ProductRow)
+                and other._store is self._store and other._index == self._index)
+
+    def __hash__(self):
+        return hash((id(self._store), self._index))
+
+    def __str__(self):
+        desc = f" - {self.description}" if self.description else ""
+        date_info = f" (Date: {self.date})" if self.date else ""
+        return f"{self.name}: ${self.price:.2f}{desc}{date_info}"
+
+    def __repr__(self):
+        return f"ProductRow(index={self._index}, name='{self.name}', price={self.price})"
+
+
+class ProductStore:
+    """
+    Columnar product catalog.
+
+    Names are kept in a list, prices in a NumPy float64 column, and
+    descriptions and dates (which repeat heavily across a catalog) as
+    dictionary-encoded int32 columns. Totals, filtered subtotals and price
+    updates are vectorized instead of walking one Product object per row.
+    """
+
+    def __init__(self, capacity=1024):
+        capacity = max(1, capacity)
+        self._names = []
+        self._descriptions = _CategoricalColumn(capacity)
+        self._dates = _CategoricalColumn(capacity)
+        self._prices = np.zeros(capacity, dtype=np.float64)
+        self._size = 0
+        self._listeners = []
+
+    def __len__(self):
+        return self._size
+
+    def subscribe(self, listener):
+        """Register a listener notified with item_added(row_index, row) on every append."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify_added(self, rows):
+        for listener in self._listeners:
+            for index in rows:
+                listener.item_added(index, ProductRow(self, index))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ProductStore index out of range")
+        return ProductRow(self, index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield ProductRow(self, index)
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        if needed > len(self._prices):
+            capacity = max(needed, 2 * len(self._prices))
+            prices = np.zeros(capacity, dtype=np.float64)
+            prices[:self._size] = self._prices[:self._size]
+            self._prices = prices
+            self._descriptions.grow(capacity, self._size)
+            self._dates.grow(capacity, self._size)
+
+    @property
+    def prices(self):
+        """Read-only NumPy view of the price column."""
+        view = self._prices[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def add(self, name, price, description=None, date=None):
+        """Append one product and return its row view."""
+        self._reserve(1)
+        index = self._size
+        self._names.append(name)
+        self._descriptions.codes[index] = self._descriptions.encode(description)
+        self._dates.codes[index] = self._dates.encode(date)
+        self._prices[index] = price
+        self._size += 1
+        if self._listeners:
+            self._notify_added((index,))
+        return ProductRow(self, index)
+
+    def add_item(self, product):
+        """Append a Product-like object (anything with name/price/...)."""
+        return self.add(product.name, product.price,
+                        getattr(product, 'description', None), getattr(product, 'date', None))
+
+    def add_items(self, products):
+        """Append a batch of Product-like objects column-wise."""
+        return self.extend([p.name for p in products], [p.price for p in products],
+                           [getattr(p, 'description', None) for p in products],
+                           [getattr(p, 'date', None) for p in products])
+
+    def extend(self, names, prices, descriptions=None, dates=None):
+        """Append many products at once from parallel sequences."""
+        count = len(names)
+        if len(prices) != count:
+            raise ValueError("names and prices must have the same length")
+        for column in (descriptions, dates):
+            if column is not None and len(column) != count:
+                raise ValueError("all columns must have the same length")
+        self._reserve(count)
+        start = self._size
+        stop = start + count
+        self._prices[start:stop] = np.asarray(prices, dtype=np.float64)
+        for column, values in ((self._descriptions, descriptions), (self._dates, dates)):
+            if values is not None:
+                encode = column.encode
+                column.codes[start:stop] = np.fromiter(
+                    (encode(v) for v in values), dtype=np.int32, count=count)
+        self._names.extend(names)
+        self._size = stop
+        if self._listeners:
+            self._notify_added(range(start, stop))
+        return range(start, stop)
+
+    def _select(self, rows):
+        prices = self._prices[:self._size]
+        if rows is None:
+            return prices
+        if isinstance(rows, range):
+            return prices[rows.start:rows.stop:rows.step]
+        rows = np.asarray(rows)
+        return prices[rows]
+
+    def total(self, rows=None):
+        """Sum of prices over all rows, a row index array or a boolean mask."""
+        return float(self._select(rows).sum())
+
+    def mask(self, predicate, column='name'):
+        """Boolean mask of rows whose `column` value satisfies `predicate`."""
+        if column == 'name':
+            return np.fromiter((bool(predicate(v)) for v in self._names), dtype=bool, count=self._size)
+        # Evaluate the predicate once per distinct value, then map the codes.
+        encoded = {'description': self._descriptions, 'date': self._dates}[column]
+        matches = np.array([bool(predicate(v)) for v in encoded.values], dtype=bool)
+        return matches[encoded.codes[:self._size]]
+
+    def subtotal(self, min_price=None, max_price=None, mask=None):
+        """Sum of prices of rows within an optional price range and mask."""
+        prices = self._prices[:self._size]
+        selected = np.ones(self._size, dtype=bool) if mask is None else np.array(mask, dtype=bool)
+        if min_price is not None:
+            selected &= prices >= min_price
+        if max_price is not None:
+            selected &= prices <= max_price
+        return float(prices[selected].sum())
+
+    def set_prices(self, rows, prices):
+        """Overwrite prices for a row index array or boolean mask."""
+        self._select_writable()[rows] = prices
+
+    def scale_prices(self, factor, rows=None):
+        """Multiply prices in place, e.g. factor=0.8 for a 20% discount."""
+        column = self._select_writable()
+        if rows is None:
+            column *= factor
+        else:
+            column[rows] *= factor
+
+    def _select_writable(self):
+        return self._prices[:self._size]
+
+    def memory_usage(self):
+        """Approximate bytes held by the store, including the string objects."""
+        total = self._prices.nbytes + sys.getsizeof(self._names)
+        total += sum(sys.getsizeof(name) for name in self._names)
+        for column in (self._descriptions, self._dates):
+            total += column.codes.nbytes + sys.getsizeof(column.values)
+            total += sum(sys.getsizeof(value) for value in column.values if value is not None)
+        return total
@@ -1,23 +1,218 @@
+import math
+import sys
+
+from domain.models.cart_snapshot import CartSnapshot, PersistentLineMap
+from domain.models.product import watch_chain
+
+
+def _add_exact(partials, x):
+    # Shewchuk's running sum: `partials` are non-overlapping floats whose
+    # exact sum is the running total, so adds and removes never drift.
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
 class ShoppingCart:
+    """
+    Singleton shopping cart indexed by line id.
+
+    Every added product gets a stable line id, so removing a line and
+    checking membership are O(1). The cart also keeps per-product
+    quantities and a running total that is updated on add, remove and
+    clear instead of being re-summed on every call. Adding a line does not
+    read its price (so proxies are neither counted nor loaded); new lines
+    are priced on the next total_price(). Each line remembers the price it
+    was counted at, so removing it subtracts exactly what was added. The
+    cart watches the products it holds: when one of their prices changes,
+    every line is priced again on the next total_price(). Lines whose price
+    cannot be watched (ProductStore rows) are read live on every
+    total_price().
+
+    Lines are mirrored into a persistent trie, so snapshot() hands out an
+    immutable view of the cart in O(1) without copying it.
+    """
     _instance = None
     #
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.items = []
+            cls._instance._next_line_id = 0
+            cls._instance._listeners = []
+            cls._instance._reset()
         return cls._instance
 
+    @classmethod
+    def new_instance(cls):
+        """Create an independent cart that bypasses the process-wide singleton."""
+        cart = super().__new__(cls)
+        cart._next_line_id = 0
+        cart._listeners = []
+        cart._reset()
+        return cart
+
+    def _reset(self):
+        self._lines = {}          # line id -> product, in insertion order
+        self._product_lines = {}  # product -> {line id: None}, oldest first
+        self._pending = {}        # line id -> product not priced yet
+        self._line_prices = {}    # line id -> price counted in the total
+        self._partials = []       # exact running sum of _line_prices
+        self._untracked = set()   # products in the cart whose price can't be watched
+        self._live_lines = {}     # line id -> untracked product, priced on every total
+        self._stale = False       # a watched price changed since the last total
+        self._persistent = PersistentLineMap()  # line id -> product, shared with snapshots
+
+    def subscribe(self, listener):
+        """
+        Register a listener notified with item_added(line_id, product),
+        item_removed(line_id, product) and cart_cleared().
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    @property
+    def items(self):
+        """List view of the cart lines, kept for the list-based API."""
+        return list(self._lines.values())
+
     def add_item(self, product):
-        self.items.append(product)
+        """Add a product as a new line and return its line id."""
+        line_id = self._next_line_id
+        self._next_line_id += 1
+        self._lines[line_id] = product
+        line_ids = self._product_lines.get(product)
+        if line_ids is None:
+            line_ids = self._product_lines[product] = {}
+            if not watch_chain(product, self):
+                self._untracked.add(product)
+        line_ids[line_id] = None
+        if self._untracked and product in self._untracked:
+            self._live_lines[line_id] = product
+        else:
+            self._pending[line_id] = product
+        self._persistent = self._persistent.set(line_id, product)
+        for listener in self._listeners:
+            listener.item_added(line_id, product)
+        return line_id
 
     def remove_item(self, product):
-        self.items.remove(product)
+        """Remove the oldest line holding this product."""
+        line_ids = self._product_lines.get(product)
+        if not line_ids:
+            raise ValueError("ShoppingCart.remove_item(x): x not in cart")
+        self.remove_line(next(iter(line_ids)))
+
+    def remove_line(self, line_id):
+        """Remove a line by its id and return the product it held."""
+        product = self._lines.pop(line_id)
+        line_ids = self._product_lines[product]
+        del line_ids[line_id]
+        if not line_ids:
+            del self._product_lines[product]
+            self._untracked.discard(product)
+        if line_id in self._line_prices:
+            _add_exact(self._partials, -self._line_prices.pop(line_id))
+        elif line_id in self._pending:
+            del self._pending[line_id]
+        else:
+            del self._live_lines[line_id]
+        if not self._lines:
+            self._partials = []
+        self._persistent = self._persistent.delete(line_id)
+        for listener in self._listeners:
+            listener.item_removed(line_id, product)
+        return product
+
+    def get_line(self, line_id):
+        """Return the product stored on a line."""
+        return self._lines[line_id]
+
+    def lines(self):
+        """Return (line id, product) pairs in insertion order."""
+        return list(self._lines.items())
+
+    def contains(self, product):
+        """Return True if the product is on at least one line."""
+        return product in self._product_lines
+
+    def __contains__(self, product):
+        return product in self._product_lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    def quantity(self, product):
+        """Return how many lines hold this product."""
+        return len(self._product_lines.get(product, ()))
 
     def view_cart(self):
         return self.items
 
+    def snapshot(self):
+        """
+        Return an immutable CartSnapshot of the current lines.
+
+        O(1): the snapshot shares structure with the cart, and later adds,
+        removes or clears do not affect it.
+        """
+        return CartSnapshot(self._persistent)
+
+    def memory_usage(self):
+        """
+        Approximate bytes held by the cart's bookkeeping, including its
+        persistent line trie but not the products themselves.
+        """
+        total = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + self._persistent.nbytes()
+        for index in (self._lines, self._product_lines, self._pending, self._line_prices,
+                      self._partials, self._untracked, self._live_lines, self._listeners):
+            total += sys.getsizeof(index)
+        total += sum(sys.getsizeof(line_ids) for line_ids in self._product_lines.values())
+        return total
+
     def clear_cart(self):
-        self.items = []
+        self._reset()
+        for listener in self._listeners:
+            listener.cart_cleared()
+
+    def _invalidate(self):
+        # Called by watched products when their price changes.
+        self._stale = True
+
+    def _reprice(self):
+        # Put every priced line back in the queue to be priced afresh.
+        self._stale = False
+        lines = self._lines
+        self._pending.update((line_id, lines[line_id]) for line_id in self._line_prices)
+        self._line_prices = {}
+        self._partials = []
+
+    def _price_pending(self):
+        pending = self._pending
+        prices = self._line_prices
+        partials = self._partials
+        for line_id, product in list(pending.items()):
+            price = product.price
+            if price is None:
+                raise TypeError(f"cannot total a line without a visible price: {product!r}")
+            _add_exact(partials, price)
+            prices[line_id] = price
+            del pending[line_id]
 
     def total_price(self):
-        return sum(item.price for item in self.items)
\ No newline at end of file
+        if self._stale:
+            self._reprice()
+        if self._pending:
+            self._price_pending()
+        if self._live_lines:
+            return math.fsum(self._partials + [product.price for product in self._live_lines.values()])
+        return math.fsum(self._partials) if self._partials else 0
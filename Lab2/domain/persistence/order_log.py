@@ -0,0 +1,235 @@
+"""
+Append-only, checksummed order log with group commit.
+
+Each record is a 4-byte payload length, a 4-byte CRC32 of the payload and
+the payload itself (a JSON order). A single writer thread drains all orders
+queued since its last write, writes them together and, at the "fsync"
+durability level, covers the whole group with one fsync, so concurrent
+checkouts share the cost of making data durable.
+
+Durability levels:
+  - "none":  append() returns immediately; data reaches the OS in batches.
+             Queued records are written by close(), which also runs at
+             interpreter exit; a crash before then loses them.
+  - "write": append() returns once the record is written to the OS (it
+             survives a process crash but not a power loss).
+  - "fsync": append() returns once the record has been fsynced.
+
+On open, the log is replayed and any torn or corrupt tail left by a crash is
+truncated, so the file always ends on a complete record.
+
+If a write, flush or fsync fails, the writer stops: the error is raised from
+every append() waiting on that group and from every later append() or
+close().
+"""
+import atexit
+import json
+import os
+import struct
+import threading
+import zlib
+
+from domain.models.order import Order
+from domain.models.product import Product
+
+DURABILITY_LEVELS = ("none", "write", "fsync")
+
+_HEADER = struct.Struct("<II")
+
+
+def order_to_record(order, order_id=None):
+    """Flatten an Order into a JSON-serialisable dict (decorators become their effective price)."""
+    return {
+        "id": order_id,
+        "shipping_type": order.order_type,
+        "total": order.total_price,
+        "items": [[item.name, item.price, item.description, item.date] for item in order.items],
+    }
+
+
+def record_to_order(record):
+    """Rebuild an Order from a replayed record."""
+    products = [Product(name, price, description, date) for name, price, description, date in record["items"]]
+    return Order(products, record["shipping_type"])
+
+
+def encode_record(record):
+    payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_records(path):
+    """
+    Yield (end_offset, record) for every valid record in the log.
+
+    Stops silently at the first truncated or corrupt record.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        offset = 0
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, checksum = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            try:
+                record = json.loads(payload)
+            except ValueError:
+                return
+            offset += _HEADER.size + length
+            yield offset, record
+
+
+class _Pending:
+    __slots__ = ("data", "done", "error")
+
+    def __init__(self, data, wait):
+        self.data = data
+        self.done = threading.Event() if wait else None
+        self.error = None
+
+
+class OrderLog:
+    """Durable, append-only log of created orders."""
+
+    def __init__(self, path, durability="fsync", max_batch=1024):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"durability must be one of {DURABILITY_LEVELS}")
+        self.path = path
+        self.durability = durability
+        self.max_batch = max_batch
+        self.recovered, valid_end = self._scan()
+        self._file = open(path, "ab")
+        if self._file.tell() != valid_end:
+            # Drop a torn tail left by a crash mid-write.
+            self._file.truncate(valid_end)
+        self._next_id = self.recovered
+        self._queue = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self.error = None
+        self.groups = 0
+        self._writer = threading.Thread(target=self._run, name="order-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _scan(self):
+        count = end = 0
+        for end, _ in read_records(self.path):
+            count += 1
+        return count, end
+
+    def append(self, order):
+        """Log an order and return its sequential id once it meets the durability level."""
+        with self._cond:
+            if self.error is not None:
+                raise self.error
+            if self._closed:
+                raise ValueError("order log is closed")
+            order_id = self._next_id
+            self._next_id += 1
+            pending = _Pending(encode_record(order_to_record(order, order_id)), self.durability != "none")
+            self._queue.append(pending)
+            self._cond.notify()
+        if pending.done is not None:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+        return order_id
+
+    def append_many(self, orders):
+        """
+        Log several orders and return their ids once all meet the durability level.
+
+        Everything is queued before waiting, so the writer can cover the whole
+        batch with a few group commits instead of one per order.
+        """
+        wait = self.durability != "none"
+        with self._cond:
+            if self.error is not None:
+                raise self.error
+            if self._closed:
+                raise ValueError("order log is closed")
+            first_id = self._next_id
+            pendings = [_Pending(encode_record(order_to_record(order, first_id + i)), wait)
+                        for i, order in enumerate(orders)]
+            self._next_id += len(pendings)
+            self._queue.extend(pendings)
+            self._cond.notify()
+        if wait:
+            for pending in pendings:
+                pending.done.wait()
+                if pending.error is not None:
+                    raise pending.error
+        return list(range(first_id, first_id + len(pendings)))
+
+    # Lets an OrderLog be used directly as an AsyncShoppingFacade backend.
+    save_order = append
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue and self._closed:
+                    return
+                batch = self._queue[:self.max_batch]
+                del self._queue[:self.max_batch]
+            try:
+                self._file.write(b"".join(p.data for p in batch))
+                if self.durability != "none":
+                    self._file.flush()
+                    if self.durability == "fsync":
+                        os.fsync(self._file.fileno())
+            except BaseException as exc:
+                self._fail(batch, exc)
+                return
+            self.groups += 1
+            for pending in batch:
+                if pending.done is not None:
+                    pending.done.set()
+
+    def _fail(self, batch, exc):
+        # Release every waiter, including orders queued behind the failed
+        # group: none of them will be written.
+        with self._cond:
+            self.error = exc
+            batch = batch + self._queue
+            self._queue = []
+        for pending in batch:
+            pending.error = exc
+            if pending.done is not None:
+                pending.done.set()
+
+    def replay(self):
+        """Yield every durable order record in log order."""
+        for _, record in read_records(self.path):
+            yield record
+
+    def close(self):
+        """Write everything still queued, fsync and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._writer.join()
+        atexit.unregister(self.close)
+        try:
+            if self.error is None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
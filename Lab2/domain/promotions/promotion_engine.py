@@ -0,0 +1,238 @@
+"""
+Rule-based cart promotions with incremental re-evaluation.
+
+Rules are compiled once into dispatch tables keyed by product name or
+category, so adding or removing a line only touches the rules that can
+match it: each such rule updates a running (count, sum) for its matching
+lines and recomputes its own discount in O(1). Pricing the cart then only
+combines the cached per-rule discounts in priority order, instead of
+re-walking every line.
+
+Stacking: rules are applied from highest to lowest priority. Each rule's
+discount is capped at what is left of the cart total, cart-total
+thresholds look at the total after higher-priority discounts, and an
+`exclusive` rule that applies stops all lower-priority rules.
+
+Line prices are read when a line is added, and the engine watches each
+line's product: if one of their prices changes afterwards, the next
+pricing() re-reads every line. Lines whose price cannot be watched
+(ProductStore rows) are re-read on every pricing().
+
+Product has no category field: category rules match through the
+engine's `category_of(product)` hook, which callers supply.
+"""
+import math
+from abc import ABC, abstractmethod
+
+from domain.models.product import watch_chain
+
+
+class PromotionRule(ABC):
+    """Base class for promotion rules."""
+
+    def __init__(self, name, priority=0, exclusive=False):
+        self.name = name
+        self.priority = priority
+        self.exclusive = exclusive
+
+    def dispatch_key(self):
+        """('name', value) or ('category', value) for line rules, None for cart rules."""
+        return None
+
+    @abstractmethod
+    def discount(self, count, total, running_total):
+        """Discount for `count` matching lines summing to `total`."""
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}, priority={self.priority})"
+
+
+class PercentOffCategory(PromotionRule):
+    """Percent off every line in a category."""
+
+    def __init__(self, category, percent, priority=0, exclusive=False, name=None):
+        super().__init__(name or f"{percent:g}% off {category}", priority, exclusive)
+        self.category = category
+        self.rate = percent / 100.0
+
+    def dispatch_key(self):
+        return ('category', self.category)
+
+    def discount(self, count, total, running_total):
+        return total * self.rate
+
+
+class BuyNGetM(PromotionRule):
+    """Buy `buy` of a product, get `free` more of it free (at the average line price)."""
+
+    def __init__(self, product_name, buy, free, priority=0, exclusive=False, name=None):
+        super().__init__(name or f"buy {buy} get {free} {product_name}", priority, exclusive)
+        self.product_name = product_name
+        self.buy = buy
+        self.free = free
+
+    def dispatch_key(self):
+        return ('name', self.product_name)
+
+    def discount(self, count, total, running_total):
+        if not count:
+            return 0.0
+        free_items = (count // (self.buy + self.free)) * self.free
+        return free_items * (total / count)
+
+
+class CartThreshold(PromotionRule):
+    """Percent or fixed amount off once the cart total reaches `min_total`."""
+
+    def __init__(self, min_total, percent=None, amount=None, priority=0, exclusive=False, name=None):
+        if (percent is None) == (amount is None):
+            raise ValueError("CartThreshold needs exactly one of percent or amount")
+        label = f"{percent:g}%" if percent is not None else f"${amount:.2f}"
+        super().__init__(name or f"{label} off orders over ${min_total:.2f}", priority, exclusive)
+        self.min_total = min_total
+        self.rate = percent / 100.0 if percent is not None else None
+        self.amount = amount
+
+    def discount(self, count, total, running_total):
+        if running_total < self.min_total:
+            return 0.0
+        return running_total * self.rate if self.rate is not None else self.amount
+
+
+class _RuleState:
+    __slots__ = ('rule', 'cart_level', 'count', 'total', 'discount')
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.cart_level = rule.dispatch_key() is None
+        self.count = 0
+        self.total = 0.0
+        self.discount = 0.0
+
+    def update(self, count, total):
+        self.count += count
+        self.total += total
+        if not self.count:
+            self.total = 0.0
+        self.discount = self.rule.discount(self.count, self.total, None)
+
+
+def default_category(product):
+    """Fallback category_of: a `category` attribute if the product has one, else None."""
+    return getattr(product, 'category', None)
+
+
+class PromotionEngine:
+    """
+    Prices a cart against a set of promotion rules.
+
+    Attach it to a ShoppingCart (PromotionEngine.attach) and it follows
+    the cart's add/remove/clear notifications; pricing() returns the
+    current breakdown.
+
+    `category_of(product)` maps a product to the category that category
+    rules match on. Products carry no category themselves, so pass it
+    whenever the rules include category rules.
+    """
+
+    def __init__(self, rules, category_of=default_category):
+        self.category_of = category_of
+        self._states = [_RuleState(rule) for rule in sorted(rules, key=lambda r: -r.priority)]
+        self._by_name = {}
+        self._by_category = {}
+        for state in self._states:
+            key = state.rule.dispatch_key()
+            if key is None:
+                continue
+            if key[0] == 'name':
+                self._by_name.setdefault(key[1], []).append(state)
+            else:
+                self._by_category.setdefault(key[1], []).append(state)
+        self._lines = {}  # line id -> (product, price, matching rule states)
+        self._subtotal = 0.0
+        self._untracked = set()  # line ids whose price can't be watched
+        self._stale = False
+
+    @classmethod
+    def attach(cls, cart, rules, category_of=default_category):
+        engine = cls(rules, category_of)
+        for line_id, product in cart.lines():
+            engine.item_added(line_id, product)
+        cart.subscribe(engine)
+        return engine
+
+    def _matching(self, product):
+        by_name = self._by_name.get(product.name, ())
+        by_category = self._by_category.get(self.category_of(product), ()) if self._by_category else ()
+        if not by_category:
+            return by_name
+        return tuple(by_name) + tuple(by_category)
+
+    # Cart listener interface.
+    def item_added(self, line_id, product):
+        if not watch_chain(product, self):
+            self._untracked.add(line_id)
+        price = product.price
+        states = self._matching(product)
+        self._lines[line_id] = (product, price, states)
+        self._subtotal += price
+        for state in states:
+            state.update(1, price)
+
+    def item_removed(self, line_id, product):
+        _, price, states = self._lines.pop(line_id)
+        self._untracked.discard(line_id)
+        self._subtotal -= price
+        if not self._lines:
+            self._subtotal = 0.0
+        for state in states:
+            state.update(-1, -price)
+
+    def cart_cleared(self):
+        self._lines.clear()
+        self._subtotal = 0.0
+        self._untracked.clear()
+        for state in self._states:
+            state.count = 0
+            state.total = 0.0
+            state.discount = 0.0
+
+    def _invalidate(self):
+        # Called by watched products when their price changes.
+        self._stale = True
+
+    def _reprice(self):
+        self._stale = False
+        lines = list(self._lines.items())
+        self.cart_cleared()
+        for line_id, (product, _, _) in lines:
+            self.item_added(line_id, product)
+        self._subtotal = math.fsum(price for _, price, _ in self._lines.values())
+
+    def pricing(self):
+        """Return {'subtotal', 'discounts': [(rule name, amount)], 'discount', 'total'}."""
+        if self._stale or self._untracked:
+            self._reprice()
+        remaining = self._subtotal
+        applied = []
+        for state in self._states:
+            if state.cart_level:
+                amount = state.rule.discount(0, 0.0, remaining)
+            else:
+                amount = state.discount
+            amount = min(amount, remaining)
+            if amount <= 0:
+                continue
+            applied.append((state.rule.name, amount))
+            remaining -= amount
+            if state.rule.exclusive:
+                break
+        return {
+            "subtotal": self._subtotal,
+            "discounts": applied,
+            "discount": self._subtotal - remaining,
+            "total": remaining,
+        }
+
+    def total(self):
+        return self.pricing()["total"]
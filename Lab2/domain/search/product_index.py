@@ -0,0 +1,222 @@
+"""
+Incrementally maintained search index over product names and descriptions.
+
+The index maps lower-cased word tokens to the keys of the products that
+contain them, keeps the vocabulary sorted for prefix search and keeps
+(price, key) pairs sorted for price-range filters. It can subscribe to a
+ShoppingCart (keys are line ids) or a ProductStore (keys are row indices)
+and then stays in sync as items are added, removed or cleared.
+
+Prices are indexed as they were when the product was added; after changing
+prices in bulk (e.g. ProductStore.scale_prices) call rebuild().
+"""
+import re
+from bisect import bisect_left, insort
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Lower-cased word tokens of a piece of text (None gives none)."""
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class _SortedList:
+    """
+    Sorted list split into bounded chunks, so inserts and removals shift at
+    most a few thousand entries even with millions of values.
+    """
+    _LOAD = 1000
+
+    def __init__(self):
+        self._chunks = []
+        self._maxes = []
+
+    def add(self, value):
+        if not self._chunks:
+            self._chunks.append([value])
+            self._maxes.append(value)
+            return
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._chunks[pos].append(value)
+            self._maxes[pos] = value
+        else:
+            insort(self._chunks[pos], value)
+        chunk = self._chunks[pos]
+        if len(chunk) > 2 * self._LOAD:
+            half = chunk[self._LOAD:]
+            del chunk[self._LOAD:]
+            self._chunks.insert(pos + 1, half)
+            self._maxes[pos] = chunk[-1]
+            self._maxes.insert(pos + 1, half[-1])
+
+    def remove(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            raise ValueError(value)
+        chunk = self._chunks[pos]
+        index = bisect_left(chunk, value)
+        if index == len(chunk) or chunk[index] != value:
+            raise ValueError(value)
+        del chunk[index]
+        if not chunk:
+            del self._chunks[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = chunk[-1]
+
+    def irange(self, low, high):
+        """Yield values v with low <= v < high, in order."""
+        pos = bisect_left(self._maxes, low)
+        if pos == len(self._maxes):
+            return
+        index = bisect_left(self._chunks[pos], low)
+        while pos < len(self._chunks):
+            chunk = self._chunks[pos]
+            stop = bisect_left(chunk, high)
+            yield from chunk[index:stop]
+            if stop < len(chunk):
+                return
+            pos += 1
+            index = 0
+
+    def clear(self):
+        self._chunks = []
+        self._maxes = []
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self._chunks)
+
+
+class ProductSearchIndex:
+    """Token, prefix and price-range search over products."""
+
+    def __init__(self):
+        self._products = {}   # key -> product
+        self._tokens = {}     # key -> (tokens, price)
+        self._postings = {}   # token -> set of keys
+        self._vocabulary = _SortedList()
+        self._prices = _SortedList()
+
+    @classmethod
+    def attach(cls, source):
+        """Index everything in a ShoppingCart or ProductStore and follow its changes."""
+        index = cls()
+        if hasattr(source, 'lines'):
+            for key, product in source.lines():
+                index.add(key, product)
+        else:
+            for row in source:
+                index.add(row.index, row)
+        source.subscribe(index)
+        return index
+
+    def add(self, key, product):
+        """Index a product under `key` (replacing anything already there)."""
+        if key in self._products:
+            self.remove(key)
+        tokens = frozenset(tokenize(product.name) + tokenize(product.description))
+        price = product.price
+        self._products[key] = product
+        self._tokens[key] = (tokens, price)
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                self._vocabulary.add(token)
+            keys.add(key)
+        if price is not None:
+            self._prices.add((price, key))
+
+    def remove(self, key):
+        """Drop the product indexed under `key`."""
+        self._products.pop(key)
+        tokens, price = self._tokens.pop(key)
+        for token in tokens:
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                self._vocabulary.remove(token)
+        if price is not None:
+            self._prices.remove((price, key))
+
+    def clear(self):
+        self._products.clear()
+        self._tokens.clear()
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._prices.clear()
+
+    def rebuild(self):
+        """Re-index every product, e.g. after prices were changed in place."""
+        products = list(self._products.items())
+        self.clear()
+        for key, product in products:
+            self.add(key, product)
+
+    # Listener interface used by ShoppingCart.subscribe / ProductStore.subscribe.
+    def item_added(self, key, product):
+        self.add(key, product)
+
+    def item_removed(self, key, product):
+        self.remove(key)
+
+    def cart_cleared(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self._products)
+
+    def _prefix_keys(self, prefix):
+        prefix = prefix.lower()
+        keys = set()
+        for token in self._vocabulary.irange(prefix, prefix + "\U0010ffff"):
+            keys |= self._postings[token]
+        return keys
+
+    def _price_keys(self, min_price, max_price):
+        low = (min_price if min_price is not None else float('-inf'),)
+        if max_price is None:
+            high = (float('inf'),)
+        else:
+            high = (max_price, float('inf'))
+        return {key for _, key in self._prices.irange(low, high)}
+
+    def search_keys(self, text=None, prefix=None, min_price=None, max_price=None):
+        """
+        Keys of products matching every given criterion.
+
+        `text` matches products containing all of its tokens, `prefix`
+        products with a token starting with it, and the price bounds are
+        inclusive. Text without any word tokens (e.g. "!!") matches nothing.
+        """
+        candidates = []
+        if text:
+            tokens = tokenize(text)
+            if not tokens:
+                return set()
+            for token in tokens:
+                candidates.append(self._postings.get(token, set()))
+        if prefix:
+            candidates.append(self._prefix_keys(prefix))
+        if min_price is not None or max_price is not None:
+            candidates.append(self._price_keys(min_price, max_price))
+        if not candidates:
+            return set(self._products)
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for keys in candidates[1:]:
+            result &= keys
+            if not result:
+                break
+        return result
+
+    def search(self, text=None, prefix=None, min_price=None, max_price=None, limit=None):
+        """Matching products, ordered by key (i.e. insertion order for carts and stores)."""
+        keys = sorted(self.search_keys(text, prefix, min_price, max_price))
+        if limit is not None:
+            keys = keys[:limit]
+        return [self._products[key] for key in keys]
@@ -0,0 +1,302 @@
+"""
+Opt-in call counting and latency histograms for the pattern layers.
+
+Nothing is wrapped until Instrumentation.enable() is called: classes are
+registered up front, and enable() swaps their methods (and property
+getters) for timing wrappers, while disable() puts the originals back. So
+a disabled instrumentation costs exactly nothing on the hot path.
+
+When enabled, every call is counted, but only one call in `sample_every`
+is timed, which keeps the overhead of clock reads and histogram updates
+small under load. Results are exported as Prometheus text (to a file or
+over HTTP at /metrics) or as JSON (/metrics.json).
+"""
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+# Upper bounds (seconds) of the latency buckets: 1 µs to 1 s, plus +Inf.
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+           1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram:
+    """Cumulative-on-export latency histogram with fixed buckets."""
+    __slots__ = ('counts', 'sum', 'count', '_lock')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += seconds
+            self.count += 1
+
+    def quantile(self, q):
+        """Bucket upper bound below which a fraction q of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class _Metric:
+    """
+    Call and error counts for one target.
+
+    Each thread counts calls in its own one-element list, so the hot path
+    never takes a lock; call_count() sums the per-thread tallies.
+    """
+    __slots__ = ('errors', 'histogram', '_local', '_tallies', '_lock')
+
+    def __init__(self):
+        self.errors = 0
+        self.histogram = Histogram()
+        self._local = threading.local()
+        self._tallies = []
+        self._lock = threading.Lock()
+
+    def tally(self):
+        """This thread's call counter, a one-element list."""
+        try:
+            return self._local.tally
+        except AttributeError:
+            tally = self._local.tally = [0]
+            with self._lock:
+                self._tallies.append(tally)
+            return tally
+
+    def call_count(self):
+        with self._lock:
+            return sum(tally[0] for tally in self._tallies)
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+
+class Instrumentation:
+    """
+    Registry of instrumented class members.
+
+    Usage:
+        inst = Instrumentation(sample_every=10)
+        inst.register(ShoppingCart, ['add_item', 'remove_line'])
+        inst.enable()
+        ...
+        inst.write_prometheus('metrics.prom')
+    """
+    def __init__(self, sample_every=10, prefix="shop"):
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self.prefix = prefix
+        self.metrics = {}
+        self._targets = []    # (cls, attribute name)
+        self._originals = {}  # (cls, attribute name) -> original class attribute
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def register(self, cls, names):
+        """Register class members to wrap; properties are timed through their getter."""
+        with self._lock:
+            for name in names:
+                if name not in cls.__dict__:
+                    raise AttributeError(f"{cls.__name__} does not define {name!r}")
+                if (cls, name) not in self._targets:
+                    self._targets.append((cls, name))
+                    self.metrics.setdefault(f"{cls.__name__}.{name}", _Metric())
+            if self.enabled:
+                self._wrap_targets()
+        return self
+
+    def enable(self):
+        with self._lock:
+            self._wrap_targets()
+        return self
+
+    def disable(self):
+        with self._lock:
+            for (cls, name), original in self._originals.items():
+                setattr(cls, name, original)
+            self._originals.clear()
+        return self
+
+    def reset(self):
+        for key in self.metrics:
+            self.metrics[key] = _Metric()
+        if self.enabled:
+            self.disable()
+            self.enable()
+
+    def _wrap_targets(self):
+        for cls, name in self._targets:
+            if (cls, name) in self._originals:
+                continue
+            original = cls.__dict__[name]
+            metric = self.metrics[f"{cls.__name__}.{name}"]
+            if isinstance(original, property):
+                wrapped = property(self._wrap(original.fget, metric), original.fset, original.fdel, original.__doc__)
+            elif isinstance(original, (staticmethod, classmethod)):
+                wrapped = type(original)(self._wrap(original.__func__, metric))
+            else:
+                wrapped = self._wrap(original, metric)
+            self._originals[(cls, name)] = original
+            setattr(cls, name, wrapped)
+
+    def _wrap(self, func, metric):
+        every = self.sample_every
+        local = metric._local
+        histogram = metric.histogram
+
+        def wrapper(*args, **kwargs):
+            try:
+                tally = local.tally
+            except AttributeError:
+                tally = metric.tally()
+            tally[0] += 1
+            if tally[0] % every:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                metric.record_error()
+                raise
+            finally:
+                histogram.observe(perf_counter() - start)
+
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def snapshot(self):
+        """Per-target counts and sampled latency summary, as a dict."""
+        result = {}
+        for target, metric in self.metrics.items():
+            histogram = metric.histogram
+            result[target] = {
+                "calls": metric.call_count(),
+                "sampled": histogram.count,
+                "errors": metric.errors,
+                "mean_seconds": histogram.sum / histogram.count if histogram.count else 0.0,
+                "p50_seconds": histogram.quantile(0.5),
+                "p99_seconds": histogram.quantile(0.99),
+                "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram.counts)),
+            }
+        return result
+
+    def to_json(self):
+        return json.dumps({"sample_every": self.sample_every, "targets": self.snapshot()}, indent=2)
+
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        calls = f"{self.prefix}_calls_total"
+        errors = f"{self.prefix}_sampled_errors_total"
+        latency = f"{self.prefix}_call_latency_seconds"
+        lines = [
+            f"# HELP {calls} Calls to instrumented members.",
+            f"# TYPE {calls} counter",
+        ]
+        for target, metric in self.metrics.items():
+            lines.append(f'{calls}{{target="{target}"}} {metric.call_count()}')
+        lines += [f"# HELP {errors} Exceptions raised by sampled calls.", f"# TYPE {errors} counter"]
+        for target, metric in self.metrics.items():
+            lines.append(f'{errors}{{target="{target}"}} {metric.errors}')
+        lines += [f"# HELP {latency} Latency of sampled calls.", f"# TYPE {latency} histogram"]
+        for target, metric in self.metrics.items():
+            histogram = metric.histogram
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(f'{latency}_bucket{{target="{target}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{latency}_bucket{{target="{target}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{latency}_sum{{target="{target}"}} {histogram.sum:.9f}')
+            lines.append(f'{latency}_count{{target="{target}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write the Prometheus text atomically, e.g. for a node_exporter textfile collector."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def serve(self, host="127.0.0.1", port=9100):
+        """
+        Serve /metrics (Prometheus text) and /metrics.json from a daemon thread.
+
+        Returns the server; call shutdown() on it to stop.
+        """
+        instrumentation = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = instrumentation.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = instrumentation.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def register_default_targets(instrumentation):
+    """Register the client, facade, cart, adapter, decorator and Order entry points."""
+    from client.shopping_cart_client import ShoppingCartClient
+    from domain.models.order import Order
+    from domain.models.shopping_cart import ShoppingCart
+    from patterns.adapter.external_product_adapter import ExternalProductAdapter
+    from patterns.decorator.product_decorator import DiscountedProductDecorator, ProductDecorator
+    from patterns.facade.shopping_facade import ShoppingFacade
+
+    instrumentation.register(ShoppingCartClient, [
+        'add_product', 'add_external_product', 'add_external_products',
+        'add_discounted_product', 'view_cart', 'create_order', 'clear_cart'])
+    instrumentation.register(ShoppingFacade, [
+        'add_product', 'add_external_product', 'add_external_products',
+        'add_discounted_product', 'view_cart', 'create_order', 'clear_cart'])
+    instrumentation.register(ShoppingCart, [
+        'add_item', 'remove_item', 'remove_line', 'view_cart', 'snapshot', 'clear_cart', 'total_price'])
+    instrumentation.register(ExternalProductAdapter, ['to_product', 'to_products'])
+    instrumentation.register(ProductDecorator, ['price'])
+    instrumentation.register(DiscountedProductDecorator, ['price'])
+    instrumentation.register(Order, ['__init__'])
+    return instrumentation
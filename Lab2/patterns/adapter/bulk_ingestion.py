@@ -0,0 +1,222 @@
+"""
+Streaming bulk ingestion of external vendor feeds.
+
+Vendor feeds are JSONL or CSV files of `title/cost/info/date` records. The
+pipeline reads them in fixed-size chunks of raw lines, parses each chunk
+(optionally in a process pool), adapts the valid records in batches through
+ExternalProductAdapter and hands the products to a cart or catalog. Rows that
+cannot be parsed or adapted go to a quarantine sink instead of raising, so
+memory stays bounded by chunk_size * max_pending whatever the feed size.
+Records are validated once, while parsing.
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from patterns.adapter.external_product_adapter import ExternalProductAdapter
+
+CSV_FIELDS = ('title', 'cost', 'info', 'date')
+
+
+class QuarantineSink:
+    """
+    Collects rejected rows.
+
+    Keeps at most `max_records` rows in memory (the count is always exact)
+    and, if `path` is given, appends every rejected row to it as JSONL.
+    """
+
+    def __init__(self, path=None, max_records=1000):
+        self.records = deque(maxlen=max_records)
+        self.count = 0
+        self._file = open(path, 'a', encoding='utf-8') if path else None
+
+    def add(self, line_no, raw, reason):
+        self.count += 1
+        self.records.append((line_no, raw, reason))
+        if self._file is not None:
+            self._file.write(json.dumps({"line": line_no, "reason": reason, "raw": raw}) + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class IngestionStats:
+    """Throughput counters for one ingestion run."""
+
+    def __init__(self):
+        self.records = 0
+        self.accepted = 0
+        self.quarantined = 0
+        self.chunks = 0
+        self._start = time.perf_counter()
+        self.elapsed = 0.0
+
+    def update(self, records, accepted, quarantined):
+        self.records += records
+        self.accepted += accepted
+        self.quarantined += quarantined
+        self.chunks += 1
+        self.elapsed = time.perf_counter() - self._start
+
+    @property
+    def records_per_sec(self):
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"{self.records} records ({self.accepted} accepted, {self.quarantined} quarantined) "
+                f"in {self.elapsed:.2f}s - {self.records_per_sec:,.0f} records/sec")
+
+
+def read_chunks(path, chunk_size=10_000, fmt=None):
+    """
+    Yield (first_line_no, lines) chunks of raw lines from a feed file.
+
+    For CSV the header line is consumed first and not included in any chunk.
+    Quoted fields spanning several lines are not supported.
+    """
+    fmt = fmt or _detect_format(path)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        line_no = 1
+        if fmt == 'csv':
+            f.readline()
+            line_no = 2
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            yield line_no, lines
+            line_no += len(lines)
+
+
+def parse_chunk(first_line_no, lines, fmt, header=None):
+    """
+    Parse and validate one chunk of raw lines.
+
+    Returns (records, rejected) where rejected holds (line_no, raw, reason).
+    Top-level so it can run in a worker process.
+    """
+    records = []
+    rejected = []
+    if fmt == 'csv':
+        rows = csv.reader(lines)
+        fields = header or CSV_FIELDS
+        for offset, row in enumerate(rows):
+            raw = lines[offset]
+            if not row:
+                continue
+            record = dict(zip(fields, row))
+            reason = ExternalProductAdapter.validate(record)
+            if reason is None:
+                records.append(record)
+            else:
+                rejected.append((first_line_no + offset, raw.rstrip('\r\n'), reason))
+        return records, rejected
+    for offset, raw in enumerate(lines):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            rejected.append((first_line_no + offset, raw, f"invalid JSON: {e}"))
+            continue
+        reason = ExternalProductAdapter.validate(record)
+        if reason is None:
+            records.append(record)
+        else:
+            rejected.append((first_line_no + offset, raw, reason))
+    return records, rejected
+
+
+def _detect_format(path):
+    return 'csv' if os.path.splitext(path)[1].lower() == '.csv' else 'jsonl'
+
+
+def _read_csv_header(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return tuple(next(csv.reader(f), CSV_FIELDS))
+
+
+class BulkIngestionPipeline:
+    """
+    Generator-based feed ingestion built on ExternalProductAdapter.
+
+    `workers=0` parses in the calling process; `workers>0` parses chunks in a
+    process pool with at most `max_pending` chunks in flight. close() (or
+    leaving a `with` block) closes the quarantine sink.
+    """
+
+    def __init__(self, chunk_size=10_000, workers=0, max_pending=None, quarantine=None, interner=None):
+        self.chunk_size = chunk_size
+        self.interner = interner
+        self.workers = workers
+        self.max_pending = max_pending or max(2, 2 * workers)
+        self.quarantine = quarantine if quarantine is not None else QuarantineSink()
+        self.stats = IngestionStats()
+
+    def _parsed_chunks(self, path, fmt):
+        header = _read_csv_header(path) if fmt == 'csv' else None
+        chunks = read_chunks(path, self.chunk_size, fmt)
+        if not self.workers:
+            for first_line_no, lines in chunks:
+                yield parse_chunk(first_line_no, lines, fmt, header)
+            return
+        # Keep a bounded window of submitted chunks so a huge feed is never
+        # read into memory ahead of the consumers.
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for first_line_no, lines in chunks:
+                pending.append(pool.submit(parse_chunk, first_line_no, lines, fmt, header))
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def batches(self, path, fmt=None):
+        """Yield lists of adapted Products, one per chunk of the feed."""
+        fmt = fmt or _detect_format(path)
+        self.stats = IngestionStats()
+        for records, rejected in self._parsed_chunks(path, fmt):
+            for line_no, raw, reason in rejected:
+                self.quarantine.add(line_no, raw, reason)
+            products = ExternalProductAdapter.to_products(records, interner=self.interner, validated=True)
+            self.stats.update(len(records) + len(rejected), len(products), len(rejected))
+            yield products
+
+    def ingest(self, path, target, fmt=None, progress=None):
+        """
+        Stream a feed into `target` (a ShoppingCart, ProductStore or anything
+        with add_item/add_items) and return the IngestionStats.
+        """
+        add_items = getattr(target, 'add_items', None)
+        for products in self.batches(path, fmt):
+            if add_items is not None:
+                add_items(products)
+            else:
+                for product in products:
+                    target.add_item(product)
+            if progress is not None:
+                progress(self.stats)
+        return self.stats
+
+    def close(self):
+        self.quarantine.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
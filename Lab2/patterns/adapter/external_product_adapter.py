@@ -1,13 +1,73 @@
+import math
+from numbers import Real
+
 from domain.models.product import Product
 
 class ExternalProductAdapter:
-    def __init__(self, external_data):
+    REQUIRED_FIELDS = ('title', 'cost')
+
+    def __init__(self, external_data, interner=None):
         self.external_data = external_data
+        self.interner = interner
 
     def to_product(self):
+        if self.interner is not None:
+            return self.interner.make_product(
+                self.external_data['title'],
+                self.external_data['cost'],
+                self.external_data.get('info') or 'No description',
+                self.external_data.get('date')
+            )
         return Product(
             name=self.external_data['title'],
             price=self.external_data['cost'],
             date=self.external_data.get('date'),
-            description=self.external_data.get('info', 'No description')
-        )
\ No newline at end of file
+            description=self.external_data.get('info') or 'No description'
+        )
+
+    @classmethod
+    def validate(cls, external_data):
+        """Return a reason string if the record cannot be adapted, else None."""
+        if not isinstance(external_data, dict):
+            return "record is not an object"
+        for field in cls.REQUIRED_FIELDS:
+            if external_data.get(field) in (None, ''):
+                return f"missing '{field}'"
+        cost = external_data['cost']
+        if isinstance(cost, bool):
+            return f"invalid cost {cost!r}"
+        try:
+            value = cost if isinstance(cost, Real) else float(cost)
+        except (TypeError, ValueError):
+            return f"invalid cost {cost!r}"
+        if not math.isfinite(value):
+            return f"invalid cost {cost!r}"
+        return None
+
+    @classmethod
+    def to_products(cls, records, on_invalid=None, interner=None, validated=False):
+        """
+        Adapt a batch of external records.
+
+        Records that fail validation are passed to `on_invalid(record, reason)`
+        and skipped instead of raising; pass validated=True for records that
+        already went through validate(). With an `interner`, products share
+        their name/description/date data.
+        """
+        make = interner.make_product if interner is not None else Product
+        products = []
+        for record in records:
+            if not validated:
+                reason = cls.validate(record)
+                if reason is not None:
+                    if on_invalid is not None:
+                        on_invalid(record, reason)
+                    continue
+            cost = record['cost']
+            products.append(make(
+                record['title'],
+                cost if isinstance(cost, Real) else float(cost),
+                record.get('info') or 'No description',
+                record.get('date') or None
+            ))
+        return products
@@ -1,3 +1,6 @@
+from domain.models.product import notify_watchers, watch_chain
+
+
 class ProductDecorator:
     """Base decorator class for Product objects."""
     def __init__(self, product):
@@ -19,6 +22,10 @@ class ProductDecorator:
     def date(self):
         return self._product.date
 
+    def compile(self):
+        """Flatten this decorator chain into a CompiledProduct."""
+        return CompiledProduct(self)
+
     def __str__(self):
         return str(self._product)
 
@@ -30,14 +37,81 @@ class DiscountedProductDecorator(ProductDecorator):
     """Decorator that adds discount functionality to a product."""
     def __init__(self, product, discount_percentage):
         super().__init__(product)
-        self.discount_percentage = discount_percentage  # e.g., 0.20 for 20%
+        self._discount_percentage = discount_percentage  # e.g., 0.20 for 20%
+
+    @property
+    def discount_percentage(self):
+        return self._discount_percentage
+
+    @discount_percentage.setter
+    def discount_percentage(self, value):
+        self._discount_percentage = value
+        notify_watchers(self)
 
     @property
     def price(self):
         """Calculate discounted price."""
-        return self._product.price * (1 - self.discount_percentage)
+        return self._product.price * (1 - self._discount_percentage)
 
     def __str__(self):
         original_price = self._product.price
         discounted_price = self.price
-        return f"{self._product} - {self.discount_percentage*100:.0f}% Discount: ${discounted_price:.2f} (was ${original_price:.2f})"
\ No newline at end of file
+        return f"{self._product} - {self.discount_percentage*100:.0f}% Discount: ${discounted_price:.2f} (was ${original_price:.2f})"
+
+
+class CompiledProduct:
+    """
+    A decorator chain flattened into plain attributes.
+
+    The effective name, price, description, date and string form are computed
+    once from the chain, so reading `price` costs the same as on a raw Product
+    however many decorators are stacked. The compiled product watches every
+    layer of the chain and recomputes itself when the base price or a
+    decorator's pricing (e.g. a discount percentage) changes, then notifies
+    its own watchers. A base that cannot be watched (a ProductStore row) is
+    not tracked.
+    """
+    def __init__(self, product):
+        self._source = product
+        watch_chain(product, self)
+        self._refresh()
+
+    def _refresh(self):
+        source = self._source
+        self.name = source.name
+        self.price = source.price
+        self.description = source.description
+        self.date = source.date
+        self._str = str(source)
+
+    def _invalidate(self):
+        self._refresh()
+        notify_watchers(self)
+
+    @property
+    def source(self):
+        """The decorator chain this product was compiled from."""
+        return self._source
+
+    def get_price(self):
+        return self.price
+
+    def get_name(self):
+        return self.name
+
+    def get_description(self):
+        return self.description
+
+    def get_date(self):
+        return self.date
+
+    def __str__(self):
+        return self._str
+
+    def __repr__(self):
+        return f"CompiledProduct({self._source!r})"
+
+
+def compile_price_chain(product):
+    """Flatten any product or decorator chain into a CompiledProduct."""
+    return CompiledProduct(product)
@@ -0,0 +1,87 @@
+import asyncio
+from functools import partial
+
+from domain.models.order import Order
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from patterns.adapter.external_product_adapter import ExternalProductAdapter
+from patterns.decorator.product_decorator import DiscountedProductDecorator
+
+
+class AsyncShoppingFacade:
+    """
+    Asyncio variant of ShoppingFacade for serving many sessions concurrently.
+
+    Each facade owns one cart (by default an independent one, not the
+    process-wide singleton). Blocking work - catalog lookups, order
+    persistence and external adaptation - runs in `executor` (the loop's
+    default thread pool if None) so it never blocks the event loop. Methods
+    return result dicts instead of printing.
+
+    `backend` is optional and may provide:
+      - load_product(product_id) -> Product   (catalog lookup)
+      - save_order(order)                       (persistence)
+    """
+
+    def __init__(self, cart=None, backend=None, executor=None):
+        self.cart = cart if cart is not None else ShoppingCart.new_instance()
+        self.backend = backend
+        self._executor = executor
+        self._lock = asyncio.Lock()
+
+    async def _offload(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _add(self, product):
+        async with self._lock:
+            line_id = self.cart.add_item(product)
+            total = self.cart.total_price()
+        return {"ok": True, "line_id": line_id, "product": product, "total": total}
+
+    async def add_product(self, name, price, description=None, date=None):
+        """Add a product to the cart."""
+        return await self._add(Product(name, price, description, date))
+
+    async def add_catalog_product(self, product_id):
+        """Look a product up in the backend catalog and add it to the cart."""
+        if self.backend is None or not hasattr(self.backend, 'load_product'):
+            return {"ok": False, "error": "no catalog backend configured"}
+        try:
+            product = await self._offload(self.backend.load_product, product_id)
+        except KeyError:
+            return {"ok": False, "error": f"product {product_id} not found"}
+        return await self._add(product)
+
+    async def add_external_product(self, external_data):
+        """Adapt an external record off the loop and add it (uses Adapter internally)."""
+        reason = ExternalProductAdapter.validate(external_data)
+        if reason is not None:
+            return {"ok": False, "error": reason}
+        product = await self._offload(ExternalProductAdapter(external_data).to_product)
+        return await self._add(product)
+
+    async def add_discounted_product(self, name, price, discount_percentage, description=None, date=None):
+        """Add a discounted product (uses Decorator internally)."""
+        product = Product(name, price, description, date)
+        return await self._add(DiscountedProductDecorator(product, discount_percentage / 100.0))
+
+    async def view_cart(self):
+        """Return the cart lines and total."""
+        async with self._lock:
+            return {"items": self.cart.view_cart(), "total": self.cart.total_price()}
+
+    async def create_order(self, shipping_type="standard"):
+        """Create an order and persist it through the backend, if any."""
+        async with self._lock:
+            if not len(self.cart):
+                return {"ok": False, "error": "Cart is empty! Cannot create an order."}
+            order = Order(self.cart.snapshot(), shipping_type)
+        if self.backend is not None and hasattr(self.backend, 'save_order'):
+            await self._offload(self.backend.save_order, order)
+        return {"ok": True, "order": order, "total": order.total_price}
+
+    async def clear_cart(self):
+        async with self._lock:
+            self.cart.clear_cart()
+        return {"ok": True}
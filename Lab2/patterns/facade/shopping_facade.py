@@ -5,8 +5,8 @@ class ShoppingFacade:
     Facade pattern: Provides a simplified interface to the complex
     shopping cart subsystem, hiding the complexity of individual components.
     """
-    def __init__(self):
-        self.client = ShoppingCartClient()
+    def __init__(self, cart=None, events=None, order_log=None):
+        self.client = ShoppingCartClient(cart, events, order_log)
 
     def add_product(self, name, price, description=None, date=None):
         """Simplified method to add a product."""
@@ -16,6 +16,10 @@ class ShoppingFacade:
         """Simplified method to add an external product (uses Adapter internally)."""
         self.client.add_external_product(external_data)
 
+    def add_external_products(self, records):
+        """Simplified method to add a batch of external products (uses Adapter internally)."""
+        return self.client.add_external_products(records)
+
     def add_discounted_product(self, name, price, discount_percentage, description=None, date=None):
         """Simplified method to add a discounted product (uses Decorator internally)."""
         self.client.add_discounted_product(name, price, discount_percentage, date, description)
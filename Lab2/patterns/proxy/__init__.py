@@ -1,4 +1,5 @@
-from patterns.proxy.product_proxy import ProductProxy
+from patterns.proxy.product_proxy import ProductProxy, LazyProductProxy
+from patterns.proxy.product_cache import LRUProductCache, shared_product_cache
 
-__all__ = ['ProductProxy']
+__all__ = ['ProductProxy', 'LazyProductProxy', 'LRUProductCache', 'shared_product_cache']
 
@@ -1,4 +1,7 @@
+import threading
+
 from domain.models.product import Product
+from patterns.proxy.product_cache import shared_product_cache
 
 
 class ProductProxy:
@@ -7,69 +10,113 @@ class ProductProxy:
     This proxy can add additional functionality like access control,
     lazy loading, or caching without modifying the original Product class.
     """
-    
+
+    # Access counters are guarded by a small pool of striped locks rather than
+    # one lock per proxy, so counting stays exact under many threads without
+    # adding a lock object to every proxy.
+    _count_locks = tuple(threading.Lock() for _ in range(64))
+
     def __init__(self, product, access_level="public"):
         self._product = product
         self._access_level = access_level
         self._access_count = 0
-    
+
+    def _get_product(self):
+        """Return the real product behind the proxy."""
+        return self._product
+
+    def _record_access(self):
+        with self._count_locks[(id(self) >> 4) % len(self._count_locks)]:
+            self._access_count += 1
+
     @property
     def name(self):
         """Proxy access to product name with access tracking."""
-        self._access_count += 1
-        return self._product.name
-    
+        self._record_access()
+        return self._get_product().name
+
     @property
     def price(self):
         """Proxy access to product price with access tracking."""
-        self._access_count += 1
+        self._record_access()
         if self._access_level == "restricted":
             # In a real scenario, you might check permissions here
             return None
-        return self._product.price
-    
+        return self._get_product().price
+
     @property
     def description(self):
         """Proxy access to product description."""
-        self._access_count += 1
-        return self._product.description
-    
+        self._record_access()
+        return self._get_product().description
+
     @property
     def date(self):
         """Proxy access to product date."""
-        self._access_count += 1
-        return self._product.date
-    
+        self._record_access()
+        return self._get_product().date
+
     def get_price(self):
         """Get price through proxy."""
         return self.price
-    
+
     def get_name(self):
         """Get name through proxy."""
         return self.name
-    
+
     def get_description(self):
         """Get description through proxy."""
         return self.description
-    
+
     def get_date(self):
         """Get date through proxy."""
         return self.date
-    
+
     def get_access_count(self):
         """Get the number of times this product was accessed."""
         return self._access_count
-    
+
     def __str__(self):
         """String representation through proxy."""
-        return f"[PROXY] {self._product}"
-    
+        return f"[PROXY] {self._get_product()}"
+
     def __repr__(self):
         """Representation through proxy."""
-        return f"ProductProxy({repr(self._product)}, access_level='{self._access_level}')"
-    
+        return f"ProductProxy({repr(self._get_product())}, access_level='{self._access_level}')"
+
     # Allow proxy to be used in price calculations
     def __getattr__(self, name):
         """Delegate any other attribute access to the underlying product."""
-        return getattr(self._product, name)
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self._get_product(), name)
+
+
+class LazyProductProxy(ProductProxy):
+    """
+    Virtual proxy that holds only a catalog product id.
+
+    The product is loaded from the catalog on first access and kept in a
+    shared, size-bounded LRU cache, so carts can reference millions of
+    catalog products without loading them all. An evicted product is simply
+    reloaded on the next access.
+    """
 
+    def __init__(self, product_id, catalog, access_level="public", cache=None):
+        self._product_id = product_id
+        self._catalog = catalog
+        self._cache = cache if cache is not None else shared_product_cache
+        self._access_level = access_level
+        self._access_count = 0
+
+    @property
+    def product_id(self):
+        return self._product_id
+
+    def _get_product(self):
+        catalog = self._catalog
+        return self._cache.get_or_load((catalog.cache_token, self._product_id),
+                                       lambda key: catalog.load(key[1]))
+
+    def __repr__(self):
+        return f"LazyProductProxy(product_id={self._product_id}, access_level='{self._access_level}')"
@@ -0,0 +1,77 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from domain.models.shopping_cart import ShoppingCart
+from patterns.adapter.bulk_ingestion import BulkIngestionPipeline, QuarantineSink
+
+JSONL_LINES = [
+    json.dumps({"title": "Monitor", "cost": 399.99, "info": "27-inch", "date": "15/11/2024"}),
+    "{not json",
+    json.dumps({"title": "Mouse", "cost": "25.5"}),
+    "",
+    json.dumps({"title": "Cable", "cost": "cheap"}),
+    json.dumps({"cost": 10}),
+    json.dumps({"title": "Pad", "cost": 5}),
+]
+
+
+class BulkIngestionTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, lines):
+        path = os.path.join(self.dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def ingest(self, path, **options):
+        cart = ShoppingCart.new_instance()
+        with BulkIngestionPipeline(chunk_size=2, **options) as pipeline:
+            stats = pipeline.ingest(path, cart)
+        return cart, stats, pipeline.quarantine
+
+    def test_bad_rows_are_quarantined_with_line_numbers(self):
+        cart, stats, quarantine = self.ingest(self.write("feed.jsonl", JSONL_LINES))
+        self.assertEqual([product.name for product in cart.view_cart()], ["Monitor", "Mouse", "Pad"])
+        self.assertAlmostEqual(cart.total_price(), 399.99 + 25.5 + 5)
+        self.assertEqual((stats.records, stats.accepted, stats.quarantined), (6, 3, 3))
+        self.assertEqual([line_no for line_no, _, _ in quarantine.records], [2, 5, 6])
+        self.assertEqual(quarantine.records[1][2], "invalid cost 'cheap'")
+
+    def test_csv_feed(self):
+        path = self.write("feed.csv", ["title,cost,info,date", "Monitor,399.99,27-inch,15/11/2024",
+                                       "Cable,,,", "Pad,5,,"])
+        cart, stats, quarantine = self.ingest(path)
+        self.assertEqual([product.name for product in cart.view_cart()], ["Monitor", "Pad"])
+        self.assertEqual(list(quarantine.records), [(3, "Cable,,,", "missing 'cost'")])
+
+    def test_process_pool_gives_the_same_result(self):
+        path = self.write("feed.jsonl", JSONL_LINES * 5)
+        serial, serial_stats, _ = self.ingest(path)
+        pooled, pooled_stats, _ = self.ingest(path, workers=2)
+        self.assertEqual([p.name for p in pooled.view_cart()], [p.name for p in serial.view_cart()])
+        self.assertEqual(pooled_stats.quarantined, serial_stats.quarantined)
+
+    def test_quarantine_file_keeps_every_row(self):
+        quarantine_path = os.path.join(self.dir.name, "rejected.jsonl")
+        with QuarantineSink(quarantine_path, max_records=1) as quarantine:
+            self.ingest(self.write("feed.jsonl", JSONL_LINES), quarantine=quarantine)
+        self.assertEqual(quarantine.count, 3)
+        self.assertEqual(len(quarantine.records), 1)
+        with open(quarantine_path, encoding='utf-8') as f:
+            self.assertEqual([json.loads(line)["line"] for line in f], [2, 5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import threading
+import unittest
+
+from domain.models.cart_registry import CartRegistry
+from domain.models.product import Product
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CartRegistryTest(unittest.TestCase):
+    def test_sessions_get_independent_carts(self):
+        registry = CartRegistry(shards=4)
+        registry.add_item("alice", Product("Laptop", 1000))
+        registry.add_item("bob", Product("Mouse", 25))
+        registry.add_item("bob", Product("Pad", 5))
+        self.assertEqual(registry.total_price("alice"), 1000)
+        self.assertEqual(registry.total_price("bob"), 30)
+        self.assertEqual(registry.stats()["lines"], 3)
+
+    def test_reads_do_not_create_carts(self):
+        registry = CartRegistry()
+        self.assertEqual(registry.total_price("nobody"), 0)
+        with self.assertRaises(KeyError):
+            registry.remove_line("nobody", 0)
+        self.assertNotIn("nobody", registry)
+        self.assertEqual(len(registry), 0)
+
+    def test_idle_carts_expire(self):
+        clock = FakeClock()
+        registry = CartRegistry(ttl=60, clock=clock)
+        registry.add_item("alice", Product("Laptop", 1000))
+        clock.now = 30
+        registry.add_item("bob", Product("Mouse", 25))
+        clock.now = 70
+        self.assertEqual(registry.evict_expired(), 1)
+        self.assertNotIn("alice", registry)
+        self.assertIn("bob", registry)
+
+    def test_lru_cap_per_shard(self):
+        registry = CartRegistry(shards=1, max_carts=2)
+        for session_id in ("a", "b", "c"):
+            registry.add_item(session_id, Product("Item", 1))
+        self.assertEqual(len(registry), 2)
+        self.assertNotIn("a", registry)
+        self.assertEqual(registry.stats()["evictions"], 1)
+
+    def test_concurrent_adds_are_not_lost(self):
+        registry = CartRegistry(shards=4)
+        product = Product("Item", 1)
+
+        def shop(session_id):
+            for _ in range(500):
+                registry.add_item(session_id, product)
+
+        threads = [threading.Thread(target=shop, args=(i % 3,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = registry.stats()
+        self.assertEqual(stats["live_carts"], 3)
+        self.assertEqual(stats["lines"], 3000)
+        self.assertGreater(stats["memory_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import random
+import unittest
+
+from domain.models.cart_snapshot import PersistentLineMap
+from domain.models.order import Order
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+
+
+class CartSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.cart = ShoppingCart.new_instance()
+
+    def test_snapshot_is_unaffected_by_later_changes(self):
+        laptop = Product("Laptop", 1000)
+        mouse = Product("Mouse", 25)
+        self.cart.add_item(laptop)
+        mouse_line = self.cart.add_item(mouse)
+        snapshot = self.cart.snapshot()
+        self.cart.remove_line(mouse_line)
+        self.cart.add_item(Product("Pad", 5))
+        self.cart.clear_cart()
+        self.assertEqual(list(snapshot), [laptop, mouse])
+        self.assertEqual(len(snapshot), 2)
+        self.assertIn(mouse, snapshot)
+        self.assertIs(snapshot.get_line(mouse_line), mouse)
+        self.assertEqual(snapshot.total(), 1025)
+
+    def test_diff_lists_only_changed_lines(self):
+        for i in range(100):
+            self.cart.add_item(Product(f"Item {i}", i))
+        old = self.cart.snapshot()
+        removed = self.cart.remove_line(10)
+        added_line = self.cart.add_item(Product("New", 1))
+        diff = old.diff(self.cart.snapshot())
+        self.assertEqual(diff["removed"], [(10, removed)])
+        self.assertEqual([line_id for line_id, _ in diff["added"]], [added_line])
+        self.assertEqual(diff["changed"], [])
+
+    def test_order_from_snapshot(self):
+        self.cart.add_item(Product("Laptop", 1000))
+        order = Order(self.cart.snapshot(), "express")
+        self.cart.clear_cart()
+        self.assertEqual(order.total_price, 1000)
+        self.assertEqual(len(order.items), 1)
+
+    def test_persistent_map_matches_a_dict(self):
+        rng = random.Random(3)
+        versions = []
+        current = PersistentLineMap()
+        expected = {}
+        for _ in range(2000):
+            key = rng.randrange(300)
+            if key in expected and rng.random() < 0.5:
+                current = current.delete(key)
+                del expected[key]
+            else:
+                current = current.set(key, key * 2)
+                expected[key] = key * 2
+            versions.append((current, dict(expected)))
+        for version, contents in versions[::97]:
+            self.assertEqual(dict(version.items()), contents)
+            self.assertEqual(len(version), len(contents))
+
+
+if __name__ == "__main__":
+    unittest.main()
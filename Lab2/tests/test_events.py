@@ -0,0 +1,50 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import os
+import tempfile
+import unittest
+
+from client.events import BufferedFileEventSink, Event, RingBufferEventSink
+
+
+class CountingTemplate:
+    """A callable template that counts how often it is rendered."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, name):
+        self.calls += 1
+        return f"Added {name}."
+
+
+class EventSinkTest(unittest.TestCase):
+    def test_ring_buffer_renders_on_read(self):
+        template = CountingTemplate()
+        sink = RingBufferEventSink(capacity=2)
+        for name in ("a", "b", "c"):
+            sink.emit(Event('product_added', template, name))
+        self.assertEqual(template.calls, 0)
+        self.assertEqual(sink.render(), ["Added b.", "Added c."])
+
+    def test_buffered_file_renders_on_flush(self):
+        template = CountingTemplate()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.log")
+            with BufferedFileEventSink(path, batch_size=3) as sink:
+                sink.emit(Event('product_added', template, "a"))
+                sink.emit(Event('product_added', template, "b"))
+                self.assertEqual(template.calls, 0)
+                sink.emit(Event('cart_cleared', "Shopping cart cleared."))
+                self.assertEqual(template.calls, 2)
+                sink.emit(Event('product_added', template, "c"))
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(f.read().splitlines(),
+                                 ["Added a.", "Added b.", "Shopping cart cleared.", "Added c."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from domain.models.order import Order
+from domain.models.product import Product
+from domain.persistence.order_log import OrderLog, read_records, record_to_order
+
+LAB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_order(*prices):
+    return Order([Product(f"Item {i}", price) for i, price in enumerate(prices)], "standard")
+
+
+class OrderLogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "orders.log")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_replay_after_close(self):
+        with OrderLog(self.path, durability="write") as log:
+            self.assertEqual(log.append(make_order(10, 20)), 0)
+            self.assertEqual(log.append_many([make_order(1), make_order(2, 3)]), [1, 2])
+        with OrderLog(self.path) as log:
+            self.assertEqual(log.recovered, 3)
+            records = list(log.replay())
+            self.assertEqual(log.append(make_order(5)), 3)
+        self.assertEqual([record["id"] for record in records], [0, 1, 2])
+        order = record_to_order(records[0])
+        self.assertEqual([item.price for item in order.items], [10, 20])
+        self.assertEqual(order.order_type, "standard")
+
+    def test_torn_tail_is_truncated_on_open(self):
+        with OrderLog(self.path, durability="none") as log:
+            log.append_many([make_order(1), make_order(2)])
+        with open(self.path, "ab") as f:
+            f.write(b"\x10\x00\x00\x00garbage")
+        with OrderLog(self.path) as log:
+            self.assertEqual(log.recovered, 2)
+        self.assertEqual(len(list(read_records(self.path))), 2)
+
+    def test_unclosed_log_is_written_at_exit(self):
+        script = (
+            "from domain.models.order import Order\n"
+            "from domain.models.product import Product\n"
+            "from domain.persistence.order_log import OrderLog\n"
+            f"log = OrderLog({self.path!r}, durability='none')\n"
+            "log.append_many([Order([Product('Item', i)], 'standard') for i in range(100)])\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=LAB_DIR, check=True)
+        self.assertEqual(len(list(read_records(self.path))), 100)
+
+    def test_append_after_close_fails(self):
+        log = OrderLog(self.path)
+        log.close()
+        with self.assertRaises(ValueError):
+            log.append(make_order(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from domain.builder.product_builder import ProductBuildError, ProductBuilder, parse_date
+from domain.models.product_flyweight import ProductInterner
+
+
+class BuildManyTest(unittest.TestCase):
+    def test_builds_every_row(self):
+        products = ProductBuilder.build_many({
+            "name": ["Laptop", "Mouse"],
+            "price": [999.99, 25.99],
+            "date": ["1/2/2024", "27/10/2024"],
+        })
+        self.assertEqual([(p.name, p.price, p.date) for p in products],
+                         [("Laptop", 999.99, "01/02/2024"), ("Mouse", 25.99, "27/10/2024")])
+
+    def test_reports_every_bad_row(self):
+        with self.assertRaises(ProductBuildError) as caught:
+            ProductBuilder.build_many({
+                "name": ["Laptop", "", "Mouse", "Pad"],
+                "price": [999.99, 10, None, 5],
+                "date": [None, None, None, "31/02/2024"],
+            })
+        error = caught.exception
+        self.assertEqual([(i, field) for i, field, _ in error.errors], [(1, 'name'), (2, 'price'), (3, 'date')])
+        self.assertEqual([p.name for p in error.products], ["Laptop"])
+
+    @unittest.skipIf(np is None, "needs numpy")
+    def test_structured_array_input(self):
+        data = np.array([("Laptop", 999.99), ("Mouse", np.nan)], dtype=[("name", "U10"), ("price", "f8")])
+        with self.assertRaises(ProductBuildError) as caught:
+            ProductBuilder.build_many(data)
+        self.assertEqual(caught.exception.errors[0][:2], (1, 'price'))
+        self.assertEqual(caught.exception.products[0].price, 999.99)
+
+    def test_mismatched_columns(self):
+        with self.assertRaises(ValueError):
+            ProductBuilder.build_many({"name": ["Laptop"], "price": [1, 2]})
+
+    def test_dates_are_parsed_once(self):
+        parse_date.cache_clear()
+        ProductBuilder.build_many({"name": ["A"] * 100, "price": [1] * 100, "date": ["27/10/2024"] * 100})
+        self.assertEqual(parse_date.cache_info().misses, 1)
+
+    def test_interned_products_share_data(self):
+        interner = ProductInterner()
+        products = ProductBuilder.build_many({"name": ["Cable"] * 3, "price": [1, 2, 3]}, interner=interner)
+        self.assertEqual(len(interner), 1)
+        self.assertEqual([p.price for p in products], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
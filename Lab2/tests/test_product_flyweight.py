@@ -0,0 +1,56 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import gc
+import pickle
+import unittest
+
+from domain.models.product import Product
+from domain.models.product_flyweight import ProductInterner, SharedProduct
+from domain.models.shopping_cart import ShoppingCart
+
+
+class ProductInternerTest(unittest.TestCase):
+    def test_identical_data_is_shared(self):
+        interner = ProductInterner()
+        a = interner.make_product("Laptop", 999.99, "A powerful laptop", "27/10/2024")
+        b = interner.make_product("Laptop", 899.99, "A powerful laptop", "27/10/2024")
+        c = interner.make_product("Mouse", 25.99)
+        self.assertIs(a._data, b._data)
+        self.assertIsNot(a._data, c._data)
+        self.assertEqual((b.name, b.price, b.description), ("Laptop", 899.99, "A powerful laptop"))
+        stats = interner.stats()
+        self.assertEqual((stats["entries"], stats["lookups"], stats["hits"]), (2, 3, 1))
+        self.assertGreater(stats["bytes_saved"], 0)
+
+    def test_unused_data_is_collected(self):
+        interner = ProductInterner()
+        product = interner.make_product("Laptop", 999.99)
+        self.assertEqual(len(interner), 1)
+        del product
+        gc.collect()
+        self.assertEqual(len(interner), 0)
+
+    def test_reads_like_a_product(self):
+        shared = SharedProduct("Laptop", 999.99, "A powerful laptop")
+        plain = Product("Laptop", 999.99, "A powerful laptop")
+        self.assertEqual(str(shared), str(plain))
+        copy = pickle.loads(pickle.dumps(shared))
+        self.assertIsInstance(copy, Product)
+        self.assertEqual((copy.name, copy.price), ("Laptop", 999.99))
+        with self.assertRaises(AttributeError):
+            shared.name = "Desktop"
+
+    def test_price_changes_reach_the_cart(self):
+        product = ProductInterner().make_product("Laptop", 1000)
+        cart = ShoppingCart.new_instance()
+        cart.add_item(product)
+        self.assertEqual(cart.total_price(), 1000)
+        product.price = 800
+        self.assertEqual(cart.total_price(), 800)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import random
+import unittest
+
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from domain.search.product_index import ProductSearchIndex
+
+WORDS = ["wireless", "mouse", "laptop", "usb", "cable", "gaming", "keyboard", "monitor"]
+
+
+class ProductSearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.cart = ShoppingCart.new_instance()
+        self.index = ProductSearchIndex.attach(self.cart)
+
+    def test_token_prefix_and_price_search(self):
+        mouse = Product("Wireless Mouse", 25.99, "A wireless mouse")
+        keyboard = Product("Gaming Keyboard", 149.99, "RGB, wireless")
+        self.cart.add_item(mouse)
+        self.cart.add_item(keyboard)
+        self.cart.add_item(Product("USB Cable", 5))
+        self.assertEqual(self.index.search("wireless"), [mouse, keyboard])
+        self.assertEqual(self.index.search("WIRELESS mouse"), [mouse])
+        self.assertEqual(self.index.search(prefix="key"), [keyboard])
+        self.assertEqual(self.index.search("wireless", max_price=100), [mouse])
+        self.assertEqual(self.index.search("!!"), [])
+        self.assertEqual(len(self.index.search(min_price=5, max_price=25.99)), 2)
+
+    def test_stays_consistent_with_the_cart_after_removes(self):
+        rng = random.Random(7)
+        line_ids = []
+        for i in range(300):
+            if line_ids and rng.random() < 0.4:
+                self.cart.remove_line(line_ids.pop(rng.randrange(len(line_ids))))
+            else:
+                name = " ".join(rng.sample(WORDS, 2))
+                line_ids.append(self.cart.add_item(Product(name, rng.randint(1, 100), f"item {i}")))
+
+        rebuilt = ProductSearchIndex.attach(self.cart)
+        self.assertEqual(len(self.index), len(self.cart))
+        for word in WORDS:
+            self.assertEqual(self.index.search_keys(word), rebuilt.search_keys(word))
+            self.assertEqual(self.index.search_keys(prefix=word[:2]), rebuilt.search_keys(prefix=word[:2]))
+        self.assertEqual(self.index.search_keys(min_price=20, max_price=60),
+                         rebuilt.search_keys(min_price=20, max_price=60))
+        expected = {line_id for line_id, product in self.cart.lines() if "mouse" in product.name.split()}
+        self.assertEqual(self.index.search_keys("mouse"), expected)
+
+    def test_removed_words_leave_the_vocabulary(self):
+        line_id = self.cart.add_item(Product("Monitor", 300))
+        self.cart.remove_line(line_id)
+        self.assertEqual(self.index.search(prefix="mon"), [])
+        self.assertEqual(self.index.search(max_price=1000), [])
+
+    def test_clear(self):
+        self.cart.add_item(Product("Monitor", 300))
+        self.cart.clear_cart()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.search("monitor"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
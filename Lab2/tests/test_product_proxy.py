@@ -0,0 +1,46 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import unittest
+
+from domain.catalog.product_catalog import SQLiteProductCatalog
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from patterns.proxy.product_cache import LRUProductCache
+from patterns.proxy.product_proxy import LazyProductProxy
+
+
+class LazyProductProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = SQLiteProductCatalog()
+        self.ids = self.catalog.add_many(Product(f"Item {i}", i + 0.5) for i in range(20))
+        self.cache = LRUProductCache(max_size=5)
+        self.cart = ShoppingCart.new_instance()
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_adding_to_a_cart_does_not_load(self):
+        proxies = [LazyProductProxy(product_id, self.catalog, cache=self.cache) for product_id in self.ids]
+        for proxy in proxies:
+            self.cart.add_item(proxy)
+        self.cart.remove_item(proxies[0])
+        self.assertEqual(self.cache.stats()["misses"], 0)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(proxies[1].get_access_count(), 0)
+
+    def test_loads_on_total_and_reloads_after_eviction(self):
+        proxies = [LazyProductProxy(product_id, self.catalog, cache=self.cache) for product_id in self.ids]
+        for proxy in proxies:
+            self.cart.add_item(proxy)
+        self.assertEqual(self.cart.total_price(), sum(i + 0.5 for i in range(20)))
+        self.assertEqual(self.cache.misses, 20)
+        self.assertEqual(self.cache.evictions, 15)
+        self.assertEqual(proxies[0].name, "Item 0")
+        self.assertEqual(self.cache.misses, 21)
+
+
+if __name__ == "__main__":
+    unittest.main()
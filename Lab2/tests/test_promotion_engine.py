@@ -0,0 +1,66 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import unittest
+
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from domain.promotions.promotion_engine import BuyNGetM, CartThreshold, PercentOffCategory, PromotionEngine
+
+CATEGORIES = {"Headphones": "audio", "Speaker": "audio", "Monitor": "displays"}
+
+
+def category_of(product):
+    return CATEGORIES.get(product.name)
+
+
+class PromotionEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.cart = ShoppingCart.new_instance()
+        self.rules = [
+            BuyNGetM("Cable", buy=2, free=1, priority=3),
+            PercentOffCategory("audio", 10, priority=2),
+            CartThreshold(500, amount=50, priority=1),
+        ]
+        self.engine = PromotionEngine.attach(self.cart, self.rules, category_of)
+
+    def test_rules_stack_in_priority_order(self):
+        for _ in range(3):
+            self.cart.add_item(Product("Cable", 10))
+        self.cart.add_item(Product("Headphones", 200))
+        self.cart.add_item(Product("Monitor", 400))
+        pricing = self.engine.pricing()
+        self.assertEqual(pricing["subtotal"], 630)
+        self.assertEqual([name for name, _ in pricing["discounts"]],
+                         ["buy 2 get 1 Cable", "10% off audio", "$50.00 off orders over $500.00"])
+        self.assertAlmostEqual(pricing["total"], 630 - 10 - 20 - 50)
+
+    def test_threshold_uses_the_discounted_total(self):
+        self.cart.add_item(Product("Headphones", 540))
+        # 10% off brings the cart to 486, under the 500 threshold.
+        self.assertEqual(self.engine.pricing()["discounts"], [("10% off audio", 54.0)])
+
+    def test_exclusive_rule_stops_lower_priorities(self):
+        engine = PromotionEngine([PercentOffCategory("audio", 50, priority=2, exclusive=True),
+                                  CartThreshold(0, percent=10, priority=1)], category_of)
+        self.cart.subscribe(engine)
+        self.cart.add_item(Product("Speaker", 100))
+        self.assertEqual(engine.total(), 50)
+
+    def test_incremental_matches_a_fresh_engine(self):
+        speaker = Product("Speaker", 300)
+        cable = Product("Cable", 10)
+        line_ids = [self.cart.add_item(product) for product in (speaker, cable, cable, cable, Product("Monitor", 150))]
+        self.cart.remove_line(line_ids[2])
+        speaker.price = 250
+        self.cart.add_item(cable)
+        expected = PromotionEngine.attach(self.cart, self.rules, category_of).total()
+        self.assertAlmostEqual(self.engine.total(), expected)
+        self.cart.clear_cart()
+        self.assertEqual(self.engine.total(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Run from the Lab2 directory:
+
+    python -m unittest discover -s tests
+"""
+import unittest
+
+from domain.models.product import Product
+from domain.models.shopping_cart import ShoppingCart
+from patterns.decorator.product_decorator import DiscountedProductDecorator
+from patterns.proxy.product_proxy import ProductProxy
+
+
+class ShoppingCartTotalTest(unittest.TestCase):
+    def setUp(self):
+        self.cart = ShoppingCart.new_instance()
+
+    def test_total_follows_price_changes_after_add(self):
+        base = Product("Laptop", 100)
+        discounted = DiscountedProductDecorator(base, 0.1)
+        compiled = discounted.compile()
+        self.cart.add_item(compiled)
+        self.assertAlmostEqual(self.cart.total_price(), 90)
+
+        discounted.discount_percentage = 0.5
+        base.price = 10
+        self.assertAlmostEqual(self.cart.total_price(), 5)
+
+        self.cart.remove_item(compiled)
+        self.assertEqual(self.cart.total_price(), 0)
+
+    def test_remove_subtracts_the_price_that_was_added(self):
+        mouse = Product("Mouse", 0.1)
+        cable = Product("Cable", 0.2)
+        self.cart.add_item(mouse)
+        self.cart.add_item(cable)
+        mouse.price = 5
+        self.cart.add_item(Product("Pad", 0.3))
+        self.cart.remove_item(mouse)
+        self.assertEqual(self.cart.total_price(), 0.5)
+
+    def test_no_float_drift_after_remove(self):
+        a = Product("A", 0.1)
+        self.cart.add_item(a)
+        self.cart.add_item(Product("B", 0.2))
+        self.cart.remove_item(a)
+        self.assertEqual(self.cart.total_price(), 0.2)
+
+    def test_add_does_not_read_the_price(self):
+        proxy = ProductProxy(Product("Laptop", 999.99), access_level="restricted")
+        line_id = self.cart.add_item(proxy)
+        self.assertEqual(proxy.get_access_count(), 0)
+        self.cart.remove_line(line_id)
+        self.assertEqual(self.cart.total_price(), 0)
+
+    def test_proxy_lines_are_priced_once_per_total(self):
+        proxy = ProductProxy(Product("Laptop", 1000), access_level="public")
+        self.cart.add_item(proxy)
+        self.assertEqual(self.cart.total_price(), 1000)
+        self.assertEqual(self.cart.total_price(), 1000)
+        self.assertEqual(proxy.get_access_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Time-to-first-chapter: story JSON vs the SQLite story store.
+
+Generates a synthetic story with N chapters (default 100,000), converts it
+with convert_json_to_store, then measures how long each format takes from
+"open the story" to "first chapter ready", plus the Python heap that costs.
+Run from the Lab3 directory:
+
+    python -m benchmarks.story_store_benchmark [chapters]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from domain.story_graph import StoryGraph
+from domain.story_store import SQLiteStoryStore, convert_json_to_store
+
+
+def make_story(chapters):
+    story = {}
+    for i in range(1, chapters + 1):
+        following = f"Chapter {i + 1}" if i < chapters else "ENDING"
+        story[f"Chapter {i}"] = {
+            "title": f"Stretch {i} of the Wasteland",
+            "description": "Dust and wind. Something glints in the sand ahead of you.",
+            "choices": [
+                {"text": "Search the dunes.",
+                 "result": {"description": "You dig up some supplies.",
+                            "updates": {"items": ["Scrap Metal"]},
+                            "command": {"type": "search", "items_found": ["Scrap Metal"]},
+                            "next_chapter": following}},
+                {"text": "Fight whatever is out there.",
+                 "result": {"description": "A raider jumps out.",
+                            "command": {"type": "combat", "enemy": "Raider", "combat_type": "balanced",
+                                        "enemy_hp": 40 + i % 30, "enemy_attack": 8 + i % 5},
+                            "next_chapter": following}},
+            ],
+        }
+    story["ENDING"] = {"title": "Journey's End", "description": "You made it.", "choices": []}
+    return story
+
+
+def first_chapter_json(path):
+    story = StoryGraph.load(path, start="Chapter 1")
+    return story.chapters[story.start_id]
+
+
+def first_chapter_store(path):
+    store = SQLiteStoryStore(path)
+    chapter = store.chapters[store.start_id]
+    store.close()
+    return chapter
+
+
+def measure(label, load, path):
+    start = time.perf_counter()
+    chapter = load(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    load(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<8} {elapsed * 1000:>10.1f} ms {peak / 1e6:>10.1f} MB   -> {chapter.title}")
+    return elapsed
+
+
+def main(chapters=100_000):
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "story.json")
+        db_path = os.path.join(directory, "story.db")
+        with open(json_path, "w") as f:
+            json.dump(make_story(chapters), f)
+
+        start = time.perf_counter()
+        convert_json_to_store(json_path, db_path, start="Chapter 1")
+        convert_time = time.perf_counter() - start
+
+        print(f"{chapters:,} chapters: JSON {os.path.getsize(json_path) / 1e6:.1f} MB, "
+              f"store {os.path.getsize(db_path) / 1e6:.1f} MB, conversion {convert_time:.2f}s")
+        print(f"{'format':<8} {'first chapter':>13} {'peak heap':>13}")
+        json_time = measure("json", first_chapter_json, json_path)
+        store_time = measure("sqlite", first_chapter_store, db_path)
+        print(f"\nstore is {json_time / store_time:,.0f}x faster to the first chapter")
+
+        store = SQLiteStoryStore(db_path, cache_size=256)
+        chapter_id = store.start_id
+        start = time.perf_counter()
+        steps = 0
+        while chapter_id is not None and chapter_id >= 0 and steps < 10_000:
+            chapter_id = store.chapters[chapter_id].choices[0].next_id
+            steps += 1
+        elapsed = time.perf_counter() - start
+        print(f"walked {steps:,} chapters lazily: {elapsed / steps * 1e6:.1f} us/chapter "
+              f"(cache hits {store.hits}, misses {store.misses})")
+        store.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,33 +1,133 @@
 import json
 
+from utils.utils import PLAYER_FILE, atomic_write_json
+
+
+class Inventory:
+    """
+    Item counts ({item name: count}) with O(1) has/add/remove and len().
+
+    Still behaves like the old list where the game relied on it: append,
+    extend, `in`, len() and iteration (one entry per unit, grouped by item),
+    and it compares equal to the equivalent list.
+    """
+    __slots__ = ('_counts', '_size')
+
+    def __init__(self, items=()):
+        self._counts = {}
+        self._size = 0
+        self.extend(items)
+
+    def add(self, item, count=1):
+        self._counts[item] = self._counts.get(item, 0) + count
+        self._size += count
+
+    append = add
+
+    def extend(self, items):
+        for item in items:
+            self.add(item)
+
+    def remove(self, item, count=1):
+        have = self._counts.get(item, 0)
+        if have < count:
+            raise ValueError(f"not enough {item!r} in inventory ({have} < {count})")
+        if have == count:
+            del self._counts[item]
+        else:
+            self._counts[item] = have - count
+        self._size -= count
+
+    def count(self, item):
+        return self._counts.get(item, 0)
+
+    def has(self, item):
+        return item in self._counts
+
+    __contains__ = has
+
+    def counts(self):
+        """(item name, count) pairs."""
+        return list(self._counts.items())
+
+    def copy(self):
+        inventory = Inventory()
+        inventory._counts = self._counts.copy()
+        inventory._size = self._size
+        return inventory
+
+    def __iter__(self):
+        for name, count in self._counts.items():
+            for _ in range(count):
+                yield name
+
+    def __len__(self):
+        return self._size
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self._counts == other._counts
+        if isinstance(other, (list, tuple)):
+            return self._counts == Inventory(other)._counts
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Inventory, (list(self),))
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class Player:
+    STATS = ('hp', 'hunger', 'thirst', 'money', 'stamina')
+    __slots__ = STATS + ('inventory',)
+
     def __init__(self, hp=100, hunger=50, thirst=50, money=20, inventory=None, stamina=100):
         self.hp = hp
         self.hunger = hunger
         self.thirst = thirst
         self.money = money
-        self.inventory = inventory or []
+        self.inventory = inventory if isinstance(inventory, Inventory) else Inventory(inventory or ())
         self.stamina = stamina
 
     def update_stat(self, stat, value):
-        if hasattr(self, stat):
-            setattr(self, stat, max(0, getattr(self, stat) + value))
+        slot = _STAT_SLOTS.get(stat)
+        if slot is not None:
+            slot.__set__(self, max(0, slot.__get__(self) + value))
+
+    def add_item(self, item, count=1):
+        self.inventory.add(item, count)
+
+    def remove_item(self, item, count=1):
+        self.inventory.remove(item, count)
+
+    def has_item(self, item):
+        return item in self.inventory
 
-    def add_item(self, item):
-        self.inventory.append(item)
+    def copy(self):
+        return Player(self.hp, self.hunger, self.thirst, self.money, self.inventory.copy(), self.stamina)
+
+    def to_dict(self):
+        # Inventory is saved expanded to a list, as older save files have it.
+        return {'hp': self.hp, 'hunger': self.hunger, 'thirst': self.thirst, 'money': self.money,
+                'inventory': list(self.inventory), 'stamina': self.stamina}
 
     def save(self, filepath=None):
         # default to Lab3/data/player.json if no path
-        filepath = filepath or 'Lab3/data/player.json'
-        with open(filepath, 'w') as f:
-            json.dump(self.__dict__, f)
+        filepath = filepath or PLAYER_FILE
+        atomic_write_json(filepath, self.to_dict())
 
     @classmethod
     def load(cls, filepath=None):
-        filepath = filepath or 'Lab3/data/player.json'
+        filepath = filepath or PLAYER_FILE
         with open(filepath, 'r') as f:
             data = json.load(f)
         # If old save file missing stamina, default it
         if 'stamina' not in data:
             data['stamina'] = 100
-        return cls(**data)
\ No newline at end of file
+        return cls(**data)
+
+
+_STAT_SLOTS = {stat: Player.__dict__[stat] for stat in Player.STATS}
@@ -0,0 +1,154 @@
+"""
+Combat engine: fights resolved to completion.
+
+Each round the player strikes with their strategy's attack, then a
+surviving enemy strikes back with its attack reduced by the strategy's
+guard (see CombatStrategy). Every hit can miss (`miss_chance`) and its
+damage is scaled by a uniform roll in [1 - variance, 1 + variance] and
+rounded. A fight ends in a win, a loss, or a draw when `max_rounds`
+passes without either side falling. Rolls come from the `rng` passed to
+resolve(), else the engine's own, else the (seedable) `random` module.
+
+simulate_batch() runs the same rules for many fights at once as NumPy
+arrays (one Python iteration per round, not per fight), which gives win
+probabilities and expected HP loss for tuning enemy_hp / enemy_attack in
+story_state.json.
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:  # only simulate_batch needs numpy
+    np = None
+
+WIN, LOSS, DRAW = 'win', 'loss', 'draw'
+
+
+class CombatEngine:
+    def __init__(self, max_rounds=20, variance=0.2, miss_chance=0.1, rng=None):
+        if max_rounds < 1:
+            raise ValueError("max_rounds must be at least 1")
+        self.max_rounds = max_rounds
+        self.variance = variance
+        self.miss_chance = miss_chance
+        self.rng = rng
+
+    def _roll(self, damage, rng):
+        if self.miss_chance and rng.random() < self.miss_chance:
+            return 0
+        if self.variance:
+            damage *= rng.uniform(1 - self.variance, 1 + self.variance)
+        return round(damage)
+
+    def resolve(self, player, enemy, strategy, log=print, rng=None):
+        """
+        Fight until one side falls or the round limit is reached.
+
+        Updates player.hp (and enemy['hp'] on the dict passed in) and returns
+        {'outcome', 'rounds', 'hp_lost', 'enemy_hp'}.
+        """
+        rng = rng or self.rng or random
+        start_hp = player.hp
+        taken_per_hit = strategy.damage_taken(enemy['attack'])
+        outcome = DRAW
+        rounds = 0
+        for rounds in range(1, self.max_rounds + 1):
+            damage = self._roll(strategy.attack, rng)
+            enemy['hp'] -= damage
+            if enemy['hp'] <= 0:
+                log(f"Round {rounds}: you hit {enemy['name']} for {damage}. {enemy['name']} falls!")
+                outcome = WIN
+                break
+            taken = self._roll(taken_per_hit, rng)
+            player.hp -= taken
+            hit = f"you hit for {damage}" if damage else "you miss"
+            counter = f"{enemy['name']} hits back for {taken}" if taken else f"{enemy['name']} misses"
+            log(f"Round {rounds}: {hit}, {counter}. Enemy HP: {enemy['hp']}, Player HP: {player.hp}")
+            if player.hp <= 0:
+                outcome = LOSS
+                break
+        return {"outcome": outcome, "rounds": rounds, "hp_lost": start_hp - player.hp, "enemy_hp": enemy['hp']}
+
+    def simulate_batch(self, player_hp, enemy_hp, enemy_attack, strategy, fights=100000, seed=None):
+        """
+        Simulate `fights` independent fights of one strategy, vectorized.
+
+        Returns win/loss/draw probabilities, expected HP lost by the player
+        and mean rounds fought. Requires numpy.
+        """
+        if np is None:
+            raise ImportError("simulate_batch requires numpy")
+        rng = np.random.default_rng(seed)
+        player = np.full(fights, player_hp, dtype=np.float64)
+        enemy = np.full(fights, enemy_hp, dtype=np.float64)
+        rounds = np.zeros(fights, dtype=np.int32)
+        active = np.ones(fights, dtype=bool)
+        taken_per_hit = strategy.damage_taken(enemy_attack)
+
+        def roll(damage, count):
+            hits = np.full(count, float(damage))
+            if self.variance:
+                hits *= rng.uniform(1 - self.variance, 1 + self.variance, count)
+            hits = np.rint(hits)
+            if self.miss_chance:
+                hits[rng.random(count) < self.miss_chance] = 0
+            return hits
+
+        for _ in range(self.max_rounds):
+            index = np.flatnonzero(active)
+            if not index.size:
+                break
+            rounds[index] += 1
+            enemy[index] -= roll(strategy.attack, index.size)
+            alive = index[enemy[index] > 0]
+            player[alive] -= roll(taken_per_hit, alive.size)
+            active[index] = (enemy[index] > 0) & (player[index] > 0)
+
+        wins = enemy <= 0
+        losses = (player <= 0) & ~wins
+        return {
+            "strategy": getattr(strategy, 'name', type(strategy).__name__),
+            "fights": fights,
+            "win": float(wins.mean()),
+            "loss": float(losses.mean()),
+            "draw": float((~wins & ~losses).mean()),
+            "expected_hp_loss": float((player_hp - np.maximum(player, 0)).mean()),
+            "mean_rounds": float(rounds.mean()),
+        }
+
+    def compare_strategies(self, player_hp, enemy_hp, enemy_attack, strategies=None, fights=100000, seed=None):
+        """simulate_batch for every registered strategy (or the given ones)."""
+        from domain.strategy import STRATEGIES
+
+        strategies = strategies or [cls() for cls in STRATEGIES.values()]
+        return [self.simulate_batch(player_hp, enemy_hp, enemy_attack, strategy, fights, seed)
+                for strategy in strategies]
+
+
+default_engine = CombatEngine()
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    from domain.command import FightCommand
+    from domain.story_graph import StoryGraph
+    from utils.utils import STORY_FILE
+
+    parser = argparse.ArgumentParser(description="Win rates of every story fight per strategy.")
+    parser.add_argument("--story", default=STORY_FILE)
+    parser.add_argument("--player-hp", type=int, default=100)
+    parser.add_argument("--fights", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    story = StoryGraph.load(args.story)
+    for chapter in story.chapters:
+        for choice in chapter.choices:
+            if isinstance(choice.command, FightCommand):
+                enemy = choice.command.enemy
+                print(f"{chapter.name}: {enemy['name']} (HP {enemy['hp']}, attack {enemy['attack']})")
+                for row in default_engine.compare_strategies(args.player_hp, enemy['hp'], enemy['attack'],
+                                                             fights=args.fights, seed=args.seed):
+                    print("  " + json.dumps(row))
@@ -1,66 +1,154 @@
+from domain.combat import default_engine
+from domain.strategy import create_strategy
+
+# Command registry: story "type" name -> Command class.
+# New command types register themselves here; GameManager never needs editing.
+COMMANDS = {}
+
+
+def register_command(type_name):
+    def decorator(cls):
+        cls.type_name = type_name
+        COMMANDS[type_name] = cls
+        return cls
+    return decorator
+
+
+def create_command(spec):
+    """Build a command from its story spec; raises ValueError for invalid specs."""
+    if not isinstance(spec, dict) or 'type' not in spec:
+        raise ValueError("command must be an object with a 'type'")
+    cls = COMMANDS.get(spec['type'])
+    if cls is None:
+        raise ValueError(f"unknown command type '{spec['type']}' (known: {', '.join(sorted(COMMANDS))})")
+    return cls.from_spec(spec)
+
+
+def _require(spec, field, kind):
+    if field not in spec:
+        raise ValueError(f"'{spec['type']}' command needs '{field}'")
+    return _check(spec, field, spec[field], kind)
+
+
+def _optional(spec, field, kind, default):
+    return _check(spec, field, spec.get(field, default), kind)
+
+
+def _check(spec, field, value, kind):
+    if value is not None and (not isinstance(value, kind) or isinstance(value, bool) and kind is not bool):
+        raise ValueError(f"'{spec['type']}' command field '{field}' has invalid value {value!r}")
+    return value
+
+
 class Command:
-    def execute(self, player):
+    type_name = None
+
+    @classmethod
+    def from_spec(cls, spec):
+        return cls()
+
+    def execute(self, player, log=print, rng=None):
         pass
 
+@register_command('search')
 class SearchCommand(Command):
     def __init__(self, items_found):
         self.items_found = items_found
 
-    def execute(self, player):
-        player.inventory.extend(self.items_found)
-        print(f"Found: {', '.join(self.items_found)}")
+    @classmethod
+    def from_spec(cls, spec):
+        items = _require(spec, 'items_found', list)
+        if not all(isinstance(item, str) for item in items):
+            raise ValueError("'search' command field 'items_found' must be a list of item names")
+        return cls(tuple(items))
+
+    def execute(self, player, log=print, rng=None):
+        for item in self.items_found:
+            player.add_item(item)
+        log(f"Found: {', '.join(self.items_found)}")
         player.hunger += 20
         player.thirst += 10
 
+@register_command('combat')
 class FightCommand(Command):
-    def __init__(self, enemy_name, enemy_hp, enemy_attack, combat_strategy):
+    def __init__(self, enemy_name, enemy_hp, enemy_attack, combat_strategy, engine=None):
         self.enemy = {"name": enemy_name, "hp": enemy_hp, "attack": enemy_attack}
         self.combat_strategy = combat_strategy
+        self.engine = engine or default_engine
+
+    @classmethod
+    def from_spec(cls, spec):
+        return cls(
+            enemy_name=_require(spec, 'enemy', str),
+            enemy_hp=_optional(spec, 'enemy_hp', (int, float), 50),
+            enemy_attack=_optional(spec, 'enemy_attack', (int, float), 10),
+            combat_strategy=create_strategy(_require(spec, 'combat_type', str)),
+        )
 
-    def execute(self, player):
-        print(f"Engaging in combat with {self.enemy['name']} (HP: {self.enemy['hp']}, Attack: {self.enemy['attack']})")
-        
-        self.combat_strategy.execute(player, self.enemy)
-        
-        if self.enemy["hp"] <= 0:
-            print(f"You defeated {self.enemy['name']}!")
-        elif player.hp <= 0:
-            print("You have been defeated!")
+    def execute(self, player, log=print, rng=None):
+        """Fight the enemy to the end and return the engine's result dict."""
+        # The command is built once per story and shared, so it keeps no per-fight state:
+        # every fight starts from a fresh enemy and the result is returned, not stored.
+        enemy = dict(self.enemy)
+        log(f"Engaging in combat with {enemy['name']} (HP: {enemy['hp']}, Attack: {enemy['attack']})")
+
+        result = self.engine.resolve(player, enemy, self.combat_strategy, log, rng)
+
+        if result["outcome"] == "win":
+            log(f"You defeated {enemy['name']}!")
+        elif result["outcome"] == "loss":
+            log("You have been defeated!")
         else:
-            print(f"Combat continues. Enemy HP: {self.enemy['hp']}, Player HP: {player.hp}")
+            log(f"{enemy['name']} retreats after {result['rounds']} rounds. Enemy HP: {enemy['hp']}, Player HP: {player.hp}")
+        return result
 
+@register_command('trade')
 class TradeCommand(Command):
     def __init__(self, item, cost):
         self.item = item
         self.cost = cost
 
-    def execute(self, player):
+    @classmethod
+    def from_spec(cls, spec):
+        return cls(_require(spec, 'item', str), _optional(spec, 'price', (int, float), 0))
+
+    def execute(self, player, log=print, rng=None):
         if player.money >= self.cost:
             player.money -= self.cost
-            player.inventory.append(self.item)
-            print(f"Traded {self.cost} credits for {self.item}.")
+            player.add_item(self.item)
+            log(f"Traded {self.cost} credits for {self.item}.")
         else:
-            print("Not enough credits to complete the trade!")
+            log("Not enough credits to complete the trade!")
 
 
+@register_command('rest')
 class RestCommand(Command):
     def __init__(self, stamina_gain):
         self.stamina_gain = stamina_gain
 
-    def execute(self, player):
+    @classmethod
+    def from_spec(cls, spec):
+        return cls(_optional(spec, 'stamina_gain', (int, float), 10))
+
+    def execute(self, player, log=print, rng=None):
         player.stamina += self.stamina_gain
-        print(f"Rested and gained {self.stamina_gain} stamina. Current stamina: {player.stamina}")
+        log(f"Rested and gained {self.stamina_gain} stamina. Current stamina: {player.stamina}")
 
 
+@register_command('hide')
 class HideCommand(Command):
     def __init__(self, stamina_loss, item_found=None):
         self.stamina_loss = stamina_loss
         self.item_found = item_found
 
-    def execute(self, player):
+    @classmethod
+    def from_spec(cls, spec):
+        return cls(_optional(spec, 'stamina_loss', (int, float), 5), _optional(spec, 'item_found', str, None))
+
+    def execute(self, player, log=print, rng=None):
         player.stamina -= self.stamina_loss
-        print(f"Stayed hidden and lost {self.stamina_loss} stamina. Current stamina: {player.stamina}")
+        log(f"Stayed hidden and lost {self.stamina_loss} stamina. Current stamina: {player.stamina}")
 
         if self.item_found:
-            player.inventory.append(self.item_found)
-            print(f"While hiding, you found: {self.item_found}")
\ No newline at end of file
+            player.add_item(self.item_found)
+            log(f"While hiding, you found: {self.item_found}")
@@ -1,97 +1,111 @@
-import json
 from client.player import Player
-from domain.command import *
-from domain.strategy import *
+from domain.story_graph import END, ENDING, StoryGraph
+from domain.story_store import SQLiteStoryStore
+from utils.autosave import AutosaveService
+from utils.utils import PLAYER_FILE, STORY_FILE
 
 class GameManager:
-    def __init__(self, player_file='Lab3/data/player.json', story_file='Lab3/data/story_state.json'):
-        try:
-            self.player = Player.load(player_file)
-        except Exception as e:
-            self.player = Player()
+    def __init__(self, player_file=PLAYER_FILE, story_file=STORY_FILE,
+                 player=None, story=None, autosave=True, output=print, rng=None):
+        # player/story let a caller (e.g. the headless simulator) inject state;
+        # output replaces print for everything the game reports; rng drives combat.
+        if player is None:
+            try:
+                player = Player.load(player_file)
+            except Exception as e:
+                player = Player()
+        self.player = player
+        self.player_file = player_file
         self.story_file = story_file
+        self.story = story
+        self._owns_story = False  # True once load_story() opens a store this manager must close
+        self.autosave = autosave
+        self.saver = None  # AutosaveService, started on first save
+        self.output = output
+        self.rng = rng
         self.current_chapter = None
 
     def load_story(self):
-        with open(self.story_file, 'r') as f:
-            self.story_data = json.load(f)
+        if self.story is None:
+            if self.story_file.endswith('.db'):
+                # Converted story (domain/story_store.py): chapters load lazily.
+                self.story = SQLiteStoryStore(self.story_file)
+                self._owns_story = True
+            else:
+                self.story = StoryGraph.load(self.story_file, start="Chapter 1")
 
     def start_game(self):
         self.load_story()
-        print("Welcome to The Whispering Wasteland!")
-        self.play_chapter("Chapter 1")
+        self.output("Welcome to The Whispering Wasteland!")
+        try:
+            self.play(self.story.start_id)
+        finally:
+            self.close()
 
     def play_chapter(self, chapter_name):
-        # ENDING handler (clear ending)
-        if chapter_name == "ENDING":
-            print("\n*** GAME OVER ***")
-            print("You finished the game!")
-            return
-        self.current_chapter = self.story_data[chapter_name]
-        print(f"--- {self.current_chapter['title']} ---")
-        print(self.current_chapter['description'])
-        print(f"\nStats: HP={self.player.hp}, Hunger={self.player.hunger}, Thirst={self.player.thirst}, Money={self.player.money}")
-        print(f"Inventory: {self.player.inventory}")
-        for idx, choice in enumerate(self.current_chapter['choices'], 1):
-            print(f"{idx}. {choice['text']}")
+        if chapter_name == ENDING:
+            self.play(END)
+        else:
+            self.play(self.story.ids[chapter_name])
+
+    def play(self, chapter_id):
+        # Iterative chapter loop: the stack depth stays constant however long the session is.
         while True:
-            try:
-                choice_idx = int(input("Choose an option: ")) - 1
-                if 0 <= choice_idx < len(self.current_chapter['choices']):
-                    break
-                else:
-                    print("Invalid choice. Try again.")
-            except ValueError:
-                print("Please enter a valid number.")
-        result = self.execute_choice(self.current_chapter['choices'][choice_idx])
-        # Autosave after every choice
-        self.player.save('Lab3/data/player.json')
-        if result.get("next_chapter"):
-            self.play_chapter(result["next_chapter"])
+            # ENDING handler (clear ending)
+            if chapter_id == END:
+                self.output("\n*** GAME OVER ***")
+                self.output("You finished the game!")
+                return
+            chapter = self.current_chapter = self.story.chapters[chapter_id]
+            self.output(f"--- {chapter.title} ---")
+            self.output(chapter.description)
+            if not chapter.choices:
+                return
+            self.output(f"\nStats: HP={self.player.hp}, Hunger={self.player.hunger}, Thirst={self.player.thirst}, Money={self.player.money}")
+            self.output(f"Inventory: {self.player.inventory}")
+            for idx, choice in enumerate(chapter.choices, 1):
+                self.output(f"{idx}. {choice.text}")
+            while True:
+                try:
+                    choice_idx = int(input("Choose an option: ")) - 1
+                    if 0 <= choice_idx < len(chapter.choices):
+                        break
+                    else:
+                        self.output("Invalid choice. Try again.")
+                except ValueError:
+                    self.output("Please enter a valid number.")
+            choice = chapter.choices[choice_idx]
+            self.execute_choice(choice)
+            # Autosave after every choice (written in the background, coalesced and atomic)
+            if self.autosave:
+                self.save()
+            if choice.next_name is None:
+                return
+            if choice.next_id is None:
+                self.output(f"\n'{choice.next_name}' has not been written yet. To be continued...")
+                return
+            chapter_id = choice.next_id
+
+    def save(self):
+        if self.saver is None:
+            self.saver = AutosaveService(self.player_file)
+        self.saver.save(self.player.to_dict())
+
+    def close(self):
+        if self._owns_story:
+            self.story.close()
+            self._owns_story = False
+        if self.saver is not None:
+            self.saver.close()
 
     def execute_choice(self, choice):
-        print(choice['result']['description'])
-        # Handle stat/inventory updates
-        updates = choice['result'].get('updates', {})
-        for key, value in updates.items():
-            if key == 'items' or key == 'item':
-                items = value if isinstance(value, list) else [value]
-                for item in items:
-                    self.player.add_item(item)
-            elif hasattr(self.player, key):
-                setattr(self.player, key, getattr(self.player, key) + value)
-            # else: ignore silently
-        if 'command' in choice['result']:
-            command_data = choice['result']['command']
-            command = None
-            if command_data['type'] == 'search':
-                command = SearchCommand(command_data['items_found'])
-            elif command_data['type'] == 'trade':
-                command = TradeCommand(command_data['item'], command_data.get('price', 0))
-            elif command_data['type'] == 'combat':
-                combat_type = command_data['combat_type']
-                if combat_type == 'aggressive':
-                    strategy = AggressiveStrategy()
-                elif combat_type == 'defensive':
-                    strategy = DefensiveStrategy()
-                elif combat_type == 'balanced':
-                    strategy = BalancedStrategy()
-                else:
-                    print(f"Unknown combat type: {combat_type}")
-                    return {}
-                command = FightCommand(
-                    enemy_name=command_data['enemy'],
-                    enemy_hp=command_data.get('enemy_hp', 50),
-                    enemy_attack=command_data.get('enemy_attack', 10),
-                    combat_strategy=strategy
-                )
-            elif command_data['type'] == 'rest':
-                command = RestCommand(command_data.get('stamina_gain', 10))
-            elif command_data['type'] == 'hide':
-                command = HideCommand(command_data.get('stamina_loss', 5), command_data.get('item_found'))
-            else:
-                print(f"Unknown command type: {command_data['type']}")
-                return {}
-            if command:
-                command.execute(self.player)
-        return choice['result']
+        self.output(choice.description)
+        # Handle stat/inventory updates (pre-parsed when the story was compiled)
+        for item in choice.items:
+            self.player.add_item(item)
+        for stat, value in choice.stat_updates:
+            setattr(self.player, stat, getattr(self.player, stat) + value)
+        # Commands were resolved through the registry and built when the story was compiled.
+        if choice.command is not None:
+            choice.command.execute(self.player, self.output, self.rng)
+        return choice.result
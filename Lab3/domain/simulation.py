@@ -0,0 +1,289 @@
+"""
+Headless playthroughs of the story for balancing.
+
+The story is played by a choice policy instead of input(), with game output
+discarded and autosave off. Outcomes are aggregated into SimulationStats:
+ending and death rates, stat distributions on entering each chapter and
+command usage. simulate() can spread the runs over a process pool; the
+result depends only on `seed` and `chunk_size`, not on the number of
+workers. The story is a JSON file or a converted `.db` story store, which
+each worker opens itself.
+"""
+import json
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from client.player import Player
+from domain.game_manager import GameManager
+from domain.story_graph import END, StoryGraph
+from domain.story_store import SQLiteStoryStore
+from utils.utils import STORY_FILE
+
+
+def _silent(*args, **kwargs):
+    pass
+
+
+# --- Choice policies: policy(chapter, player, rng) -> index into chapter.choices ---
+
+class RandomPolicy:
+    def __call__(self, chapter, player, rng):
+        return rng.randrange(len(chapter.choices))
+
+
+class ScriptedPolicy:
+    """
+    Follow a script of 1-based choice numbers, as a player would type them.
+
+    `script` is either a list (one choice per step) or a dict mapping
+    chapter names to choices. Steps the script does not cover fall back to
+    `fallback` (random by default).
+    """
+    def __init__(self, script, fallback=None):
+        self.script = script
+        self.fallback = fallback or RandomPolicy()
+        self._step = 0
+
+    def __call__(self, chapter, player, rng):
+        if isinstance(self.script, dict):
+            choice = self.script.get(chapter.name)
+        else:
+            choice = self.script[self._step] if self._step < len(self.script) else None
+            self._step += 1
+        if choice is None or not 1 <= choice <= len(chapter.choices):
+            return self.fallback(chapter, player, rng)
+        return choice - 1
+
+    def reset(self):
+        self._step = 0
+
+
+def survival_score(player):
+    return player.hp + player.stamina / 2 + player.money - player.hunger / 2 - player.thirst / 2
+
+
+class GreedyPolicy:
+    """
+    Pick the choice whose immediate result scores best for the player.
+
+    Each choice is tried on a copy of the player; ties are broken randomly.
+    """
+    def __init__(self, score=survival_score):
+        self.score = score
+
+    def __call__(self, chapter, player, rng):
+        best, best_score = [], None
+        for index, choice in enumerate(chapter.choices):
+            trial = GameManager(player=player.copy(), autosave=False, output=_silent, rng=rng)
+            trial.execute_choice(choice)
+            score = self.score(trial.player)
+            if best_score is None or score > best_score:
+                best, best_score = [index], score
+            elif score == best_score:
+                best.append(index)
+        return best[0] if len(best) == 1 else rng.choice(best)
+
+
+POLICIES = {"random": RandomPolicy, "greedy": GreedyPolicy}
+
+
+# --- Aggregation ---
+
+class SimulationStats:
+    def __init__(self, stats=Player.STATS):
+        self.stats = stats
+        self.runs = 0
+        self.outcomes = Counter()       # ending / death / unwritten / dead_end / max_steps
+        self.endings = Counter()        # last chapter name -> runs that finished there
+        self.deaths = Counter()         # chapter name -> runs that died there
+        self.commands = Counter()       # command type -> executions
+        self.chapter_stats = {}         # chapter name -> {stat: [count, sum, sum of squares, min, max]}
+        self.steps = 0
+
+    def record_chapter(self, chapter, player):
+        accumulators = self.chapter_stats.get(chapter.name)
+        if accumulators is None:
+            accumulators = self.chapter_stats[chapter.name] = {stat: [0, 0, 0, None, None] for stat in self.stats}
+        for stat in self.stats:
+            value = getattr(player, stat)
+            acc = accumulators[stat]
+            acc[0] += 1
+            acc[1] += value
+            acc[2] += value * value
+            acc[3] = value if acc[3] is None or value < acc[3] else acc[3]
+            acc[4] = value if acc[4] is None or value > acc[4] else acc[4]
+
+    def merge(self, other):
+        self.runs += other.runs
+        self.steps += other.steps
+        self.outcomes.update(other.outcomes)
+        self.endings.update(other.endings)
+        self.deaths.update(other.deaths)
+        self.commands.update(other.commands)
+        for name, accumulators in other.chapter_stats.items():
+            mine = self.chapter_stats.setdefault(name, {stat: [0, 0, 0, None, None] for stat in self.stats})
+            for stat, acc in accumulators.items():
+                target = mine[stat]
+                target[0] += acc[0]
+                target[1] += acc[1]
+                target[2] += acc[2]
+                if acc[3] is not None:
+                    target[3] = acc[3] if target[3] is None else min(target[3], acc[3])
+                    target[4] = acc[4] if target[4] is None else max(target[4], acc[4])
+        return self
+
+    def summary(self):
+        runs = self.runs or 1
+        chapters = {}
+        for name, accumulators in self.chapter_stats.items():
+            chapters[name] = {}
+            for stat, (count, total, squares, low, high) in accumulators.items():
+                mean = total / count
+                chapters[name][stat] = {
+                    "mean": mean,
+                    "std": max(0.0, squares / count - mean * mean) ** 0.5,
+                    "min": low,
+                    "max": high,
+                }
+            chapters[name]["visits"] = accumulators[self.stats[0]][0]
+        return {
+            "runs": self.runs,
+            "mean_steps": self.steps / runs,
+            "outcome_rates": {outcome: count / runs for outcome, count in self.outcomes.most_common()},
+            "ending_rates": {name: count / runs for name, count in self.endings.most_common()},
+            "death_rates": {name: count / runs for name, count in self.deaths.most_common()},
+            "command_usage": dict(self.commands.most_common()),
+            "chapters": chapters,
+        }
+
+
+# --- Playing ---
+
+def play_once(story, policy, rng, player=None, max_steps=1000, stats=None):
+    """
+    Play one session headlessly and return (outcome, last chapter name, steps).
+
+    Outcomes: 'ending' (reached ENDING), 'death' (hp dropped to 0),
+    'unwritten' (next_chapter does not exist), 'dead_end' (no choices or no
+    next chapter) and 'max_steps'.
+    """
+    manager = GameManager(player=player or Player(), story=story, autosave=False, output=_silent, rng=rng)
+    player = manager.player
+    chapter_id = story.start_id
+    chapter = None
+    for step in range(max_steps):
+        if chapter_id == END:
+            outcome = 'ending'
+            break
+        chapter = story.chapters[chapter_id]
+        if stats is not None:
+            stats.record_chapter(chapter, player)
+        if not chapter.choices:
+            outcome = 'dead_end'
+            break
+        choice = chapter.choices[policy(chapter, player, rng)]
+        manager.execute_choice(choice)
+        if stats is not None and choice.command is not None:
+            stats.commands[choice.command.type_name] += 1
+        if player.hp <= 0:
+            outcome = 'death'
+            break
+        if choice.next_name is None:
+            outcome = 'dead_end'
+            break
+        if choice.next_id is None:
+            outcome = 'unwritten'
+            break
+        chapter_id = choice.next_id
+    else:
+        step = max_steps - 1
+        outcome = 'max_steps'
+    name = chapter.name if chapter is not None else None
+    if stats is not None:
+        stats.runs += 1
+        stats.steps += step + 1
+        stats.outcomes[outcome] += 1
+        if outcome == 'death':
+            stats.deaths[name] += 1
+        elif outcome != 'max_steps':
+            stats.endings[name] += 1
+    return outcome, name, step + 1
+
+
+_worker_story = None
+
+
+def _init_worker(story_source):
+    # story_source is parsed story JSON, or the path of a .db story store:
+    # a store's connection cannot be pickled, so every worker opens its own.
+    global _worker_story
+    if isinstance(story_source, str):
+        _worker_story = SQLiteStoryStore(story_source)
+    else:
+        _worker_story = StoryGraph.compile(story_source, start="Chapter 1")
+
+
+def _run_chunk(policy, runs, seed, max_steps, player_state=None):
+    stats = SimulationStats()
+    rng = random.Random(seed)
+    for _ in range(runs):
+        if hasattr(policy, 'reset'):
+            policy.reset()
+        player = Player(**player_state) if player_state else Player()
+        play_once(_worker_story, policy, rng, player, max_steps, stats)
+    return stats
+
+
+def simulate(story_file=STORY_FILE, runs=10000, policy="random", seed=0,
+             workers=None, chunk_size=10000, max_steps=1000, player_state=None):
+    """
+    Run `runs` headless playthroughs and return their merged SimulationStats.
+
+    `policy` is a policy instance or one of POLICIES; it must be picklable
+    when workers > 1. Chunk i is played with random.Random(seed + i), so a
+    seed reproduces the same statistics with any number of workers.
+    """
+    if isinstance(policy, str):
+        policy = POLICIES[policy]()
+    if story_file.endswith('.db'):
+        story_source = story_file
+    else:
+        with open(story_file, 'r') as f:
+            story_source = json.load(f)
+    chunks = [(policy, min(chunk_size, runs - start), seed + i, max_steps, player_state)
+              for i, start in enumerate(range(0, runs, chunk_size))]
+    total = SimulationStats()
+    if workers == 1 or len(chunks) == 1:
+        _init_worker(story_source)
+        try:
+            for chunk in chunks:
+                total.merge(_run_chunk(*chunk))
+        finally:
+            if isinstance(_worker_story, SQLiteStoryStore):
+                _worker_story.close()
+        return total
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(story_source,)) as pool:
+        for stats in pool.map(_run_chunk, *zip(*chunks)):
+            total.merge(stats)
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Simulate playthroughs of the story headlessly.")
+    parser.add_argument("--story", default=STORY_FILE)
+    parser.add_argument("--runs", type=int, default=100000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = simulate(args.story, args.runs, args.policy, args.seed, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(json.dumps(result.summary(), indent=2))
+    print(f"{result.runs} playthroughs in {elapsed:.2f}s ({result.runs / elapsed:,.0f}/s)")
@@ -0,0 +1,155 @@
+import json
+
+from domain.command import create_command
+
+ENDING = "ENDING"
+END = -1  # next_id of choices that finish the game
+
+
+class StoryValidationError(ValueError):
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("Invalid story:\n  " + "\n  ".join(problems))
+
+
+class Choice:
+    __slots__ = ('text', 'description', 'items', 'stat_updates', 'command', 'command_spec', 'next_name', 'next_id',
+                 'result')
+
+    def __init__(self, text, description, items, stat_updates, command, command_spec, next_name, result):
+        self.text = text
+        self.description = description
+        self.items = items                  # tuple of item names to add
+        self.stat_updates = stat_updates    # tuple of (stat, delta)
+        self.command = command              # pre-built Command instance or None
+        self.command_spec = command_spec    # raw command spec dict or None
+        self.next_name = next_name          # raw next_chapter value or None
+        self.next_id = None                 # resolved by StoryGraph: chapter id, END or None
+        self.result = result                # original result dict
+
+
+class Chapter:
+    __slots__ = ('id', 'name', 'title', 'description', 'choices')
+
+    def __init__(self, chapter_id, name, title, description, choices):
+        self.id = chapter_id
+        self.name = name
+        self.title = title
+        self.description = description
+        self.choices = choices
+
+
+class StoryGraph:
+    """
+    Story compiled into an indexed graph.
+
+    Chapters get integer ids (their position in `chapters`), every choice's
+    result is parsed once into items, stat deltas, a ready-built command
+    (from the command registry) and a resolved next chapter id, so playing
+    the story needs no dict lookups into the raw JSON. Problems found while compiling (e.g. next_chapter
+    pointing at a chapter that does not exist) are collected in `problems`;
+    with strict=True they raise StoryValidationError instead. Invalid
+    command specs always raise StoryValidationError.
+    """
+    def __init__(self, chapters, ids, start_id, problems):
+        self.chapters = chapters
+        self.ids = ids
+        self.start_id = start_id
+        self.problems = problems
+
+    @classmethod
+    def compile(cls, story_data, start=None, stats=None, strict=False):
+        if stats is None:
+            from client.player import Player
+            stats = Player.STATS
+        problems = []
+        errors = []
+        chapters = []
+        ids = {}
+        for name, data in story_data.items():
+            if name == ENDING:
+                continue
+            ids[name] = len(chapters)
+            chapters.append(cls.compile_chapter(len(chapters), name, data, stats, problems, errors))
+        if not chapters:
+            errors.append("story has no chapters")
+        if errors:
+            raise StoryValidationError(errors)
+
+        for chapter in chapters:
+            for index, choice in enumerate(chapter.choices, 1):
+                target = choice.next_name
+                if target is None:
+                    continue
+                if target == ENDING:
+                    choice.next_id = END
+                elif target in ids:
+                    choice.next_id = ids[target]
+                else:
+                    problems.append(f"{chapter.name}, choice {index}: next_chapter '{target}' does not exist")
+
+        start = start if start is not None else next(iter(ids))
+        if start not in ids:
+            raise StoryValidationError([f"start chapter '{start}' does not exist"])
+        if strict and problems:
+            raise StoryValidationError(problems)
+        return cls(chapters, ids, ids[start], problems)
+
+    @staticmethod
+    def compile_chapter(chapter_id, name, data, stats, problems, errors):
+        choices = []
+        raw_choices = data.get('choices', [])
+        if not raw_choices:
+            problems.append(f"{name}: has no choices")
+        for index, raw in enumerate(raw_choices, 1):
+            result = raw.get('result', {})
+            items = []
+            stat_updates = []
+            for key, value in result.get('updates', {}).items():
+                if key in ('items', 'item'):
+                    items.extend(value if isinstance(value, list) else [value])
+                elif key in stats:
+                    stat_updates.append((key, value))
+                else:
+                    problems.append(f"{name}, choice {index}: unknown update '{key}' ignored")
+            spec = result.get('command')
+            command = None
+            if spec is not None:
+                try:
+                    command = create_command(spec)
+                except ValueError as e:
+                    errors.append(f"{name}, choice {index}: {e}")
+            choices.append(Choice(
+                raw.get('text', ''),
+                result.get('description', ''),
+                tuple(items),
+                tuple(stat_updates),
+                command,
+                spec,
+                result.get('next_chapter'),
+                result,
+            ))
+        return Chapter(chapter_id, name, data.get('title', name), data.get('description', ''), tuple(choices))
+
+    @classmethod
+    def load(cls, path, start=None, strict=False):
+        with open(path, 'r') as f:
+            return cls.compile(json.load(f), start=start, strict=strict)
+
+    def chapter(self, name):
+        return self.chapters[self.ids[name]]
+
+    def __len__(self):
+        return len(self.chapters)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from utils.utils import STORY_FILE
+
+    graph = StoryGraph.load(sys.argv[1] if len(sys.argv) > 1 else STORY_FILE)
+    print(f"{len(graph)} chapters")
+    for problem in graph.problems:
+        print(f"  {problem}")
+    sys.exit(1 if graph.problems else 0)
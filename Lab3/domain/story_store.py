@@ -0,0 +1,170 @@
+"""
+SQLite-backed story store with lazily loaded chapters.
+
+convert_json_to_store() compiles story_state.json once (validating commands
+and resolving every next_chapter to a chapter id) and writes one row per
+chapter: its raw JSON plus the resolved transition ids. Opening the store
+reads only the metadata, so the first chapter is shown without parsing the
+whole story. Chapters are compiled on first use and kept in a bounded LRU
+cache.
+
+SQLiteStoryStore exposes the same `chapters`, `ids`, `start_id` and
+`problems` that GameManager and the simulator use on a StoryGraph.
+"""
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from client.player import Player
+from domain.story_graph import StoryGraph, StoryValidationError
+
+
+class _LazyChapters:
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, chapter_id):
+        return self._store.chapter(chapter_id)
+
+    def __len__(self):
+        return len(self._store)
+
+    def __iter__(self):
+        for chapter_id in range(len(self)):
+            yield self[chapter_id]
+
+
+class _LazyIds:
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, name):
+        chapter_id = self._store.chapter_id(name)
+        if chapter_id is None:
+            raise KeyError(name)
+        return chapter_id
+
+    def __contains__(self, name):
+        return self._store.chapter_id(name) is not None
+
+    def get(self, name, default=None):
+        chapter_id = self._store.chapter_id(name)
+        return default if chapter_id is None else chapter_id
+
+
+class SQLiteStoryStore:
+    def __init__(self, path, cache_size=256, stats=None):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.cache_size = cache_size
+        self._stats = Player.STATS if stats is None else stats
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        self.start_id = int(meta['start_id'])
+        self._count = int(meta['chapters'])
+        self.problems = json.loads(meta.get('problems', '[]'))
+        self.chapters = _LazyChapters(self)
+        self.ids = _LazyIds(self)
+
+    def __len__(self):
+        return self._count
+
+    def chapter_id(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM chapters WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def chapter(self, chapter_id):
+        with self._lock:
+            chapter = self._cache.get(chapter_id)
+            if chapter is not None:
+                self._cache.move_to_end(chapter_id)
+                self.hits += 1
+                return chapter
+            self.misses += 1
+            row = self._conn.execute("SELECT name, data, links FROM chapters WHERE id = ?", (chapter_id,)).fetchone()
+        if row is None:
+            raise IndexError(f"no chapter with id {chapter_id}")
+        chapter = self._compile(chapter_id, *row)
+        with self._lock:
+            self._cache[chapter_id] = chapter
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return chapter
+
+    def _compile(self, chapter_id, name, data, links):
+        errors = []
+        chapter = StoryGraph.compile_chapter(chapter_id, name, json.loads(data), self._stats, [], errors)
+        if errors:
+            raise StoryValidationError(errors)
+        for choice, next_id in zip(chapter.choices, json.loads(links)):
+            choice.next_id = next_id
+        return chapter
+
+    def chapter_named(self, name):
+        return self.chapter(self.ids[name])
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def convert_json_to_store(json_path, db_path, start=None, strict=False):
+    """
+    Convert a story JSON file into a SQLiteStoryStore database.
+
+    The story is validated as StoryGraph.compile would (invalid commands
+    raise StoryValidationError; with strict=True so do dangling
+    next_chapter references). Returns the list of problems found.
+    """
+    with open(json_path, 'r') as f:
+        story_data = json.load(f)
+    graph = StoryGraph.compile(story_data, start=start, strict=strict)
+    tmp = db_path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    try:
+        with conn:
+            conn.execute("CREATE TABLE chapters (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, "
+                         "data TEXT NOT NULL, links TEXT NOT NULL)")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.executemany(
+                "INSERT INTO chapters (id, name, data, links) VALUES (?, ?, ?, ?)",
+                ((chapter.id, chapter.name, json.dumps(story_data[chapter.name]),
+                  json.dumps([choice.next_id for choice in chapter.choices]))
+                 for chapter in graph.chapters))
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ('start_id', str(graph.start_id)),
+                ('chapters', str(len(graph))),
+                ('problems', json.dumps(graph.problems)),
+            ])
+    finally:
+        conn.close()
+    os.replace(tmp, db_path)
+    return graph.problems
+
+
+if __name__ == "__main__":
+    import sys
+
+    from utils.utils import STORY_FILE
+
+    source = sys.argv[1] if len(sys.argv) > 1 else STORY_FILE
+    target = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(source)[0] + '.db'
+    problems = convert_json_to_store(source, target, start=sys.argv[3] if len(sys.argv) > 3 else None)
+    print(f"Wrote {target}")
+    for problem in problems:
+        print(f"  {problem}")
@@ -1,22 +1,69 @@
+# Strategy registry: story "combat_type" name -> CombatStrategy class.
+STRATEGIES = {}
+
+
+def register_strategy(name):
+    def decorator(cls):
+        cls.name = name
+        STRATEGIES[name] = cls
+        return cls
+    return decorator
+
+
+def create_strategy(name):
+    """Return the strategy registered under `name`; raises ValueError if there is none."""
+    cls = STRATEGIES.get(name)
+    if cls is None:
+        raise ValueError(f"unknown combat type '{name}' (known: {', '.join(sorted(STRATEGIES))})")
+    return cls()
+
+
 class CombatStrategy:
-    def execute(self, player, enemy):
-        pass
+    # Damage profile used by the combat engine for one round:
+    #   the player deals `attack` to the enemy, then takes
+    #   max(0, enemy attack * guard_factor - guard_flat).
+    attack = 0
+    guard_factor = 1
+    guard_flat = 0
 
-class AggressiveStrategy(CombatStrategy):
-    def execute(self, player, enemy):
-        damage = 15
+    def damage_taken(self, enemy_attack):
+        return max(0, enemy_attack * self.guard_factor - self.guard_flat)
+
+    def execute(self, player, enemy, log=print):
+        # One deterministic round of the profile.
+        damage = self.attack
         enemy['hp'] -= damage
-        print(f"Player attacks aggressively for {damage} damage!")
+        taken = round(self.damage_taken(enemy['attack'])) if enemy['hp'] > 0 else 0
+        player.hp -= taken
+        log(self.describe(damage, taken))
 
+    def describe(self, damage, taken):
+        return f"Player deals {damage} damage and takes {taken}."
+
+@register_strategy('aggressive')
+class AggressiveStrategy(CombatStrategy):
+    # Ends fights fastest, but every counter-attack lands harder.
+    attack = 18
+    guard_factor = 2.5
+
+    def describe(self, damage, taken):
+        return f"Player attacks aggressively for {damage} damage!"
+
+@register_strategy('defensive')
 class DefensiveStrategy(CombatStrategy):
-    def execute(self, player, enemy):
-        reduced_damage = max(0, enemy['attack'] - 5)
-        player.hp -= reduced_damage
-        print(f"Player defends, reducing damage to {reduced_damage}.")
+    # Loses the least HP, but its slow fights can run out of rounds.
+    attack = 3
+    guard_factor = 0.8
+    guard_flat = 5
 
+    def describe(self, damage, taken):
+        return f"Player defends, reducing damage to {taken}."
+
+@register_strategy('balanced')
 class BalancedStrategy(CombatStrategy):
-    def execute(self, player, enemy):
-        damage = 10
-        enemy['hp'] -= damage
-        player.hp -= enemy['attack'] // 2
-        print(f"Player trades blows for {damage} damage.")
\ No newline at end of file
+    # Steady damage for moderate counter-attacks.
+    attack = 8
+    guard_factor = 1.1
+
+    def describe(self, damage, taken):
+        return f"Player trades blows for {damage} damage."
@@ -0,0 +1,104 @@
+"""
+Run from the Lab3 directory:
+
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from utils.autosave import AutosaveService
+
+
+class AutosaveServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "save.json")
+        self.journal = os.path.join(self.dir.name, "save.journal")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_flush_writes_the_latest_state(self):
+        with AutosaveService(self.path, delay=0, fsync=False) as service:
+            service.save({"hp": 100})
+            self.assertTrue(service.flush(timeout=5))
+            with open(self.path) as f:
+                self.assertEqual(json.load(f), {"hp": 100})
+
+    def test_burst_of_saves_is_coalesced(self):
+        service = AutosaveService(self.path, delay=0.2, fsync=False)
+        for hp in range(50):
+            service.save({"hp": hp})
+        service.close()
+        self.assertEqual(service.saves, 50)
+        self.assertLess(service.writes, 50)
+        self.assertEqual(AutosaveService.load(self.path), {"hp": 49})
+
+    def test_close_flushes_pending_state(self):
+        service = AutosaveService(self.path, delay=10, fsync=False)
+        service.save({"hp": 7})
+        service.close()
+        self.assertEqual(AutosaveService.load(self.path), {"hp": 7})
+        with self.assertRaises(RuntimeError):
+            service.save({"hp": 8})
+
+    def test_journal_replays_changes_over_the_snapshot(self):
+        service = AutosaveService(self.path, delay=0, journal_path=self.journal, compact_every=100, fsync=False)
+        states = [{"hp": 100, "money": 20, "quest": "start"},
+                  {"hp": 90, "money": 20, "quest": "start"},
+                  {"hp": 90, "money": 35}]
+        for state in states:
+            service.save(state)
+            service.flush()
+        service.close()
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), states[0])
+        with open(self.journal) as f:
+            self.assertEqual(len(f.readlines()), 3)
+        self.assertEqual(AutosaveService.load(self.path, self.journal), states[-1])
+
+    def test_compaction_folds_the_journal_into_the_snapshot(self):
+        service = AutosaveService(self.path, delay=0, journal_path=self.journal, compact_every=2, fsync=False)
+        for hp in range(6):
+            service.save({"hp": hp})
+            service.flush()
+        service.close()
+        self.assertEqual(AutosaveService.load(self.path, self.journal), {"hp": 5})
+
+    def test_stale_journal_is_ignored(self):
+        service = AutosaveService(self.path, delay=0, journal_path=self.journal, fsync=False)
+        service.save({"hp": 1})
+        service.flush()
+        service.save({"hp": 2})
+        service.close()
+        # A newer snapshot written by someone else makes the journal stale.
+        with open(self.path, 'w') as f:
+            json.dump({"hp": 50}, f)
+        self.assertEqual(AutosaveService.load(self.path, self.journal), {"hp": 50})
+
+    def test_torn_last_journal_line_is_skipped(self):
+        service = AutosaveService(self.path, delay=0, journal_path=self.journal, fsync=False)
+        for hp in (1, 2):
+            service.save({"hp": hp})
+            service.flush()
+        service.close()
+        with open(self.journal, 'a') as f:
+            f.write('{"set":{"hp"')
+        self.assertEqual(AutosaveService.load(self.path, self.journal), {"hp": 2})
+
+    def test_load_without_a_save(self):
+        self.assertIsNone(AutosaveService.load(self.path, self.journal))
+
+    def test_write_error_is_raised_once(self):
+        missing = os.path.join(self.dir.name, "missing", "save.json")
+        service = AutosaveService(missing, delay=0, fsync=False)
+        service.save({"hp": 1})
+        with self.assertRaises(OSError):
+            service.flush()
+        service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
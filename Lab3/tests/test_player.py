@@ -0,0 +1,102 @@
+"""
+Run from the Lab3 directory:
+
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from client.player import Inventory, Player
+
+
+class InventoryTest(unittest.TestCase):
+    def test_counts(self):
+        inventory = Inventory(["Bread", "Water", "Bread"])
+        inventory.add("Rope", 3)
+        self.assertEqual(inventory.count("Bread"), 2)
+        self.assertEqual(inventory.count("Torch"), 0)
+        self.assertEqual(len(inventory), 6)
+        inventory.remove("Rope", 3)
+        self.assertFalse(inventory.has("Rope"))
+        self.assertEqual(inventory.counts(), [("Bread", 2), ("Water", 1)])
+
+    def test_remove_more_than_held(self):
+        inventory = Inventory(["Bread"])
+        with self.assertRaises(ValueError):
+            inventory.remove("Bread", 2)
+        with self.assertRaises(ValueError):
+            inventory.remove("Torch")
+        self.assertEqual(len(inventory), 1)
+
+    def test_behaves_like_the_old_list(self):
+        inventory = Inventory()
+        inventory.append("Bread")
+        inventory.extend(["Water", "Bread"])
+        self.assertIn("Water", inventory)
+        self.assertEqual(inventory, ["Bread", "Bread", "Water"])
+        self.assertEqual(inventory, ["Water", "Bread", "Bread"])
+        self.assertNotEqual(inventory, ["Bread"])
+        self.assertEqual(sorted(inventory), ["Bread", "Bread", "Water"])
+
+    def test_copy_and_pickle_are_independent(self):
+        inventory = Inventory(["Bread", "Water"])
+        copied = inventory.copy()
+        pickled = pickle.loads(pickle.dumps(inventory))
+        inventory.remove("Bread")
+        self.assertEqual(copied, ["Bread", "Water"])
+        self.assertEqual(pickled, ["Bread", "Water"])
+
+
+class PlayerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "player.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_slots(self):
+        player = Player()
+        with self.assertRaises(AttributeError):
+            player.strength = 10
+        self.assertFalse(hasattr(player, '__dict__'))
+
+    def test_update_stat_clamps_at_zero(self):
+        player = Player(hp=10)
+        player.update_stat('hp', -25)
+        player.update_stat('money', 5)
+        player.update_stat('unknown', 5)
+        self.assertEqual((player.hp, player.money), (0, 25))
+
+    def test_save_load_round_trip(self):
+        player = Player(hp=80, hunger=40, thirst=30, money=55, inventory=["Bread", "Bread"], stamina=60)
+        player.add_item("Rope")
+        player.save(self.path)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["inventory"], ["Bread", "Bread", "Rope"])
+        loaded = Player.load(self.path)
+        self.assertEqual([getattr(loaded, stat) for stat in Player.STATS], [80, 40, 30, 55, 60])
+        self.assertIsInstance(loaded.inventory, Inventory)
+        self.assertEqual(loaded.inventory.count("Bread"), 2)
+        self.assertTrue(loaded.has_item("Rope"))
+
+    def test_old_save_without_stamina(self):
+        with open(self.path, 'w') as f:
+            json.dump({"hp": 100, "hunger": 50, "thirst": 50, "money": 20, "inventory": ["Water"]}, f)
+        player = Player.load(self.path)
+        self.assertEqual(player.stamina, 100)
+        self.assertEqual(player.inventory, ["Water"])
+
+    def test_copy_is_independent(self):
+        player = Player(inventory=["Bread"])
+        copied = player.copy()
+        player.remove_item("Bread")
+        player.update_stat('hp', -10)
+        self.assertEqual((copied.hp, copied.inventory), (100, ["Bread"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
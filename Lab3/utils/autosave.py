@@ -0,0 +1,191 @@
+import atexit
+import json
+import os
+import threading
+import time
+import zlib
+
+from utils.utils import atomic_write_json
+
+
+class AutosaveService:
+    """
+    Background saver for game state.
+
+    save(state) only records the latest state and wakes a writer thread,
+    which waits `delay` seconds so that a burst of saves is coalesced into
+    one write. Snapshots are written atomically (temp file, fsync, rename),
+    so a crash never leaves a half-written save.
+
+    With a `journal_path`, each write appends only the changed fields as a
+    JSON line instead of rewriting the snapshot; every `compact_every`
+    entries the journal is folded into a fresh snapshot and restarted. The
+    journal's first line names the snapshot it applies to, so a journal left
+    over from before a compaction is ignored rather than replayed over the
+    newer snapshot. load() replays snapshot + journal. Pending state is
+    flushed on close() and at interpreter exit.
+
+    A failed write does not stop the service: the error is kept and raised
+    from the next save(), flush() or close(), and the next write is a full
+    snapshot.
+    """
+    def __init__(self, path, delay=0.05, journal_path=None, compact_every=100, fsync=True):
+        self.path = path
+        self.delay = delay
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.writes = 0
+        self.saves = 0
+        self._pending = None
+        self._written = None        # last state made durable; None forces a full snapshot first
+        self._journal_entries = 0
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, state):
+        """Queue `state` (a JSON-serialisable dict) to be written; returns immediately."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("autosave service is closed")
+            self._raise_error()
+            self._pending = dict(state)
+            self.saves += 1
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Block until everything saved so far is on disk."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._raise_error()
+        return True
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+        with self._condition:
+            self._raise_error()
+
+    def _raise_error(self):
+        # Called with the condition held; each failure is reported once.
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                closing = self._closed
+            if not closing and self.delay:
+                time.sleep(self.delay)  # let a burst of saves coalesce
+            with self._condition:
+                state, self._pending = self._pending, None
+                self._busy = True
+            error = None
+            try:
+                self._write(state)
+            except Exception as exc:
+                error = exc
+                self._written = None  # the journal may be incomplete; start over from a snapshot
+            with self._condition:
+                if error is not None:
+                    self._error = error
+                self._busy = False
+                self._condition.notify_all()
+
+    def _write(self, state):
+        self.writes += 1
+        if self.journal_path is None or self._written is None or self._journal_entries >= self.compact_every:
+            self._compact(state)
+            return
+        changes = {key: value for key, value in state.items() if self._written.get(key) != value}
+        removed = [key for key in self._written if key not in state]
+        if not changes and not removed:
+            return
+        entry = {"set": changes}
+        if removed:
+            entry["unset"] = removed
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + "\n")
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._journal_entries += 1
+        self._written = state
+
+    def _compact(self, state):
+        atomic_write_json(self.path, state, self.fsync)
+        if self.journal_path is not None:
+            # The snapshot already holds everything; start a journal based on it.
+            _write_lines(self.journal_path, [{"base": _fingerprint(state)}], self.fsync)
+            self._journal_entries = 0
+        self._written = state
+
+    @staticmethod
+    def load(path, journal_path=None):
+        """Return the saved state (snapshot plus journal), or None if there is none."""
+        try:
+            with open(path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = None
+        if journal_path is None or not os.path.exists(journal_path):
+            return state
+        with open(journal_path, 'r') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return state
+            if state is None or header.get("base") != _fingerprint(state):
+                return state  # stale journal from before the last compaction
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn last line from a crash mid-append
+                state = dict(state or {})
+                state.update(entry.get("set", {}))
+                for key in entry.get("unset", ()):
+                    state.pop(key, None)
+        return state
+
+
+def _fingerprint(state):
+    return zlib.crc32(json.dumps(state, sort_keys=True).encode('utf-8'))
+
+
+def _write_lines(filepath, entries, fsync=True):
+    directory = os.path.dirname(os.path.abspath(filepath))
+    tmp = os.path.join(directory, '.' + os.path.basename(filepath) + '.tmp')
+    with open(tmp, 'w') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, separators=(',', ':')) + "\n")
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, filepath)
@@ -1,4 +1,13 @@
 import json
+import os
+import tempfile
+
+# Game data lives in Lab3/data; resolved from this file so the defaults work
+# from the repository root (python Lab3/main.py) and from inside Lab3
+# (python -m domain.simulation) alike.
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+PLAYER_FILE = os.path.join(DATA_DIR, 'player.json')
+STORY_FILE = os.path.join(DATA_DIR, 'story_state.json')
 
 def save_game(filepath, data):
     # Path compatibility for Lab3
@@ -15,4 +24,26 @@ def load_game(filepath):
 
 def random_chance(chance):
     from random import randint
-    return randint(1, 100) <= chance
\ No newline at end of file
+    return randint(1, 100) <= chance
+
+def atomic_write_json(filepath, data, fsync=True):
+    # Write to a temp file in the same directory, then rename over the target,
+    # so a crash leaves either the old file or the new one, never a torn file.
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(filepath) + '.')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,117 @@
+"""
+Pluggable event sinks for the labs' ShoppingCartClient.
+
+The client reports what it did as Event objects instead of calling print()
+directly. An event keeps its template and arguments and is only formatted
+when a sink renders it, so a disabled sink never builds a string and the
+buffering sinks format nothing until they are read or flushed. Arguments
+are rendered as they are at that point, so emitters pass values or fresh
+lists rather than containers they keep mutating.
+ConsoleEventSink reproduces the original stdout output.
+
+Lab1 and Lab2 both use this module through their client/events.py.
+"""
+import atexit
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+class Event:
+    """A cart event that is formatted lazily on render()."""
+    __slots__ = ('kind', 'template', 'args')
+
+    def __init__(self, kind, template, *args):
+        self.kind = kind
+        self.template = template  # str.format template or a callable(*args) -> str
+        self.args = args
+
+    def render(self):
+        if callable(self.template):
+            return self.template(*self.args)
+        return self.template.format(*self.args)
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, args={self.args!r})"
+
+
+class EventSink(ABC):
+    """Base sink. `enabled` lets callers skip building events altogether."""
+    enabled = True
+
+    @abstractmethod
+    def emit(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class NullEventSink(EventSink):
+    """Discards every event."""
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+
+class ConsoleEventSink(EventSink):
+    """Prints each event to stdout, like the client always did."""
+
+    def emit(self, event):
+        print(event.render())
+
+
+class RingBufferEventSink(EventSink):
+    """Keeps the last `capacity` events in memory; render() formats them."""
+
+    def __init__(self, capacity=10_000):
+        self.events = deque(maxlen=capacity)
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def render(self):
+        return [event.render() for event in self.events]
+
+
+class BufferedFileEventSink(EventSink):
+    """
+    Appends rendered events to a file in batches.
+
+    Events are held until `batch_size` accumulate (or flush() / close() is
+    called), then rendered and written with a single write call. Pending
+    events are also flushed at interpreter exit.
+    """
+
+    def __init__(self, path, batch_size=1000):
+        self.batch_size = batch_size
+        self._pending = []
+        self._file = open(path, 'a', encoding='utf-8')
+        atexit.register(self.close)
+
+    def emit(self, event):
+        self._pending.append(event)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending and self._file is not None:
+            self._file.write("".join(event.render() + "\n" for event in self._pending))
+            self._file.flush()
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()